@@ -0,0 +1,59 @@
+"""
+Benchmark sederhana untuk project1.
+
+Jalankan dari folder project1 (folder yang berisi manage.py), contoh:
+
+    python -m benchmarks.bench_indexes --rows 20000
+
+Setiap benchmark memakai database sementara (test database Django), jadi
+db.sqlite3 tidak disentuh.
+"""
+
+import os
+import statistics
+import time
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project1.settings')
+    import django
+
+    django.setup()
+
+
+def create_database():
+    """Buat database sementara yang sudah ter-migrate, kembalikan nama lama"""
+    from django.db import connection
+
+    return connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+
+def destroy_database(old_name):
+    from django.db import connection
+
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def measure(func, repeat):
+    """Jalankan func sebanyak repeat kali, kembalikan durasi tiap run (ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        'runs': len(samples),
+        'median_ms': round(statistics.median(samples), 4),
+        'p95_ms': round(percentile(samples, 95), 4),
+        'max_ms': round(max(samples), 4),
+    }
@@ -0,0 +1,83 @@
+"""
+Bandingkan render tampilkan_semua_data dengan fragment cache kosong dan terisi.
+
+    python -m benchmarks.bench_fragments --rows 10000
+
+Setiap tabel di-seed dengan --rows baris. "cold" menghapus fragment tabel
+sebelum setiap request (halaman pertama setiap tabel dirender ulang), "warm"
+memakai fragment dari cache seperti request berulang tanpa perubahan data.
+"""
+
+import argparse
+import io
+
+from benchmarks import create_database, destroy_database, measure, setup_django, summarize
+from benchmarks.bench_views import fetch
+
+
+def fragment_keys():
+    from django.core.cache.utils import make_template_fragment_key
+
+    from project1.versioning import DOSEN, MAHASISWA, MATAKULIAH_SUMMARY, get_versions
+
+    versions = get_versions()
+    return [
+        make_template_fragment_key('semua_data_mahasiswa', [versions[MAHASISWA]]),
+        make_template_fragment_key('semua_data_dosen', [versions[DOSEN]]),
+        make_template_fragment_key(
+            'semua_data_matakuliah', ['-'.join(str(versions[label]) for label in MATAKULIAH_SUMMARY)],
+        ),
+    ]
+
+
+def run(rows, repeat):
+    from django.contrib.auth.models import User
+    from django.core.cache import cache
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+    from django.urls import reverse
+
+    old_name = create_database()
+    try:
+        call_command('seed_data', mahasiswa=rows, dosen=rows, matakuliah=rows, enrolments=1, stdout=io.StringIO())
+        client = Client()
+        client.force_login(User.objects.create_user('benchmark', password='benchmark-password'))
+        url = reverse('tampilkan_semua_data')
+
+        def cold():
+            cache.delete_many(fragment_keys())
+            return fetch(client, url)
+
+        with override_settings(ALLOWED_HOSTS=['testserver'], REQUEST_PROFILING=False):
+            size = cold()
+            results = {'cold': summarize(measure(cold, repeat))}
+            fetch(client, url)
+            results['warm'] = summarize(measure(lambda: fetch(client, url), repeat))
+            with CaptureQueriesContext(connection) as ctx:
+                fetch(client, url)
+            results['warm']['queries'] = len(ctx.captured_queries)
+    finally:
+        destroy_database(old_name)
+
+    print(f'{rows} baris per tabel, halaman {size / 1024:.0f} KiB')
+    for name, result in results.items():
+        extra = f", {result['queries']} queries" if 'queries' in result else ''
+        print(f"  {name:5} median {result['median_ms']:>10.2f} ms  p95 {result['p95_ms']:>10.2f} ms{extra}")
+    print(f"  speedup {results['cold']['median_ms'] / results['warm']['median_ms']:.1f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000, help='jumlah baris per tabel')
+    parser.add_argument('--repeat', type=int, default=5, help='jumlah request per skenario')
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.rows, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
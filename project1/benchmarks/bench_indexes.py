@@ -0,0 +1,165 @@
+"""
+Latency lookup sebelum dan sesudah index npm/email/jurusan, Dosen.homebase
+dan MataKuliah.semester (migration mahasiswa 0008-0009, dosen 0003,
+matakuliah 0003).
+
+    python -m benchmarks.bench_indexes --rows 50000 --repeat 200
+
+Alur: database sementara di-migrate mundur ke skema tanpa index, diisi
+data, lookup diukur, lalu migrate maju (termasuk langkah cleanup duplikat)
+dan lookup yang sama diukur lagi.
+"""
+
+import argparse
+import json
+import random
+
+from benchmarks import create_database, destroy_database, measure, setup_django, summarize
+
+# Skema sebelum index ditambahkan
+BEFORE = [
+    ('mahasiswa', '0007_mahasiswa_fts'),
+    ('dosen', '0002_dosen_fts'),
+    ('matakuliah', '0002_matakuliah_fts'),
+]
+
+JURUSAN = ['Teknologi Informasi', 'Sains Data']
+HOMEBASE = ['Informatika', 'Sistem Informasi', 'Sains Data', 'Matematika']
+
+
+def migrate_to(targets):
+    from django.db import connection
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    if targets is None:
+        targets = executor.loader.graph.leaf_nodes()
+    executor.migrate(targets)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def seed(rows, duplicates):
+    from dosen.models import Dosen
+    from mahasiswa.models import Mahasiswa
+    from matakuliah.models import MataKuliah
+
+    Mahasiswa.objects.bulk_create(
+        [
+            Mahasiswa(
+                nama=f'Mahasiswa {i}', npm=str(2000000 + i), email=f'mhs{i}@example.com',
+                jurusan=JURUSAN[i % len(JURUSAN)],
+            )
+            for i in range(rows)
+        ] + [
+            # Baris kembar yang akan dibersihkan oleh migration 0008
+            Mahasiswa(nama=f'Mahasiswa {i}', npm=str(2000000 + i), email=f'MHS{i}@example.com ')
+            for i in range(duplicates)
+        ],
+        batch_size=1000,
+    )
+    dosen_rows = max(1, rows // 10)
+    Dosen.objects.bulk_create(
+        [
+            Dosen(nama=f'Dosen {i}', nidn=str(1000000 + i), email=f'dosen{i}@example.com',
+                  homebase=HOMEBASE[i % len(HOMEBASE)])
+            for i in range(dosen_rows)
+        ],
+        batch_size=1000,
+    )
+    first_dosen = Dosen.objects.order_by('pk').first()
+    MataKuliah.objects.bulk_create(
+        [
+            MataKuliah(nama_mk=f'Mata Kuliah {i}', kode_mk=f'MK{i:06d}', sks=3,
+                       semester=i % 8 + 1, dosen_mk=first_dosen)
+            for i in range(max(1, rows // 20))
+        ],
+        batch_size=1000,
+    )
+
+
+def lookups(rows, samples):
+    from dosen.models import Dosen
+    from mahasiswa.models import Mahasiswa
+    from matakuliah.models import MataKuliah
+
+    rng = random.Random(42)
+    npms = [str(2000000 + rng.randrange(rows)) for _ in range(samples)]
+    emails = [f'mhs{rng.randrange(rows)}@example.com' for _ in range(samples)]
+
+    def cycle(values):
+        values = iter(values * 1000)
+        return lambda: next(values)
+
+    next_npm, next_email, next_i = cycle(npms), cycle(emails), cycle(list(range(samples)))
+    return {
+        'mahasiswa npm (clean_npm)': lambda: Mahasiswa.objects.filter(npm=next_npm()).exists(),
+        'mahasiswa email (clean_email)': lambda: Mahasiswa.objects.filter(email=next_email()).exists(),
+        'mahasiswa jurusan (filter)': lambda: list(
+            Mahasiswa.objects.filter(jurusan=JURUSAN[next_i() % 2]).order_by('pk')[:25]
+        ),
+        'mahasiswa jurusan (count)': lambda: Mahasiswa.objects.filter(jurusan=JURUSAN[next_i() % 2]).count(),
+        'dosen homebase (filter)': lambda: list(
+            Dosen.objects.filter(homebase=HOMEBASE[next_i() % len(HOMEBASE)]).order_by('pk')[:25]
+        ),
+        'matakuliah semester (filter)': lambda: list(
+            MataKuliah.objects.filter(semester=next_i() % 8 + 1).order_by('pk')[:25]
+        ),
+    }
+
+
+def run(rows, repeat, duplicates):
+    from mahasiswa.models import Mahasiswa
+
+    old_name = create_database()
+    try:
+        migrate_to(BEFORE)
+        seed(rows, duplicates)
+
+        results = {}
+        for name, func in lookups(rows, repeat).items():
+            results[name] = {'before': summarize(measure(func, repeat))}
+
+        migrate_to(None)
+        for name, func in lookups(rows, repeat).items():
+            results[name]['after'] = summarize(measure(func, repeat))
+
+        return {
+            'rows': rows,
+            'repeat': repeat,
+            'duplicates_merged': rows + duplicates - Mahasiswa.objects.count(),
+            'results': results,
+        }
+    finally:
+        destroy_database(old_name)
+
+
+def print_report(report):
+    print(f"{report['rows']} mahasiswa, {report['repeat']} lookup per kasus, "
+          f"{report['duplicates_merged']} baris duplikat dibersihkan\n")
+    print(f"{'lookup':32} {'median sebelum':>15} {'median sesudah':>15} {'speedup':>9}")
+    for name, result in report['results'].items():
+        before = result['before']['median_ms']
+        after = result['after']['median_ms']
+        speedup = before / after if after else float('inf')
+        print(f'{name:32} {before:>12.3f} ms {after:>12.3f} ms {speedup:>8.1f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000, help='jumlah mahasiswa')
+    parser.add_argument('--repeat', type=int, default=200, help='jumlah lookup per kasus')
+    parser.add_argument('--duplicates', type=int, default=10, help='baris duplikat yang disisipkan')
+    parser.add_argument('--json', action='store_true', help='cetak hasil sebagai JSON')
+    args = parser.parse_args()
+
+    setup_django()
+    report = run(args.rows, args.repeat, args.duplicates)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Bandingkan query per request untuk setiap profil sesi/pesan (SESSION_PROFILE).
+
+    python -m benchmarks.bench_sessions --rows 1000 --repeat 50
+
+Skenario per profil (lihat project1/sessions.py):
+- listing: GET input_mahasiswa oleh user yang sudah login
+- delete: POST mahasiswa_delete (menambah pesan flash) lalu GET listing
+  yang menampilkan pesan tersebut, seperti alur di browser
+
+Dicatat rata-rata query per skenario, berapa yang menyentuh tabel
+django_session, dan latency median/p95.
+"""
+
+import argparse
+import io
+
+from benchmarks import create_database, destroy_database, setup_django, summarize
+from benchmarks.bench_views import fetch
+
+PROFILES = ('db', 'cached_db', 'signed_cookies')
+
+
+def run_profile(profile, repeat):
+    from django.contrib.auth.models import User
+    from django.core.cache import caches
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from mahasiswa.models import Mahasiswa
+    from project1.sessions import PROFILES as SESSION_PROFILES
+
+    engine, message_storage = SESSION_PROFILES[profile]
+    profile_index = PROFILES.index(profile)
+    results = {}
+    with override_settings(SESSION_ENGINE=engine, MESSAGE_STORAGE=message_storage,
+                           ALLOWED_HOSTS=['testserver'], REQUEST_PROFILING=False):
+        caches['sessions'].clear()
+        # Client baru: SessionMiddleware membaca SESSION_ENGINE saat dibuat
+        client = Client()
+        client.force_login(User.objects.get(username='benchmark'))
+        listing = reverse('input_mahasiswa')
+        fetch(client, listing)
+
+        def delete_flow(index):
+            # Data yang dihapus dibuat di luar pengukuran
+            mahasiswa = Mahasiswa.objects.create(
+                nama='Hapus Saya', npm=f'99{profile_index}{index:06d}', email=f'hapus-{profile}-{index}@example.com',
+            )
+
+            def flow():
+                client.post(reverse('mahasiswa_delete', args=[mahasiswa.pk]))
+                fetch(client, listing)
+            return _captured(flow)
+
+        scenarios = {
+            'listing': lambda index: _captured(lambda: fetch(client, listing)),
+            'delete': delete_flow,
+        }
+        for name, scenario in scenarios.items():
+            samples, queries, session_queries = [], 0, 0
+            for index in range(repeat):
+                captured, elapsed_ms = scenario(index)
+                samples.append(elapsed_ms)
+                queries += len(captured)
+                session_queries += sum('django_session' in query['sql'] for query in captured)
+            results[name] = {
+                **summarize(samples),
+                'queries': round(queries / repeat, 2),
+                'session_queries': round(session_queries / repeat, 2),
+            }
+    return results
+
+
+def _captured(func):
+    """Jalankan func, kembalikan (query yang dijalankan, durasi ms)"""
+    import time
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        func()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    return ctx.captured_queries, elapsed_ms
+
+
+def run(rows, repeat, profiles):
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+
+    old_name = create_database()
+    try:
+        call_command('seed_data', mahasiswa=rows, enrolments=1, stdout=io.StringIO())
+        User.objects.create_user('benchmark', password='benchmark-password')
+        results = {profile: run_profile(profile, repeat) for profile in profiles}
+    finally:
+        destroy_database(old_name)
+
+    print(f'{rows} mahasiswa, {repeat} request per skenario')
+    for profile, scenarios in results.items():
+        for name, result in scenarios.items():
+            print(f"  {profile:14} {name:8} {result['queries']:>5.1f} query "
+                  f"({result['session_queries']:.1f} django_session)  "
+                  f"median {result['median_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms")
+    if 'db' in results:
+        for profile in results:
+            if profile == 'db':
+                continue
+            saved = {
+                name: round(results['db'][name]['queries'] - result['queries'], 2)
+                for name, result in results[profile].items()
+            }
+            print(f'  {profile}: hemat ' + ', '.join(f'{value} query/{name}' for name, value in saved.items()))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000, help='jumlah mahasiswa yang di-seed')
+    parser.add_argument('--repeat', type=int, default=50, help='jumlah request per skenario')
+    parser.add_argument('--profiles', nargs='*', default=list(PROFILES))
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.rows, args.repeat, args.profiles)
+
+
+if __name__ == '__main__':
+    main()
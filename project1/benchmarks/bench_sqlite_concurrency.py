@@ -0,0 +1,149 @@
+"""
+Throughput SQLite dengan N thread penulis dan M thread pembaca per profil DB.
+
+    python -m benchmarks.bench_sqlite_concurrency --writers 4 --readers 8 --seconds 10
+
+Setiap profil (DB_PROFILE, lihat project1/database.py) dijalankan di proses
+terpisah dengan file database sementara. Penulis meniru mahasiswa_update
+(baca lalu simpan di dalam satu transaksi), pembaca meniru listing
+(keyset page + count). Setelah setiap operasi koneksi diperlakukan seperti
+akhir request (close_old_connections), jadi CONN_MAX_AGE ikut berpengaruh.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PROFILES = ('sqlite-basic', 'sqlite')
+
+
+def write_op(rng, ids):
+    from django.db import transaction
+
+    from mahasiswa.models import Mahasiswa
+
+    with transaction.atomic():
+        mahasiswa = Mahasiswa.objects.get(pk=rng.choice(ids))
+        mahasiswa.alamat = f'Jl. Benchmark No. {rng.randint(1, 9999)}'
+        mahasiswa.save(update_fields=['alamat'])
+
+
+def read_op(rng, ids):
+    from mahasiswa.models import Mahasiswa
+
+    after = rng.choice(ids)
+    list(Mahasiswa.objects.filter(pk__gt=after).order_by('pk')[:25])
+    Mahasiswa.objects.filter(jurusan='Sains Data').count()
+
+
+def worker(op, ids, deadline, seed, counters, lock):
+    from django.db import OperationalError, close_old_connections, connection
+
+    rng = random.Random(seed)
+    done = errors = 0
+    latencies = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            op(rng, ids)
+            done += 1
+            latencies.append(time.perf_counter() - start)
+        except OperationalError:
+            # "database is locked"
+            errors += 1
+        finally:
+            close_old_connections()
+    connection.close()
+    with lock:
+        counters['ops'] += done
+        counters['errors'] += errors
+        counters['latencies'].extend(latencies)
+
+
+def run_profile(writers, readers, seconds, rows):
+    """Dijalankan di proses anak: DB_PROFILE dan SQLITE_PATH sudah di-set"""
+    import io
+
+    from benchmarks import percentile, setup_django
+
+    setup_django()
+    from django.core.management import call_command
+    from django.db import connection
+
+    call_command('migrate', verbosity=0)
+    call_command('seed_data', mahasiswa=rows, enrolments=1, stdout=io.StringIO())
+    from mahasiswa.models import Mahasiswa
+
+    ids = list(Mahasiswa.objects.values_list('pk', flat=True))
+    journal_mode = connection.cursor().execute('PRAGMA journal_mode').fetchone()[0]
+    connection.close()
+
+    lock = threading.Lock()
+    results = {}
+    counters = {
+        'write': {'ops': 0, 'errors': 0, 'latencies': []},
+        'read': {'ops': 0, 'errors': 0, 'latencies': []},
+    }
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(target=worker, args=(write_op, ids, deadline, i, counters['write'], lock))
+        for i in range(writers)
+    ] + [
+        threading.Thread(target=worker, args=(read_op, ids, deadline, 1000 + i, counters['read'], lock))
+        for i in range(readers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for kind, counter in counters.items():
+        latencies = counter['latencies'] or [0]
+        results[kind] = {
+            'ops_per_sec': round(counter['ops'] / seconds, 1),
+            'errors': counter['errors'],
+            'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        }
+    results['journal_mode'] = journal_mode
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=2000, help='jumlah mahasiswa yang di-seed')
+    parser.add_argument('--profiles', nargs='*', default=list(PROFILES))
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_profile(args.writers, args.readers, args.seconds, args.rows)))
+        return
+
+    print(f'{args.writers} penulis, {args.readers} pembaca, {args.seconds:g} detik per profil')
+    for profile in args.profiles:
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, DB_PROFILE=profile, SQLITE_PATH=os.path.join(directory, 'bench.sqlite3'))
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_sqlite_concurrency', '--child',
+                 '--writers', str(args.writers), '--readers', str(args.readers),
+                 '--seconds', str(args.seconds), '--rows', str(args.rows)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        write, read = result['write'], result['read']
+        print(f"  {profile:14} journal={result['journal_mode']:8} "
+              f"tulis {write['ops_per_sec']:>8.1f}/s (p95 {write['p95_ms']:>7.2f} ms, {write['errors']} locked)  "
+              f"baca {read['ops_per_sec']:>8.1f}/s (p95 {read['p95_ms']:>7.2f} ms, {read['errors']} locked)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Ukur setiap view lewat Django test client pada data sintetis (seed_data).
+
+    python -m benchmarks.bench_views --rows 10000 --output results.json
+    python -m benchmarks.bench_views --rows 100000 --views export --compare results.json
+
+Untuk setiap view dicatat jumlah query, latency (median/p95/max) dan puncak
+memori Python (satu run terpisah dengan tracemalloc). Hasil disimpan ke file
+JSON beserta commit git, sehingga bisa dibandingkan antar commit dengan
+--compare.
+"""
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from benchmarks import create_database, destroy_database, measure, setup_django, summarize
+
+# (nama, url name, query string)
+VIEWS = [
+    ('home', 'home', ''),
+    ('tampilkan_semua_data', 'tampilkan_semua_data', ''),
+    ('input_mahasiswa', 'input_mahasiswa', ''),
+    ('input_mahasiswa search', 'input_mahasiswa', 'q=Budi'),
+    ('input_mahasiswa filter', 'input_mahasiswa', 'jurusan=Sains+Data'),
+    ('input_dosen', 'input_dosen', ''),
+    ('input_matakuliah', 'input_matakuliah', ''),
+    ('dashboard_stats', 'dashboard_stats', ''),
+    ('mahasiswa_list_api', 'mahasiswa_list_api', ''),
+    ('mahasiswa_list_api sort', 'mahasiswa_list_api', 'sort=-nama'),
+    ('dosen_list_api', 'dosen_list_api', ''),
+    ('matakuliah_list_api', 'matakuliah_list_api', 'sort=-jumlah_mahasiswa'),
+    ('export_mahasiswa_csv', 'export_mahasiswa_csv', ''),
+    ('export_mahasiswa_excel', 'export_mahasiswa_excel', ''),
+    ('export_dosen_csv', 'export_dosen_csv', ''),
+    ('export_dosen_excel', 'export_dosen_excel', ''),
+    ('export_matakuliah_csv', 'export_matakuliah_csv', ''),
+    ('export_matakuliah_excel', 'export_matakuliah_excel', ''),
+    ('export_all_data_csv', 'export_all_data_csv', ''),
+    ('export_all_data_excel', 'export_all_data_excel', ''),
+]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def fetch(client, url):
+    """GET url dan baca seluruh body (termasuk response streaming)"""
+    response = client.get(url)
+    if response.streaming:
+        size = sum(len(chunk) for chunk in response.streaming_content)
+    else:
+        size = len(response.content)
+    response.close()
+    if response.status_code != 200:
+        raise RuntimeError(f'{url} -> HTTP {response.status_code}')
+    return size
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_view(client, url, repeat):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    # Run pertama sekaligus pemanasan (cache statistik, template, dll)
+    with CaptureQueriesContext(connection) as ctx:
+        size = fetch(client, url)
+    warm_queries = len(ctx.captured_queries)
+
+    with CaptureQueriesContext(connection) as ctx:
+        fetch(client, url)
+    queries = len(ctx.captured_queries)
+
+    result = summarize(measure(lambda: fetch(client, url), repeat))
+    result.update({
+        'url': url,
+        'bytes': size,
+        'queries': queries,
+        'queries_cold': warm_queries,
+        'peak_kib': round(peak_memory(lambda: fetch(client, url)) / 1024, 1),
+    })
+    return result
+
+
+def run(rows, repeat, patterns, seed_options):
+    import django
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    old_name = create_database()
+    try:
+        start = time.perf_counter()
+        call_command('seed_data', mahasiswa=rows, stdout=io.StringIO(), **seed_options)
+        seed_seconds = time.perf_counter() - start
+
+        client = Client()
+        client.force_login(User.objects.create_user('benchmark', password='benchmark-password'))
+
+        results = {}
+        # Middleware profiling dimatikan: pengukuran dilakukan di sini
+        with override_settings(ALLOWED_HOSTS=['testserver'], REQUEST_PROFILING=False):
+            for name, url_name, query in VIEWS:
+                if patterns and not any(pattern in name for pattern in patterns):
+                    continue
+                url = reverse(url_name) + (f'?{query}' if query else '')
+                results[name] = bench_view(client, url, repeat)
+                print(f"  {name:28} {results[name]['median_ms']:>10.2f} ms "
+                      f"{results[name]['queries']:>4} queries {results[name]['peak_kib']:>10.1f} KiB", flush=True)
+    finally:
+        destroy_database(old_name)
+
+    return {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'rows': rows,
+        'repeat': repeat,
+        'seed_seconds': round(seed_seconds, 2),
+        'results': results,
+    }
+
+
+def compare(report, baseline):
+    """Cetak perubahan median dan jumlah query terhadap hasil sebelumnya"""
+    print(f"\nDibandingkan dengan {baseline.get('commit')} ({baseline.get('rows')} baris):")
+    for name, result in report['results'].items():
+        old = baseline.get('results', {}).get(name)
+        if not old:
+            continue
+        change = (result['median_ms'] - old['median_ms']) / old['median_ms'] * 100 if old['median_ms'] else 0
+        query_change = result['queries'] - old['queries']
+        print(f'  {name:28} {change:>+8.1f}% latency {query_change:>+4d} queries')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000, help='jumlah mahasiswa yang di-seed')
+    parser.add_argument('--repeat', type=int, default=10, help='jumlah request per view')
+    parser.add_argument('--views', nargs='*', default=[], help='hanya view yang namanya mengandung teks ini')
+    parser.add_argument('--enrolments', type=int, default=5, help='mata kuliah per mahasiswa')
+    parser.add_argument('--output', help='simpan hasil ke file JSON ini')
+    parser.add_argument('--compare', help='file JSON hasil sebelumnya untuk dibandingkan')
+    args = parser.parse_args()
+
+    setup_django()
+    print(f'Seeding {args.rows} mahasiswa...', flush=True)
+    report = run(args.rows, args.repeat, args.views, {'enrolments': args.enrolments})
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'\nHasil disimpan ke {args.output}')
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
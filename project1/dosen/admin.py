@@ -1,7 +1,14 @@
 from django.contrib import admin
+from project1.admin import SearchAdminMixin
 from .models import Dosen
 
 @admin.register(Dosen)
-class DosenAdmin(admin.ModelAdmin):
+class DosenAdmin(SearchAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'nama', 'nidn', 'email', 'no_hp', 'alamat', 'homebase')
-    search_fields = ('nama', 'nidn', 'email')
+    # Dicari lewat backend FTS (SearchAdminMixin): NIDN persis lewat unique index
+    search_fields = ('nama', 'nidn')
+    code_search_mode = 'exact'
+    email_search_field = 'email'
+    show_full_result_count = False
+    # Urutan stabil untuk paginasi changelist dan autocomplete (primary key)
+    ordering = ('id',)
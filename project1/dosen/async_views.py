@@ -0,0 +1,30 @@
+"""Versi async view baca dosen untuk ASGI (lihat mahasiswa/async_views.py)"""
+
+from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_http_methods
+
+from project1.conditional import conditional_on
+from project1.exports import astream_csv
+from project1.listing import alist_response
+from project1.versioning import DOSEN
+from . import exports as dosen_exports
+from .models import Dosen
+from .views import LISTING, filter_dosen
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
+async def dosen_list_api(request):
+    return await alist_response(request, LISTING)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
+async def export_dosen_csv(request):
+    dosen = filter_dosen(Dosen.objects.all(), request.GET)
+    return astream_csv('dosen', dosen_exports.HEADERS, dosen_exports.aexport_rows(dosen))
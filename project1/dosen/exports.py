@@ -0,0 +1,31 @@
+"""
+Definisi kolom export untuk data Dosen
+"""
+
+from project1.exports import ExcelSheet, anumbered_rows, numbered_rows
+
+HEADERS = ['No', 'Nama', 'NIDN', 'Email', 'No. HP', 'Homebase', 'Alamat']
+FIELDS = ('nama', 'nidn', 'email', 'no_hp', 'homebase', 'alamat')
+
+# Tampilan sheet Excel
+COLUMN_WIDTHS = [5, 25, 15, 25, 15, 20, 25]
+HEADER_COLOR = '28a745'
+
+
+def export_values(queryset, named=False):
+    return queryset.order_by('id').values_list(*FIELDS, named=named)
+
+
+def export_rows(queryset):
+    """Baris export (tuple) tanpa membuat instance Dosen"""
+    return numbered_rows(export_values(queryset))
+
+
+def aexport_rows(queryset):
+    """Versi async export_rows() untuk view async"""
+    return anumbered_rows(export_values(queryset, named=True))
+
+
+def excel_sheet(queryset):
+    """Sheet Excel Dosen dengan baris dari export_rows()"""
+    return ExcelSheet('Dosen', HEADERS, export_rows(queryset), COLUMN_WIDTHS, HEADER_COLOR)
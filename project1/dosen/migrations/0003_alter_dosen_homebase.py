@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dosen', '0002_dosen_fts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dosen',
+            name='homebase',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+    ]
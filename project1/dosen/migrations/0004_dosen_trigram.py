@@ -0,0 +1,16 @@
+# Index GIN trigram untuk pencarian dosen (hanya PostgreSQL, lihat project1/search.py)
+
+from django.db import migrations
+
+from project1.search import postgres_trigram_operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dosen', '0003_alter_dosen_homebase'),
+    ]
+
+    operations = [
+        postgres_trigram_operation('dosen_dosen', ['nidn', 'nama']),
+    ]
@@ -1,12 +1,17 @@
 from django.db import models
 
-class Dosen(models.Model):
+from project1.tracking import LoadedValuesMixin
+
+class Dosen(LoadedValuesMixin, models.Model):
     nama = models.CharField(max_length=100)
     nidn = models.CharField(max_length=20, unique=True)
     email = models.EmailField(unique=True)
     no_hp = models.CharField(max_length=20, blank=True)
     alamat = models.TextField(blank=True)
-    homebase = models.CharField(max_length=100, blank=True)
+    homebase = models.CharField(max_length=100, blank=True, db_index=True)
+
+    # Untuk statistik dashboard (lihat mahasiswa/stats.py)
+    tracked_fields = ('homebase',)
 
     def __str__(self):
         return f"{self.nama} ({self.nidn})"
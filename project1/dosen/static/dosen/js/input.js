@@ -0,0 +1,158 @@
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let c of cookies) {
+            const cookie = c.trim();
+            if (cookie.startsWith(name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+const csrftoken = getCookie('csrftoken');
+
+function updateRowNumbers() {
+    const tbody = document.querySelector('tbody');
+    const rows = tbody.querySelectorAll('tr');
+    rows.forEach((row, index) => {
+        const numberCell = row.querySelector('th');
+        if (numberCell) {
+            numberCell.textContent = index + 1;
+        }
+    });
+}
+
+document.addEventListener('click', function (e) {
+    // EDIT button
+    if (e.target.closest('.edit-btn')) {
+        const btn = e.target.closest('.edit-btn');
+        const row = btn.closest('tr');
+        const id = btn.dataset.id;
+        const namaCell = row.querySelector('.nama');
+        const nidnCell = row.querySelector('.nidn');
+        const emailCell = row.querySelector('.email');
+        const noHpCell = row.querySelector('.no_hp');
+        const homebaseCell = row.querySelector('.homebase');
+        const alamatCell = row.querySelector('.alamat');
+
+        const editing = btn.dataset.editing === 'true';
+        if (!editing) {
+            btn.dataset.editing = 'true';
+            btn.innerHTML = '<i class="bi bi-check-lg me-1"></i>Save';
+            let cancel = row.querySelector('.cancel-btn');
+            if (!cancel) {
+                cancel = document.createElement('button');
+                cancel.type = 'button';
+                cancel.className = 'btn btn-sm btn-secondary ms-1 cancel-btn';
+                cancel.textContent = 'Cancel';
+                row.querySelector('.aksi').appendChild(cancel);
+            }
+
+            namaCell.dataset.old = namaCell.textContent.trim();
+            nidnCell.dataset.old = nidnCell.textContent.trim();
+            emailCell.dataset.old = emailCell.textContent.trim();
+            noHpCell.dataset.old = noHpCell.textContent.trim();
+            homebaseCell.dataset.old = homebaseCell.textContent.trim();
+            alamatCell.dataset.old = alamatCell.textContent.trim();
+
+            namaCell.innerHTML = `<input class="form-control form-control-sm" value="${namaCell.dataset.old}">`;
+            nidnCell.innerHTML = `<input class="form-control form-control-sm" value="${nidnCell.dataset.old}">`;
+            emailCell.innerHTML = `<input class="form-control form-control-sm" value="${emailCell.dataset.old}">`;
+            noHpCell.innerHTML = `<input class="form-control form-control-sm" value="${noHpCell.dataset.old}">`;
+            homebaseCell.innerHTML = `<input class="form-control form-control-sm" value="${homebaseCell.dataset.old}">`;
+            alamatCell.innerHTML = `<textarea class="form-control form-control-sm" rows="2">${alamatCell.dataset.old}</textarea>`;
+            return;
+        }
+
+        // Save flow
+        const newNama = namaCell.querySelector('input').value.trim();
+        const newNidn = nidnCell.querySelector('input').value.trim();
+        const newEmail = emailCell.querySelector('input').value.trim();
+        const newNoHp = noHpCell.querySelector('input').value.trim();
+        const newHomebase = homebaseCell.querySelector('input').value.trim();
+        const newAlamat = alamatCell.querySelector('textarea').value.trim();
+
+        const updateUrl = btn.dataset.updateUrl;
+        fetch(updateUrl, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrftoken,
+            },
+            body: JSON.stringify({ nama: newNama, nidn: newNidn, email: newEmail, no_hp: newNoHp, homebase: newHomebase, alamat: newAlamat })
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    namaCell.textContent = newNama;
+                    nidnCell.textContent = newNidn;
+                    emailCell.textContent = newEmail;
+                    noHpCell.textContent = newNoHp;
+                    homebaseCell.textContent = newHomebase;
+                    alamatCell.textContent = newAlamat;
+                    btn.dataset.editing = 'false';
+                    btn.innerHTML = '<i class="bi bi-pencil-square me-1"></i>Edit';
+                    const cancelBtn = row.querySelector('.cancel-btn');
+                    if (cancelBtn) cancelBtn.remove();
+                } else {
+                    alert(json.error || 'Gagal menyimpan perubahan.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menyimpan.'));
+    }
+
+    // CANCEL button
+    if (e.target.matches('.cancel-btn')) {
+        const row = e.target.closest('tr');
+        const btn = row.querySelector('.edit-btn');
+        const namaCell = row.querySelector('.nama');
+        const nidnCell = row.querySelector('.nidn');
+        const emailCell = row.querySelector('.email');
+        const noHpCell = row.querySelector('.no_hp');
+        const homebaseCell = row.querySelector('.homebase');
+        const alamatCell = row.querySelector('.alamat');
+
+        namaCell.textContent = namaCell.dataset.old || namaCell.textContent;
+        nidnCell.textContent = nidnCell.dataset.old || nidnCell.textContent;
+        emailCell.textContent = emailCell.dataset.old || emailCell.textContent;
+        noHpCell.textContent = noHpCell.dataset.old || noHpCell.textContent;
+        homebaseCell.textContent = homebaseCell.dataset.old || homebaseCell.textContent;
+        alamatCell.textContent = alamatCell.dataset.old || alamatCell.textContent;
+
+        btn.dataset.editing = 'false';
+        btn.textContent = 'Edit';
+        e.target.remove();
+    }
+
+    // DELETE button
+    if (e.target.closest('.delete-btn')) {
+        const btn = e.target.closest('.delete-btn');
+        const id = btn.dataset.id;
+        const row = btn.closest('tr');
+        if (!confirm('Hapus data ini?')) return;
+
+        const deleteUrl = btn.dataset.deleteUrl;
+        fetch(deleteUrl, {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': csrftoken,
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({})
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    row.remove();
+                    updateRowNumbers();
+                    window.location.href = window.location.pathname;
+                } else {
+                    alert(json.error || 'Gagal menghapus data.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menghapus.'));
+    }
+});
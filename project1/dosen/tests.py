@@ -0,0 +1,23 @@
+"""
+Test suite untuk API dosen
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+from .models import Dosen
+from matakuliah.models import MataKuliah
+from project1.testing import LoginMixin
+
+
+class DosenBulkApiTests(LoginMixin, TestCase):
+    """Test endpoint bulk delete dosen"""
+
+    def test_delete_dengan_relasi_protect(self):
+        """Test: Dosen yang masih mengajar tidak dihapus, sisanya dihapus"""
+        dosen_a = Dosen.objects.create(nama='Dosen A', nidn='0011', email='a@example.com')
+        dosen_b = Dosen.objects.create(nama='Dosen B', nidn='0022', email='b@example.com')
+        MataKuliah.objects.create(nama_mk='Basis Data', kode_mk='IF101', sks=3, semester=1, dosen_mk=dosen_a)
+        data = self.post_json(reverse('dosen_bulk_delete'), {'pks': [dosen_a.pk, dosen_b.pk]}).json()
+        self.assertEqual((data['deleted'], data['failed']), (1, 1))
+        self.assertTrue(Dosen.objects.filter(pk=dosen_a.pk).exists())
+        self.assertFalse(Dosen.objects.filter(pk=dosen_b.pk).exists())
@@ -1,9 +1,16 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# View baca versi async saat dijalankan di ASGI (settings.ASYNC_VIEWS)
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     path('input/', views.input_dosen, name='input_dosen'),
     path('update/<int:pk>/', views.dosen_update, name='dosen_update'),
     path('delete/<int:pk>/', views.dosen_delete, name='dosen_delete'),
-    path('export/csv/', views.export_dosen_csv, name='export_dosen_csv'),
+    path('bulk-update/', views.dosen_bulk_update, name='dosen_bulk_update'),
+    path('bulk-delete/', views.dosen_bulk_delete, name='dosen_bulk_delete'),
+    path('api/list/', read_views.dosen_list_api, name='dosen_list_api'),
+    path('export/csv/', read_views.export_dosen_csv, name='export_dosen_csv'),
     path('export/excel/', views.export_dosen_excel, name='export_dosen_excel'),]
\ No newline at end of file
@@ -1,26 +1,35 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.http import require_POST, require_http_methods
-from django.views.decorators.cache import never_cache
+from django.views.decorators.cache import cache_control, never_cache
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from .forms import DosenForm
 from .models import Dosen
+from mahasiswa.stats import change_counts, remove_counts
+from project1.conditional import conditional_on
+from project1.pagination import keyset_paginate
+from project1.versioning import DOSEN
+from project1.search import search
+from project1.bulk import bulk_delete_response, bulk_update_response
+from project1.listing import Listing, list_response
+from project1.exports import HAS_OPENPYXL, stream_csv, xlsx_response
+from . import exports as dosen_exports
 import json
-import csv
-from datetime import datetime
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import PatternFill, Font, Alignment
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+
+def filter_dosen(queryset, params):
+    """Pencarian ?q=; dipakai juga oleh async_views.py dan export_jobs.py"""
+    search_query = params.get('q', '')
+    if search_query:
+        queryset = search(queryset, search_query)
+    return queryset
 
 @login_required(login_url='/admin/login/')
-@never_cache
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
 def input_dosen(request):
     pesan = None
     if request.method == 'POST':
@@ -46,18 +55,16 @@ def input_dosen(request):
     else:
         form = DosenForm()
 
-    dosen = Dosen.objects.all().order_by('id')
-    
     # Search
     search_query = request.GET.get('q', '')
-    
-    if search_query:
-        from django.db.models import Q
-        dosen = dosen.filter(Q(nama__icontains=search_query) | Q(nidn__icontains=search_query))
+    dosen = filter_dosen(Dosen.objects.all().order_by('id'), request.GET)
+
+    page = keyset_paginate(request, dosen)
 
     return render(request, 'dosen/input.html', {
         'form': form,
-        'dosen': dosen,
+        'dosen': page,
+        'page': page,
         'pesan': pesan,
         'search_query': search_query,
     })
@@ -119,91 +126,64 @@ def dosen_update(request, pk):
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
 def export_dosen_csv(request):
     """Export dosen data to CSV"""
-    dosen = Dosen.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    if search_query:
-        from django.db.models import Q
-        dosen = dosen.filter(Q(nama__icontains=search_query) | Q(nidn__icontains=search_query))
-    
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="dosen_{timestamp}.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['No', 'Nama', 'NIDN', 'Email', 'No. HP', 'Homebase', 'Alamat'])
-    
-    for index, d in enumerate(dosen, 1):
-        writer.writerow([
-            index,
-            d.nama,
-            d.nidn,
-            d.email,
-            d.no_hp or '',
-            d.homebase or '',
-            d.alamat or ''
-        ])
-    
-    return response
+    dosen = filter_dosen(Dosen.objects.all().order_by('id'), request.GET)
+
+    return stream_csv('dosen', dosen_exports.HEADERS, dosen_exports.export_rows(dosen))
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
 def export_dosen_excel(request):
     """Export dosen data to Excel"""
     if not HAS_OPENPYXL:
         return HttpResponse("openpyxl library is not installed", status=400)
     
-    dosen = Dosen.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    if search_query:
-        from django.db.models import Q
-        dosen = dosen.filter(Q(nama__icontains=search_query) | Q(nidn__icontains=search_query))
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Dosen"
-    
-    # Header styling
-    header_fill = PatternFill(start_color="28a745", end_color="28a745", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    
-    headers = ['No', 'Nama', 'NIDN', 'Email', 'No. HP', 'Homebase', 'Alamat']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    # Data rows
-    for row_num, d in enumerate(dosen, 2):
-        ws.cell(row=row_num, column=1).value = row_num - 1
-        ws.cell(row=row_num, column=2).value = d.nama
-        ws.cell(row=row_num, column=3).value = d.nidn
-        ws.cell(row=row_num, column=4).value = d.email
-        ws.cell(row=row_num, column=5).value = d.no_hp or ''
-        ws.cell(row=row_num, column=6).value = d.homebase or ''
-        ws.cell(row=row_num, column=7).value = d.alamat or ''
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 5
-    ws.column_dimensions['B'].width = 25
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 25
-    ws.column_dimensions['E'].width = 15
-    ws.column_dimensions['F'].width = 20
-    ws.column_dimensions['G'].width = 25
-    
-    # Create response
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="dosen_{timestamp}.xlsx"'
-    wb.save(response)
-    
-    return response
\ No newline at end of file
+    dosen = filter_dosen(Dosen.objects.all().order_by('id'), request.GET)
+
+    return xlsx_response('dosen', [dosen_exports.excel_sheet(dosen)])
+
+
+# Field yang boleh diubah lewat dosen_bulk_update
+BULK_EDITABLE_FIELDS = ('nama', 'nidn', 'email', 'no_hp', 'alamat', 'homebase')
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def dosen_bulk_update(request):
+    """
+    Update banyak dosen sekaligus.
+    Body: {"items": [{"pk": 1, "fields": {...}}], "atomic": false}
+    """
+    return bulk_update_response(request, Dosen, BULK_EDITABLE_FIELDS, on_updated=change_counts)
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def dosen_bulk_delete(request):
+    """Hapus banyak dosen sekaligus. Body: {"pks": [1, 2, 3]}"""
+    return bulk_delete_response(request, Dosen, on_deleted=remove_counts)
+
+
+LISTING = Listing(
+    Dosen.objects.all,
+    columns=('id', 'nama', 'nidn', 'email', 'no_hp', 'homebase', 'alamat'),
+    sortable=('nama', 'nidn', 'email', 'homebase'),
+    filters=('homebase',),
+)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(DOSEN)
+def dosen_list_api(request):
+    """Daftar dosen per halaman dalam format kolom (lihat project1/listing.py)"""
+    return list_response(request, LISTING)
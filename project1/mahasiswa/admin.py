@@ -1,9 +1,17 @@
 from django.contrib import admin
 
 # Register your models here.
+from project1.admin import SearchAdminMixin
 from .models import Mahasiswa
 
 @admin.register(Mahasiswa)
-class MahasiswaAdmin(admin.ModelAdmin):
+class MahasiswaAdmin(SearchAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'nama', 'npm', 'email', 'jurusan', 'no_hp')
-    search_fields = ('nama', 'npm', 'email', 'jurusan')
+    # Dicari lewat backend FTS (SearchAdminMixin), jurusan lewat filter (index)
+    search_fields = ('nama', 'npm')
+    email_search_field = 'email'
+    list_filter = ('jurusan',)
+    # Tanpa COUNT(*) kedua atas seluruh tabel saat pencarian/filter aktif
+    show_full_result_count = False
+    # Urutan stabil untuk paginasi changelist dan autocomplete (primary key)
+    ordering = ('id',)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class MahasiswaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'mahasiswa'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+        from project1.search import ensure_sqlite_fts
+        from .signals import connect_signals
+
+        connect_signals()
+        post_migrate.connect(ensure_sqlite_fts, sender=self)
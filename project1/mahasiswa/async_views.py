@@ -0,0 +1,78 @@
+"""
+Versi async view baca (JSON dan export CSV) untuk deployment ASGI.
+
+Dipakai oleh urls.py saat settings.ASYNC_VIEWS aktif (default di asgi.py).
+Nama view sama dengan views.py, sehingga URL dan reverse() tidak berubah.
+Export CSV dikirim dengan async iterator (QuerySet.aiterator(), lihat
+project1/exports.py), jadi download yang lambat tidak menahan thread worker.
+
+Query dalam satu request tetap berjalan berurutan: async ORM menjalankannya
+satu per satu di thread sinkron bersama (lihat README, "View async").
+"""
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_http_methods
+
+from dosen import exports as dosen_exports
+from dosen.models import Dosen
+from matakuliah import exports as matakuliah_exports
+from matakuliah.models import MataKuliah
+from project1.conditional import conditional_on
+from project1.exports import astream_csv, astream_csv_sections
+from project1.listing import alist_response
+from project1.versioning import MAHASISWA, VERSIONED_MODELS
+from . import exports as mahasiswa_exports
+from .models import Mahasiswa
+from .stats import aget_stats, stats_payload
+from .views import LISTING, filter_mahasiswa
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+async def dashboard_stats(request):
+    """dashboard_stats async; ETag/Last-Modified dari cache statistik"""
+    data = await aget_stats()
+    etag = quote_etag('stats-%d' % data['version'])
+    last_modified = int(data['last_modified'])
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = JsonResponse(stats_payload(data))
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
+async def mahasiswa_list_api(request):
+    return await alist_response(request, LISTING)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
+async def export_mahasiswa_csv(request):
+    mahasiswa = filter_mahasiswa(Mahasiswa.objects.all(), request.GET)
+    return astream_csv('mahasiswa', mahasiswa_exports.HEADERS, mahasiswa_exports.aexport_rows(mahasiswa))
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*VERSIONED_MODELS)
+async def export_all_data_csv(request):
+    return astream_csv_sections('semua_data', [
+        ('=== DATA MAHASISWA ===', mahasiswa_exports.HEADERS,
+         mahasiswa_exports.aexport_rows(Mahasiswa.objects.all())),
+        ('=== DATA DOSEN ===', dosen_exports.HEADERS,
+         dosen_exports.aexport_rows(Dosen.objects.all())),
+        ('=== DATA MATA KULIAH ===', matakuliah_exports.HEADERS,
+         matakuliah_exports.aexport_rows(MataKuliah.objects.all())),
+    ])
@@ -0,0 +1,292 @@
+"""
+Export CSV/XLSX di background dengan artifact yang disimpan ke disk.
+
+Alur:
+1. request_export() menghitung dedupe_key dari (jenis, format, filter, versi
+   data tabel terkait). Jika sudah ada job aktif dengan kunci yang sama, job
+   itu dipakai lagi; request bersamaan yang identik tidak membuat file baru.
+2. Job baru dikerjakan oleh thread pool lokal (EXPORT_JOB_WORKERS) setelah
+   transaksi commit. EXPORT_JOB_WORKERS = 0 menjalankan job langsung (inline).
+3. File ditulis ke EXPORT_JOB_DIR dan dipakai ulang sampai versi data
+   berubah (project1/versioning.py); artifact lama dengan filter yang sama
+   lalu ditandai expired dan filenya dihapus.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from dosen import exports as dosen_exports
+from dosen.models import Dosen
+from dosen.views import filter_dosen
+from matakuliah import exports as matakuliah_exports
+from matakuliah.models import MataKuliah
+from matakuliah.views import filter_matakuliah
+from project1 import versioning
+from project1.exports import iter_csv, write_xlsx
+from . import exports as mahasiswa_exports
+from .models import ExportJob, Mahasiswa
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+# Job pending/running yang lebih lama dari ini dianggap macet (proses mati)
+DEFAULT_JOB_TIMEOUT = 30 * 60
+
+
+def _mahasiswa(filters):
+    # Import lokal: mahasiswa.views meng-import modul ini
+    from .views import filter_mahasiswa
+    return filter_mahasiswa(Mahasiswa.objects.all(), filters)
+
+
+def _dosen(filters):
+    return filter_dosen(Dosen.objects.all(), filters)
+
+
+def _matakuliah(filters):
+    return filter_matakuliah(MataKuliah.objects.all(), filters)
+
+
+class ExportKind:
+    """
+    Satu jenis export: nama file, filter yang diterima, tabel yang
+    mempengaruhi isinya, dan section (judul, modul exports, fungsi queryset).
+    """
+
+    def __init__(self, prefix, filters, depends_on, sections):
+        self.prefix = prefix
+        self.filters = filters
+        self.depends_on = depends_on
+        self.sections = sections
+
+    def csv_sections(self, filters):
+        return [
+            (title, module.HEADERS, module.export_rows(queryset(filters)))
+            for title, module, queryset in self.sections
+        ]
+
+    def excel_sheets(self, filters):
+        return [module.excel_sheet(queryset(filters)) for title, module, queryset in self.sections]
+
+
+EXPORT_KINDS = {
+    'mahasiswa': ExportKind(
+        'mahasiswa', ('q', 'jurusan'), (versioning.MAHASISWA,),
+        [(None, mahasiswa_exports, _mahasiswa)],
+    ),
+    'dosen': ExportKind(
+        'dosen', ('q',), (versioning.DOSEN,),
+        [(None, dosen_exports, _dosen)],
+    ),
+    'matakuliah': ExportKind(
+        'matakuliah', ('q',), versioning.MATAKULIAH_SUMMARY,
+        [(None, matakuliah_exports, _matakuliah)],
+    ),
+    'all': ExportKind(
+        'semua_data', (), versioning.VERSIONED_MODELS,
+        [
+            ('=== DATA MAHASISWA ===', mahasiswa_exports, _mahasiswa),
+            ('=== DATA DOSEN ===', dosen_exports, _dosen),
+            ('=== DATA MATA KULIAH ===', matakuliah_exports, _matakuliah),
+        ],
+    ),
+}
+
+EXPORT_FORMATS = dict(ExportJob.FORMAT_CHOICES)
+
+
+def clean_filters(kind, params):
+    """Ambil filter yang dikenal jenis export, buang yang kosong"""
+    filters = {}
+    for name in EXPORT_KINDS[kind].filters:
+        value = (params.get(name) or '').strip()
+        if value:
+            filters[name] = value
+    return filters
+
+
+def make_dedupe_key(kind, fmt, filters, data_version):
+    payload = json.dumps([kind, fmt, filters, data_version], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _timeout():
+    return timedelta(seconds=getattr(settings, 'EXPORT_JOB_TIMEOUT', DEFAULT_JOB_TIMEOUT))
+
+
+def _usable(job):
+    """Job aktif masih bisa dipakai: belum macet dan file-nya masih ada"""
+    if job.status == ExportJob.STATUS_DONE:
+        if os.path.exists(job.file_path):
+            return True
+        job.status = ExportJob.STATUS_EXPIRED
+    elif job.created_at >= timezone.now() - _timeout():
+        return True
+    else:
+        job.status = ExportJob.STATUS_FAILED
+        job.error = 'Job tidak selesai dalam batas waktu'
+    job.save(update_fields=['status', 'error'])
+    return False
+
+
+def request_export(kind, fmt, params=None, user=None):
+    """
+    Kembalikan (job, created). Job yang identik dan masih aktif dipakai
+    ulang; jika belum ada, job baru dibuat dan dijadwalkan.
+    """
+    definition = EXPORT_KINDS[kind]
+    filters = clean_filters(kind, params or {})
+    data_version = versioning.version_token(definition.depends_on)
+    key = make_dedupe_key(kind, fmt, filters, data_version)
+
+    job = ExportJob.objects.filter(dedupe_key=key, status__in=ExportJob.ACTIVE_STATUSES).first()
+    if job is not None and _usable(job):
+        return job, False
+
+    try:
+        with transaction.atomic():
+            job = ExportJob.objects.create(
+                kind=kind, format=fmt, filters=filters, data_version=data_version,
+                dedupe_key=key, requested_by=user if user and user.is_authenticated else None,
+            )
+    except IntegrityError:
+        # Request lain dengan kunci yang sama baru saja membuat job
+        return ExportJob.objects.get(dedupe_key=key, status__in=ExportJob.ACTIVE_STATUSES), False
+
+    submit(job.pk)
+    # Mode inline: job sudah selesai dikerjakan
+    job.refresh_from_db()
+    return job, True
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export-job')
+        return _executor
+
+
+def _run_in_thread(pk):
+    close_old_connections()
+    try:
+        run_job(pk)
+    finally:
+        close_old_connections()
+
+
+def submit(pk):
+    workers = getattr(settings, 'EXPORT_JOB_WORKERS', DEFAULT_WORKERS)
+    if workers <= 0:
+        run_job(pk)
+        return
+    executor = _get_executor(workers)
+    # Worker membaca job dari database, jadi tunggu sampai transaksi commit
+    transaction.on_commit(lambda: executor.submit(_run_in_thread, pk))
+
+
+def artifact_dir():
+    return getattr(settings, 'EXPORT_JOB_DIR', None) or os.path.join(settings.BASE_DIR, 'export_artifacts')
+
+
+def write_artifact(job):
+    """Tulis file export job ke artifact_dir(), kembalikan path-nya"""
+    definition = EXPORT_KINDS[job.kind]
+    directory = artifact_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{definition.prefix}_{job.pk}_{job.dedupe_key[:12]}.{job.format}')
+    partial_path = path + '.part'
+
+    try:
+        if job.format == 'csv':
+            with open(partial_path, 'w', newline='', encoding='utf-8') as f:
+                for chunk in iter_csv(definition.csv_sections(job.filters)):
+                    f.write(chunk)
+        else:
+            with open(partial_path, 'wb') as f:
+                write_xlsx(f, definition.excel_sheets(job.filters))
+        # File baru terlihat utuh atau tidak sama sekali
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    return path
+
+
+def run_job(pk):
+    """Kerjakan satu job pending; job yang sudah diambil worker lain dilewati"""
+    claimed = ExportJob.objects.filter(pk=pk, status=ExportJob.STATUS_PENDING).update(
+        status=ExportJob.STATUS_RUNNING, started_at=timezone.now(),
+    )
+    if not claimed:
+        return
+    job = ExportJob.objects.get(pk=pk)
+
+    fields = {}
+    try:
+        fields['file_path'] = write_artifact(job)
+        fields['status'] = ExportJob.STATUS_DONE
+    except Exception as e:
+        logger.exception('Export job %s gagal', pk)
+        fields.update(status=ExportJob.STATUS_FAILED, error=str(e))
+    fields['finished_at'] = timezone.now()
+
+    # Job yang sudah ditandai macet oleh request lain tidak ditimpa
+    saved = ExportJob.objects.filter(pk=pk, status=ExportJob.STATUS_RUNNING).update(**fields)
+    if not saved:
+        if fields.get('file_path'):
+            os.remove(fields['file_path'])
+        return
+    job.refresh_from_db()
+    if job.status == ExportJob.STATUS_DONE:
+        expire_superseded(job)
+
+
+def expire_superseded(job):
+    """Hapus artifact lama (jenis, format dan filter sama, versi data berbeda)"""
+    older = ExportJob.objects.filter(
+        kind=job.kind, format=job.format, status=ExportJob.STATUS_DONE, pk__lt=job.pk,
+    ).exclude(dedupe_key=job.dedupe_key)
+    for old in older:
+        if old.filters != job.filters:
+            continue
+        if old.file_path and os.path.exists(old.file_path):
+            os.remove(old.file_path)
+        old.status = ExportJob.STATUS_EXPIRED
+        old.save(update_fields=['status'])
+
+
+def job_payload(job):
+    payload = {
+        'id': job.pk,
+        'kind': job.kind,
+        'format': job.format,
+        'status': job.status,
+        'created_at': job.created_at.isoformat(),
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'status_url': reverse('export_job_status', args=[job.pk]),
+    }
+    if job.status == ExportJob.STATUS_DONE:
+        payload['download_url'] = reverse('export_job_download', args=[job.pk])
+    if job.status == ExportJob.STATUS_FAILED:
+        payload['error'] = job.error
+    return payload
@@ -0,0 +1,31 @@
+"""
+Definisi kolom export untuk data Mahasiswa
+"""
+
+from project1.exports import ExcelSheet, anumbered_rows, numbered_rows
+
+HEADERS = ['No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat']
+FIELDS = ('nama', 'npm', 'email', 'no_hp', 'jurusan', 'alamat')
+
+# Tampilan sheet Excel
+COLUMN_WIDTHS = [5, 25, 15, 25, 15, 20, 25]
+HEADER_COLOR = '667eea'
+
+
+def export_values(queryset, named=False):
+    return queryset.order_by('id').values_list(*FIELDS, named=named)
+
+
+def export_rows(queryset):
+    """Baris export (tuple) tanpa membuat instance Mahasiswa"""
+    return numbered_rows(export_values(queryset))
+
+
+def aexport_rows(queryset):
+    """Versi async export_rows() untuk view async"""
+    return anumbered_rows(export_values(queryset, named=True))
+
+
+def excel_sheet(queryset):
+    """Sheet Excel Mahasiswa dengan baris dari export_rows()"""
+    return ExcelSheet('Mahasiswa', HEADERS, export_rows(queryset), COLUMN_WIDTHS, HEADER_COLOR)
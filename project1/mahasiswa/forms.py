@@ -1,7 +1,9 @@
 from django import forms
 from django.core.exceptions import ValidationError
-import re
 from .models import Mahasiswa
+from .validation import (
+    no_hp_error, normalize_alamat, normalize_email, normalize_nama, normalize_no_hp, npm_error, unique_errors,
+)
 
 class MahasiswaForm(forms.ModelForm):
     jurusan = forms.ChoiceField(
@@ -42,6 +44,14 @@ class MahasiswaForm(forms.ModelForm):
             }),
         }
     
+    def __init__(self, *args, check_unique=True, **kwargs):
+        """
+        check_unique=False dipakai oleh import massal: keunikan NPM/email
+        dicek per batch dengan validation.unique_errors(), bukan per baris.
+        """
+        super().__init__(*args, **kwargs)
+        self.check_unique = check_unique
+    
     def clean_nama(self):
         """
         Standardisasi nama: capitalize each word (title case)
@@ -50,68 +60,42 @@ class MahasiswaForm(forms.ModelForm):
         nama = self.cleaned_data.get('nama')
         
         if nama:
-            # Remove extra whitespace
-            nama = ' '.join(nama.split())
+            # Remove extra whitespace + title case (capitalize each word)
+            nama = normalize_nama(nama)
             
             # Validate minimum length
             if len(nama) < 3:
                 raise ValidationError('Nama minimal 3 karakter')
-            
-            # Standardize ke title case (capitalize each word)
-            nama = nama.title()
         
         return nama
     
     def clean_npm(self):
         """
-        Validasi NPM format: harus angka, minimal 5 digit
+        Validasi NPM format: harus angka, 5-20 digit
         Contoh format: 2023001
+        Keunikan dicek di validate_unique() bersama email (satu query)
         """
         npm = self.cleaned_data.get('npm')
         
         if npm:
             # Remove whitespace
             npm = npm.strip()
-            
-            # Validate format: hanya angka
-            if not npm.isdigit():
-                raise ValidationError('NPM harus berupa angka saja (tidak boleh ada huruf atau simbol)')
-            
-            # Validate length
-            if len(npm) < 5:
-                raise ValidationError('NPM minimal 5 digit')
-            
-            if len(npm) > 20:
-                raise ValidationError('NPM maksimal 20 digit')
-            
-            # Check NPM uniqueness (exclude current object if editing)
-            qs = Mahasiswa.objects.filter(npm=npm)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-            
-            if qs.exists():
-                raise ValidationError(f'NPM {npm} sudah terdaftar di sistem')
+            message = npm_error(npm)
+            if message:
+                raise ValidationError(message)
         
         return npm
     
     def clean_email(self):
         """
         Standardisasi email: convert ke lowercase
-        Validasi email uniqueness
+        Keunikan dicek di validate_unique() bersama NPM (satu query)
         """
         email = self.cleaned_data.get('email')
         
         if email:
             # Standardize ke lowercase
-            email = email.lower().strip()
-            
-            # Check email uniqueness (exclude current object if editing)
-            qs = Mahasiswa.objects.filter(email=email)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-            
-            if qs.exists():
-                raise ValidationError(f'Email {email} sudah terdaftar di sistem')
+            email = normalize_email(email)
         
         return email
     
@@ -124,22 +108,10 @@ class MahasiswaForm(forms.ModelForm):
         
         if no_hp:
             # Remove spaces and dashes
-            no_hp = re.sub(r'[\s\-\+\(\)]+', '', no_hp)
-            
-            # Validate: hanya digit
-            if not no_hp.isdigit():
-                raise ValidationError('Nomor HP hanya boleh berisi angka')
-            
-            # Validate Indonesia format: 08xx atau 628xx
-            if not (no_hp.startswith('08') or no_hp.startswith('628')):
-                raise ValidationError('Nomor HP harus format Indonesia (08xx atau 628xx)')
-            
-            # Validate length
-            if len(no_hp) < 10:
-                raise ValidationError('Nomor HP terlalu pendek')
-            
-            if len(no_hp) > 15:
-                raise ValidationError('Nomor HP terlalu panjang')
+            no_hp = normalize_no_hp(no_hp)
+            message = no_hp_error(no_hp)
+            if message:
+                raise ValidationError(message)
         
         return no_hp
     
@@ -151,13 +123,32 @@ class MahasiswaForm(forms.ModelForm):
         
         if alamat:
             # Remove extra whitespace
-            alamat = ' '.join(alamat.split())
+            alamat = normalize_alamat(alamat)
             
             # Optional: capitalize first letter of each word
             # alamat = alamat.title()
         
         return alamat
     
+    def validate_unique(self):
+        """
+        NPM dan email dicek bersama dengan satu query (validation.py) dan
+        dikecualikan dari validate_unique bawaan model yang memakai satu
+        query per field. Unique index di database tetap menjaga bila ada
+        insert bersamaan.
+        """
+        if not self.check_unique:
+            return
+        for field, message in unique_errors([self.instance])[0].items():
+            # Field yang formatnya sudah gagal tidak diberi error kedua
+            if field not in self._errors:
+                self.add_error(field, message)
+        exclude = self._get_validation_exclusions() | {'npm', 'email'}
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
+    
     def clean(self):
         """
         Form-level validation: validasi kombinasi field
@@ -0,0 +1,220 @@
+"""
+Import massal Mahasiswa dari file CSV atau XLSX.
+
+File dibaca baris per baris (tidak dimuat utuh ke memori). Setiap baris
+dinormalisasi dan divalidasi dengan MahasiswaForm/Mahasiswa.clean yang sama
+seperti input manual, tetapi keunikan NPM dan email dicek per batch dengan
+satu query (validation.unique_errors). Baris valid disimpan dengan bulk_create;
+baris yang gagal dicatat di laporan error beserta nomor barisnya.
+
+Nomor baris adalah baris di file asli (CSV: baris fisik awal record,
+XLSX: nomor baris sheet), termasuk baris kosong yang dilewati. File yang
+rusak atau tidak bisa dibaca menghasilkan ImportFileError, juga jika
+kerusakannya baru terbaca di tengah file; tidak ada baris yang disimpan.
+"""
+
+import csv
+import io
+import zipfile
+from collections import Counter
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+
+from project1.versioning import MAHASISWA, bump_version
+from .forms import MahasiswaForm
+from .models import Mahasiswa
+from .stats import add_counts
+from .validation import UNIQUE_FIELDS, unique_errors
+
+DEFAULT_BATCH_SIZE = 500
+
+# Header file (huruf kecil) -> field Mahasiswa. Header file export juga
+# dikenali sehingga hasil export bisa di-import kembali.
+HEADER_ALIASES = {
+    'nama': 'nama',
+    'npm': 'npm',
+    'email': 'email',
+    'no_hp': 'no_hp',
+    'no hp': 'no_hp',
+    'no. hp': 'no_hp',
+    'jurusan': 'jurusan',
+    'alamat': 'alamat',
+}
+
+
+class ImportFileError(ValueError):
+    """File tidak bisa dibaca: format rusak, encoding salah, dll"""
+
+
+class ImportResult:
+    """Ringkasan import: jumlah baris, jumlah tersimpan dan error per baris"""
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        # list of (nomor baris, {field: [pesan]})
+        self.errors = []
+
+    def add_error(self, line, field, message):
+        self.errors.append((line, {field: [message]}))
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'created': self.created,
+            'failed': len(self.errors),
+            'errors': [{'row': line, 'errors': errors} for line, errors in self.errors],
+        }
+
+
+def _header_map(header):
+    """Posisi kolom -> nama field, kolom yang tidak dikenal diabaikan"""
+    mapping = {}
+    for position, title in enumerate(header):
+        field = HEADER_ALIASES.get(str(title or '').strip().lower())
+        if field:
+            mapping[position] = field
+    return mapping
+
+
+def _rows_to_dicts(numbered_rows):
+    """
+    Ubah iterable (nomor baris, list nilai), baris pertama = header, menjadi
+    (nomor baris, dict) per baris data. Baris kosong dilewati tanpa
+    menggeser nomor baris berikutnya.
+    """
+    rows = iter(numbered_rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    mapping = _header_map(first[1])
+    for line, values in rows:
+        if not any(value not in (None, '') for value in values):
+            continue
+        yield line, {
+            field: '' if values[position] is None else str(values[position]).strip()
+            for position, field in mapping.items()
+            if position < len(values)
+        }
+
+
+def _guarded(rows, errors, message):
+    """Error saat membaca file (di tengah iterasi) menjadi ImportFileError"""
+    try:
+        yield from rows
+    except errors as e:
+        raise ImportFileError(f'{message}: {e}') from e
+
+
+def _csv_records(reader):
+    # Record bisa lebih dari satu baris fisik (nilai ber-quote berisi newline)
+    start = 1
+    for values in reader:
+        yield start, values
+        start = reader.line_num + 1
+
+
+def iter_csv_rows(fileobj):
+    text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+    records = _csv_records(csv.reader(text))
+    return _rows_to_dicts(_guarded(records, (csv.Error, UnicodeDecodeError), 'File CSV tidak bisa dibaca'))
+
+
+def iter_xlsx_rows(fileobj):
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    errors = (zipfile.BadZipFile, InvalidFileException, KeyError, OSError, ValueError)
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except errors as e:
+        raise ImportFileError(f'File XLSX tidak valid atau rusak: {e}') from e
+    # Mode read_only mengisi baris kosong, jadi posisi = nomor baris sheet
+    rows = enumerate(workbook.active.iter_rows(values_only=True), 1)
+    return _rows_to_dicts(_guarded(rows, errors + (SyntaxError,), 'File XLSX tidak valid atau rusak'))
+
+
+def iter_rows(fileobj, filename):
+    """Pilih parser berdasarkan ekstensi file (.csv atau .xlsx)"""
+    name = filename.lower()
+    if name.endswith('.xlsx'):
+        return iter_xlsx_rows(fileobj)
+    if name.endswith('.csv'):
+        return iter_csv_rows(fileobj)
+    raise ValueError('Format file harus .csv atau .xlsx')
+
+
+def _validate_chunk(chunk, result, seen_npm, seen_email):
+    """
+    Validasi format setiap baris dengan MahasiswaForm (tanpa query), lalu
+    cek keunikan seluruh chunk dengan satu query ke database.
+    """
+    candidates = []
+    for line, data in chunk:
+        form = MahasiswaForm(data=data, check_unique=False)
+        if not form.is_valid():
+            result.errors.append((line, {field: list(errors) for field, errors in form.errors.items()}))
+            continue
+        instance = form.instance
+
+        if instance.npm in seen_npm:
+            result.add_error(line, 'npm', f'NPM {instance.npm} duplikat dengan baris {seen_npm[instance.npm]}')
+            continue
+        if instance.email in seen_email:
+            result.add_error(line, 'email', f'Email {instance.email} duplikat dengan baris {seen_email[instance.email]}')
+            continue
+        seen_npm[instance.npm] = line
+        seen_email[instance.email] = line
+        candidates.append((line, instance))
+
+    if not candidates:
+        return []
+
+    valid = []
+    conflicts = unique_errors(instance for line, instance in candidates)
+    for (line, instance), errors in zip(candidates, conflicts):
+        if errors:
+            field = next(field for field in UNIQUE_FIELDS if field in errors)
+            result.add_error(line, field, errors[field])
+        else:
+            valid.append((line, instance))
+    return valid
+
+
+def import_mahasiswa(rows, batch_size=DEFAULT_BATCH_SIZE, dry_run=False):
+    """
+    Import iterable (nomor baris, dict) dari iter_rows() dalam satu
+    transaksi: file yang ternyata rusak di tengah (ImportFileError) tidak
+    meninggalkan chunk yang sudah tersimpan. Setiap chunk memakai savepoint
+    sendiri, jadi bentrok saat simpan hanya menggagalkan chunk itu.
+    """
+    result = ImportResult()
+    seen_npm, seen_email = {}, {}
+    rows = iter(rows)
+
+    with transaction.atomic():
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                break
+            result.total += len(chunk)
+            valid = _validate_chunk(chunk, result, seen_npm, seen_email)
+            if valid and not dry_run:
+                try:
+                    with transaction.atomic():
+                        Mahasiswa.objects.bulk_create([instance for line, instance in valid], batch_size=batch_size)
+                        # bulk_create tidak mengirim signal post_save
+                        add_counts('mahasiswa_by_jurusan', Counter(instance.jurusan for line, instance in valid))
+                except IntegrityError:
+                    # NPM/email dipakai request lain di antara cek unik dan simpan
+                    for line, instance in valid:
+                        result.add_error(line, '__all__', 'Gagal menyimpan: data bentrok dengan perubahan lain, ulangi import')
+                    continue
+            result.created += len(valid)
+
+        if result.created and not dry_run:
+            transaction.on_commit(lambda: bump_version(MAHASISWA))
+
+    result.errors.sort(key=lambda item: item[0])
+    return result
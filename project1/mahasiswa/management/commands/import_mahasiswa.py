@@ -0,0 +1,48 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mahasiswa.importer import DEFAULT_BATCH_SIZE, import_mahasiswa, iter_rows
+
+
+class Command(BaseCommand):
+    help = 'Import data mahasiswa dari file CSV atau XLSX dengan validasi per batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File .csv atau .xlsx (baris pertama header)')
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help=f'Jumlah baris per batch validasi dan bulk_create (default {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Validasi saja tanpa menyimpan')
+        parser.add_argument('--report', help='Tulis laporan error per baris ke file CSV ini')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size minimal 1')
+
+        try:
+            with open(options['path'], 'rb') as fileobj:
+                rows = iter_rows(fileobj, options['path'])
+                result = import_mahasiswa(rows, batch_size=options['batch_size'], dry_run=options['dry_run'])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for line, errors in result.errors:
+            for field, messages in errors.items():
+                for message in messages:
+                    self.stderr.write(f'Baris {line} [{field}]: {message}')
+
+        if options['report']:
+            with open(options['report'], 'w', newline='', encoding='utf-8') as report:
+                writer = csv.writer(report)
+                writer.writerow(['Baris', 'Field', 'Pesan'])
+                for line, errors in result.errors:
+                    for field, messages in errors.items():
+                        for message in messages:
+                            writer.writerow([line, field, message])
+
+        action = 'valid (dry run)' if options['dry_run'] else 'berhasil di-import'
+        self.stdout.write(self.style.SUCCESS(
+            f'{result.created} dari {result.total} baris {action}, {len(result.errors)} baris gagal'
+        ))
@@ -0,0 +1,155 @@
+import random
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from dosen.models import Dosen
+from mahasiswa.models import Mahasiswa
+from mahasiswa.stats import rebuild_stats
+from matakuliah.models import MataKuliah
+from project1.versioning import bump_all
+
+NAMA_DEPAN = [
+    'Budi', 'Siti', 'Agus', 'Dewi', 'Rizky', 'Putri', 'Andi', 'Nur', 'Fajar', 'Ayu',
+    'Dimas', 'Intan', 'Eko', 'Rina', 'Bayu', 'Lestari', 'Hendra', 'Maya', 'Yoga', 'Sari',
+]
+NAMA_BELAKANG = [
+    'Santoso', 'Wijaya', 'Saputra', 'Pratama', 'Hidayat', 'Nugroho', 'Kurniawan', 'Lestari',
+    'Setiawan', 'Rahmawati', 'Siregar', 'Nasution', 'Simanjuntak', 'Putra', 'Wibowo', 'Utami',
+]
+KOTA = ['Jakarta', 'Bandung', 'Surabaya', 'Medan', 'Yogyakarta', 'Semarang', 'Makassar', 'Palembang']
+JALAN = ['Merdeka', 'Sudirman', 'Diponegoro', 'Gatot Subroto', 'Ahmad Yani', 'Pahlawan', 'Veteran']
+HOMEBASE = ['Teknologi Informasi', 'Sains Data', 'Sistem Informasi', 'Matematika']
+NAMA_MK = [
+    'Algoritma dan Pemrograman', 'Basis Data', 'Struktur Data', 'Jaringan Komputer',
+    'Sistem Operasi', 'Kecerdasan Buatan', 'Statistika', 'Pembelajaran Mesin',
+    'Rekayasa Perangkat Lunak', 'Pemrograman Web', 'Aljabar Linear', 'Kalkulus',
+    'Visualisasi Data', 'Keamanan Informasi', 'Komputasi Awan', 'Data Mining',
+]
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class Command(BaseCommand):
+    help = 'Isi database dengan data sintetis Mahasiswa, Dosen, MataKuliah dan enrolment (bulk_create)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mahasiswa', type=int, default=1000, help='Jumlah mahasiswa (default 1000)')
+        parser.add_argument('--dosen', type=int, help='Jumlah dosen (default mahasiswa/20, minimal 1)')
+        parser.add_argument('--matakuliah', type=int, help='Jumlah mata kuliah (default mahasiswa/10, minimal 1)')
+        parser.add_argument('--enrolments', type=int, default=5, help='Mata kuliah per mahasiswa (default 5)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Baris per bulk_create (default 5000)')
+        parser.add_argument('--seed', type=int, default=0, help='Seed random agar data bisa diulang')
+        parser.add_argument('--clear', action='store_true', help='Hapus semua data lama terlebih dahulu')
+
+    def handle(self, *args, **options):
+        total_mhs = options['mahasiswa']
+        total_dosen = options['dosen'] if options['dosen'] is not None else max(1, total_mhs // 20)
+        total_mk = options['matakuliah'] if options['matakuliah'] is not None else max(1, total_mhs // 10)
+        if min(total_mhs, options['enrolments']) < 0 or total_dosen < 1 or total_mk < 1:
+            raise CommandError('Jumlah data tidak boleh negatif dan dosen/matakuliah minimal 1')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size minimal 1')
+
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        if options['clear']:
+            with transaction.atomic():
+                MataKuliah.objects.all().delete()
+                Mahasiswa.objects.all().delete()
+                Dosen.objects.all().delete()
+
+        dosen_ids = self.create(Dosen, self.dosen_rows(total_dosen))
+        mk_ids = self.create(MataKuliah, self.matakuliah_rows(total_mk, dosen_ids))
+        mhs_ids = self.create(Mahasiswa, self.mahasiswa_rows(total_mhs))
+        enrolments = self.create_enrolments(mhs_ids, mk_ids, min(options['enrolments'], len(mk_ids)))
+
+        # bulk_create tidak mengirim signal post_save
+        rebuild_stats()
+        bump_all()
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(mhs_ids)} mahasiswa, {len(dosen_ids)} dosen, {len(mk_ids)} mata kuliah, '
+            f'{enrolments} enrolment dibuat'
+        ))
+
+    def create(self, model, objects):
+        """bulk_create per batch, kembalikan id baris baru"""
+        last = model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        with transaction.atomic():
+            for batch in batched(objects, self.batch_size):
+                model.objects.bulk_create(batch)
+        return list(model.objects.filter(pk__gt=last).order_by('pk').values_list('pk', flat=True))
+
+    def start_number(self, model):
+        return (model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0) + 1
+
+    def nama(self):
+        return f'{self.rng.choice(NAMA_DEPAN)} {self.rng.choice(NAMA_BELAKANG)}'
+
+    def no_hp(self):
+        return '08' + ''.join(self.rng.choices('0123456789', k=10))
+
+    def alamat(self):
+        return f'Jl. {self.rng.choice(JALAN)} No. {self.rng.randint(1, 200)}, {self.rng.choice(KOTA)}'
+
+    def mahasiswa_rows(self, total):
+        start = self.start_number(Mahasiswa)
+        jurusan = [choice[0] for choice in Mahasiswa.JURUSAN_CHOICES]
+        for seq in range(start, start + total):
+            angkatan = self.rng.randint(2019, 2025)
+            yield Mahasiswa(
+                nama=self.nama(),
+                npm=f'{angkatan}{seq:06d}',
+                email=f'mhs{seq}@student.example.ac.id',
+                no_hp=self.no_hp(),
+                jurusan=self.rng.choice(jurusan),
+                alamat=self.alamat(),
+            )
+
+    def dosen_rows(self, total):
+        start = self.start_number(Dosen)
+        for seq in range(start, start + total):
+            yield Dosen(
+                nama=f'Dr. {self.nama()}',
+                nidn=f'{seq:010d}',
+                email=f'dosen{seq}@example.ac.id',
+                no_hp=self.no_hp(),
+                alamat=self.alamat(),
+                homebase=self.rng.choice(HOMEBASE),
+            )
+
+    def matakuliah_rows(self, total, dosen_ids):
+        start = self.start_number(MataKuliah)
+        for seq in range(start, start + total):
+            yield MataKuliah(
+                nama_mk=f'{self.rng.choice(NAMA_MK)} {seq}',
+                kode_mk=f'MK{seq:06d}',
+                sks=self.rng.randint(2, 4),
+                semester=self.rng.randint(1, 8),
+                dosen_mk_id=self.rng.choice(dosen_ids),
+            )
+
+    def create_enrolments(self, mhs_ids, mk_ids, per_mahasiswa):
+        """Baris tabel penghubung M2M langsung dengan bulk_create"""
+        Enrolment = MataKuliah.mhs_mk.through
+
+        def rows():
+            for mhs_id in mhs_ids:
+                for mk_id in self.rng.sample(mk_ids, per_mahasiswa):
+                    yield Enrolment(mahasiswa_id=mhs_id, matakuliah_id=mk_id)
+
+        count = 0
+        with transaction.atomic():
+            for batch in batched(rows(), self.batch_size):
+                Enrolment.objects.bulk_create(batch)
+                count += len(batch)
+        return count
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from project1.startup import SETUP_CODE, STARTUP_CODE, baseline_code, group_by_package, import_times
+
+
+class Command(BaseCommand):
+    help = 'Ukur biaya import saat start (django.setup() + middleware + resolve URL) per app dengan python -X importtime'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help='Jumlah modul termahal yang ditampilkan (default 15)')
+        parser.add_argument('--no-urls', action='store_true', help='Hanya django.setup(), tanpa middleware dan URLconf/views')
+
+    def handle(self, *args, **options):
+        if options['top'] < 0:
+            raise CommandError('--top tidak boleh negatif')
+        code = SETUP_CODE if options['no_urls'] else STARTUP_CODE
+        try:
+            entries = import_times(code)
+            baseline = None if options['no_urls'] else import_times(baseline_code())
+        except RuntimeError as e:
+            raise CommandError(f'Startup gagal: {e}')
+
+        total_us = sum(entry.self_us for entry in entries) or 1
+        self.stdout.write(f'{len(entries)} modul, total {total_us / 1000:.1f} ms')
+        if baseline is not None:
+            self.stdout.write(
+                f'Baseline Django (app dan middleware django.*): {len(baseline)} modul, '
+                f'proyek menambah {len(entries) - len(baseline)} modul'
+            )
+        self.stdout.write('')
+
+        self.stdout.write(f'{"package":<24} {"jenis":<13} {"modul":>6} {"ms":>8} {"%":>6}')
+        for package, kind, self_us, count in group_by_package(entries):
+            self.stdout.write(
+                f'{package:<24} {kind:<13} {count:>6} '
+                f'{self_us / 1000:>8.1f} {self_us * 100 / total_us:>6.1f}'
+            )
+
+        if options['top']:
+            self.stdout.write('\nModul termahal (kumulatif, termasuk import di dalamnya):')
+            slowest = sorted(entries, key=lambda entry: entry.cumulative_us, reverse=True)
+            for entry in slowest[:options['top']]:
+                self.stdout.write(f'{entry.cumulative_us / 1000:>8.1f} ms  {entry.module}')
@@ -0,0 +1,16 @@
+# Tabel FTS5 untuk pencarian mahasiswa (hanya SQLite, lihat project1/search.py)
+
+from django.db import migrations
+
+from project1.search import sqlite_fts_operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mahasiswa', '0006_remove_matakuliah_dosen_mk_remove_matakuliah_mhs_mk_and_more'),
+    ]
+
+    operations = [
+        sqlite_fts_operation('mahasiswa_mahasiswa', ['npm', 'nama']),
+    ]
@@ -0,0 +1,84 @@
+# Bersihkan data sebelum unique index npm/email dipasang (lihat 0009).
+#
+# - npm di-strip dan email di-lowercase seperti MahasiswaForm
+# - baris kembar (npm DAN email sama) dianggap satu mahasiswa: enrolment
+#   dipindah ke baris dengan id terkecil, sisanya dihapus
+# - npm atau email yang dipakai mahasiswa berbeda tidak bisa diputuskan
+#   otomatis: migration dibatalkan dengan daftar id yang bentrok
+
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def _normalize(Mahasiswa):
+    for pk, npm, email in Mahasiswa.objects.values_list('id', 'npm', 'email').iterator():
+        clean_npm = npm.strip()
+        clean_email = email.lower().strip()
+        if (clean_npm, clean_email) != (npm, email):
+            Mahasiswa.objects.filter(pk=pk).update(npm=clean_npm, email=clean_email)
+
+
+def _merge_identical(Mahasiswa, Enrolment):
+    groups = defaultdict(list)
+    duplicated = (
+        Mahasiswa.objects.values('npm', 'email')
+        .annotate(n=Count('id')).filter(n__gt=1).values_list('npm', 'email')
+    )
+    for pk, npm, email in Mahasiswa.objects.filter(
+        npm__in=[npm for npm, email in duplicated]
+    ).values_list('id', 'npm', 'email').order_by('id'):
+        groups[(npm, email)].append(pk)
+
+    for ids in groups.values():
+        if len(ids) < 2:
+            continue
+        keep, extras = ids[0], ids[1:]
+        taken = set(Enrolment.objects.filter(mahasiswa_id=keep).values_list('matakuliah_id', flat=True))
+        for enrolment in Enrolment.objects.filter(mahasiswa_id__in=extras).order_by('id'):
+            if enrolment.matakuliah_id in taken:
+                continue
+            taken.add(enrolment.matakuliah_id)
+            Enrolment.objects.filter(pk=enrolment.pk).update(mahasiswa_id=keep)
+        Mahasiswa.objects.filter(pk__in=extras).delete()
+
+
+def _conflicts(Mahasiswa, field):
+    values = (
+        Mahasiswa.objects.values(field).annotate(n=Count('id'))
+        .filter(n__gt=1).values_list(field, flat=True)
+    )
+    conflicts = defaultdict(list)
+    for pk, value in Mahasiswa.objects.filter(**{f'{field}__in': list(values)}).values_list('id', field):
+        conflicts[value].append(pk)
+    return [f'{field} {value!r}: id {ids}' for value, ids in sorted(conflicts.items())]
+
+
+def dedupe_mahasiswa(apps, schema_editor):
+    Mahasiswa = apps.get_model('mahasiswa', 'Mahasiswa')
+    MataKuliah = apps.get_model('matakuliah', 'MataKuliah')
+    Enrolment = MataKuliah.mhs_mk.through
+
+    _normalize(Mahasiswa)
+    _merge_identical(Mahasiswa, Enrolment)
+
+    problems = _conflicts(Mahasiswa, 'npm') + _conflicts(Mahasiswa, 'email')
+    if problems:
+        raise RuntimeError(
+            'Tidak bisa memasang unique index: masih ada NPM/email yang dipakai '
+            'lebih dari satu mahasiswa. Perbaiki data berikut lalu jalankan '
+            'migrate lagi:\n  ' + '\n  '.join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mahasiswa', '0007_mahasiswa_fts'),
+        ('matakuliah', '0002_matakuliah_fts'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_mahasiswa, migrations.RunPython.noop),
+    ]
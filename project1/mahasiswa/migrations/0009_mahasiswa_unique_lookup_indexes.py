@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mahasiswa', '0008_dedupe_mahasiswa'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mahasiswa',
+            name='email',
+            field=models.EmailField(max_length=254, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='mahasiswa',
+            name='jurusan',
+            field=models.CharField(blank=True, choices=[('Teknologi Informasi', 'Teknologi Informasi'), ('Sains Data', 'Sains Data')], db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='mahasiswa',
+            name='npm',
+            field=models.CharField(max_length=20, unique=True),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Index GIN trigram untuk pencarian mahasiswa (hanya PostgreSQL, lihat project1/search.py)
+
+from django.db import migrations
+
+from project1.search import postgres_trigram_operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mahasiswa', '0010_exportjob'),
+    ]
+
+    operations = [
+        postgres_trigram_operation('mahasiswa_mahasiswa', ['npm', 'nama']),
+    ]
@@ -0,0 +1,46 @@
+# Tabel hitungan statistik dashboard (lihat stats.py), diisi dari data yang
+# sudah ada dengan GROUP BY yang sama seperti stats.rebuild_stats().
+
+from django.db import migrations, models
+from django.db.models import Count
+
+GROUPS = (
+    ('mahasiswa_by_jurusan', 'mahasiswa', 'Mahasiswa', 'jurusan'),
+    ('dosen_by_homebase', 'dosen', 'Dosen', 'homebase'),
+    ('matakuliah_by_semester', 'matakuliah', 'MataKuliah', 'semester'),
+)
+
+
+def fill_stats(apps, schema_editor):
+    DashboardStat = apps.get_model('mahasiswa', 'DashboardStat')
+    rows = []
+    for name, app_label, model_name, field in GROUPS:
+        model = apps.get_model(app_label, model_name)
+        counts = model.objects.values_list(field).annotate(count=Count('id')).order_by()
+        rows += [DashboardStat(name=name, value=str(value), count=count) for value, count in counts]
+    DashboardStat.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mahasiswa', '0011_mahasiswa_trigram'),
+        ('dosen', '0004_dosen_trigram'),
+        ('matakuliah', '0004_matakuliah_trigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('value', models.CharField(blank=True, max_length=100)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('name', 'value'), name='unique_dashboard_stat')],
+            },
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
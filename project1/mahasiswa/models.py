@@ -1,65 +1,105 @@
 # project1/mahasiswa/models.py
+from django.conf import settings
 from django.db import models
 from django.core.exceptions import ValidationError
-import re
 
-class Mahasiswa(models.Model):
+from project1.tracking import LoadedValuesMixin
+from .validation import clean_instance
+
+class Mahasiswa(LoadedValuesMixin, models.Model):
     JURUSAN_CHOICES = [
         ('Teknologi Informasi', 'Teknologi Informasi'),
         ('Sains Data', 'Sains Data'),
     ]
     
     nama = models.CharField(max_length=100)
-    npm = models.CharField(max_length=20)
-    email = models.EmailField()
+    npm = models.CharField(max_length=20, unique=True)
+    email = models.EmailField(unique=True)
     no_hp = models.CharField(max_length=20, blank=True)
-    jurusan = models.CharField(max_length=100, choices=JURUSAN_CHOICES, blank=True)
+    jurusan = models.CharField(max_length=100, choices=JURUSAN_CHOICES, blank=True, db_index=True)
     alamat = models.TextField(blank=True)
 
+    # Untuk statistik dashboard (lihat stats.py)
+    tracked_fields = ('jurusan',)
+
     def __str__(self):
         return f"{self.nama} ({self.npm})"
     
     def clean(self):
         """
         Model-level validation dan standardisasi data
-        Dijalankan sebelum save() untuk memastikan konsistensi data
+        Dijalankan sebelum save() untuk memastikan konsistensi data.
+        Aturannya ada di validation.py, dipakai bersama dengan form,
+        import dan bulk update, jadi admin dan mahasiswa_update memakai
+        aturan no HP yang sama dengan form (hanya angka, 10-15 digit).
         """
-        # Standardisasi nama: title case
-        if self.nama:
-            self.nama = self.nama.title()
-        
-        # Standardisasi email: lowercase
-        if self.email:
-            self.email = self.email.lower().strip()
-        
-        # Standardisasi no_hp: hapus karakter non-digit kecuali awal
-        if self.no_hp:
-            self.no_hp = re.sub(r'[\s\-\+\(\)]+', '', self.no_hp)
-        
-        # Standardisasi alamat: capitalize first letter
-        if self.alamat:
-            self.alamat = ' '.join(self.alamat.split())
-        
-        # Validasi field
-        errors = {}
-        
-        # Validasi NPM
-        if self.npm:
-            if not self.npm.isdigit():
-                errors['npm'] = 'NPM harus berupa angka'
-            elif len(self.npm) < 5:
-                errors['npm'] = 'NPM minimal 5 digit'
-        
-        # Validasi no_hp format Indonesia
-        if self.no_hp:
-            if not (self.no_hp.startswith('08') or self.no_hp.startswith('628')):
-                errors['no_hp'] = 'Format no HP harus 08xx atau 628xx'
-        
-        # Validasi jurusan dari choices yang tersedia
-        if self.jurusan:
-            valid_jurusans = [choice[0] for choice in self.JURUSAN_CHOICES]
-            if self.jurusan not in valid_jurusans:
-                errors['jurusan'] = f'Jurusan "{self.jurusan}" tidak valid'
-        
+        errors = clean_instance(self)
         if errors:
-            raise ValidationError(errors)
\ No newline at end of file
+            raise ValidationError(errors)
+
+class DashboardStat(models.Model):
+    """
+    Satu hitungan statistik dashboard: jumlah baris dengan nilai value
+    pada statistik name (lihat stats.py). Nilai disimpan sebagai teks.
+    """
+    name = models.CharField(max_length=50)
+    value = models.CharField(max_length=100, blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'value'], name='unique_dashboard_stat'),
+        ]
+
+    def __str__(self):
+        return f"{self.name}: {self.value} = {self.count}"
+
+class ExportJob(models.Model):
+    """
+    Export CSV/XLSX yang dikerjakan di background (lihat export_jobs.py).
+    Job dengan dedupe_key sama (jenis, format, filter, versi data) dipakai
+    bersama selama masih pending/running/done.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_EXPIRED = 'expired'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Menunggu'),
+        (STATUS_RUNNING, 'Diproses'),
+        (STATUS_DONE, 'Selesai'),
+        (STATUS_FAILED, 'Gagal'),
+        (STATUS_EXPIRED, 'Kedaluwarsa'),
+    ]
+    ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING, STATUS_DONE)
+
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel'),
+    ]
+
+    kind = models.CharField(max_length=20)
+    format = models.CharField(max_length=4, choices=FORMAT_CHOICES)
+    filters = models.JSONField(default=dict, blank=True)
+    data_version = models.CharField(max_length=200)
+    dedupe_key = models.CharField(max_length=64)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    file_path = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedupe_key'],
+                condition=models.Q(status__in=['pending', 'running', 'done']),
+                name='unique_active_export_job',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Export {self.kind}.{self.format} #{self.pk} ({self.status})"
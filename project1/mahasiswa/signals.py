@@ -0,0 +1,75 @@
+"""
+Signal handler yang menjaga statistik dashboard tetap sinkron secara
+inkremental (tanpa menghitung ulang seluruh tabel), dan menaikkan versi
+data entitas (project1/versioning.py) setiap kali data berubah.
+
+Nilai lama field statistik dibaca dari instance.loaded_values yang dicatat
+saat instance dimuat dari database (project1/tracking.py).
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from matakuliah.models import MataKuliah
+from project1 import versioning
+from project1.bulk import bulk_deleting
+from . import stats
+
+MISSING = object()
+
+
+def update_on_save(sender, instance, created, update_fields=None, **kwargs):
+    name, field = stats.group_for_model(sender)
+    if update_fields is not None and field not in update_fields:
+        return
+
+    new_value = getattr(instance, field)
+    loaded = instance.__dict__.setdefault('loaded_values', {})
+    old_value = loaded.get(field, MISSING)
+    loaded[field] = new_value
+
+    # Hitungan diubah di transaksi yang sama dengan datanya
+    if created:
+        stats.apply_delta(name, new_value=new_value, added=True)
+    elif old_value is MISSING:
+        # Instance tidak dimuat dari database, nilai lama tidak diketahui
+        transaction.on_commit(stats.rebuild_stats)
+    elif old_value != new_value:
+        stats.apply_delta(name, old_value, new_value, removed=True, added=True)
+
+
+def update_on_delete(sender, instance, **kwargs):
+    if bulk_deleting():
+        # bulk_delete() mengurangi hitungan sekali untuk seluruh batch
+        return
+    name, field = stats.group_for_model(sender)
+    old_value = getattr(instance, 'loaded_values', {}).get(field, MISSING)
+    if old_value is MISSING:
+        old_value = getattr(instance, field)
+    stats.apply_delta(name, old_value, removed=True)
+
+
+def bump_on_change(sender, **kwargs):
+    if bulk_deleting():
+        return
+    transaction.on_commit(partial(versioning.bump_version, sender._meta.label_lower))
+
+
+def bump_on_enrolment_change(sender, action, **kwargs):
+    # Enrolment mengubah jumlah mahasiswa per mata kuliah
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(partial(versioning.bump_version, versioning.MATAKULIAH))
+
+
+def connect_signals():
+    for model, field in stats.STAT_GROUPS.values():
+        uid = f'dashboard_stats_{model._meta.label_lower}'
+        post_save.connect(update_on_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(update_on_delete, sender=model, dispatch_uid=uid)
+
+        uid = f'data_version_{model._meta.label_lower}'
+        post_save.connect(bump_on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(bump_on_change, sender=model, dispatch_uid=uid)
+    m2m_changed.connect(bump_on_enrolment_change, sender=MataKuliah.mhs_mk.through, dispatch_uid='data_version_enrolment')
@@ -0,0 +1,190 @@
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let c of cookies) {
+            const cookie = c.trim();
+            if (cookie.startsWith(name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+const csrftoken = getCookie('csrftoken');
+
+function updateRowNumbers() {
+    const tbody = document.querySelector('tbody');
+    const rows = tbody.querySelectorAll('tr');
+    rows.forEach((row, index) => {
+        const numberCell = row.querySelector('th');
+        if (numberCell) {
+            numberCell.textContent = index + 1;
+        }
+    });
+}
+
+document.getElementById('import-form').addEventListener('submit', function (e) {
+    e.preventDefault();
+    const form = e.target;
+    fetch(form.dataset.importUrl, {
+        method: 'POST',
+        headers: { 'X-CSRFToken': csrftoken },
+        body: new FormData(form)
+    })
+        .then(r => r.json())
+        .then(json => {
+            if (json.error) {
+                alert(json.error);
+                return;
+            }
+            let text = `${json.created} dari ${json.total} baris berhasil di-import.`;
+            if (json.failed) {
+                const detail = json.errors.slice(0, 10).map(item =>
+                    `Baris ${item.row}: ` + Object.values(item.errors).flat().join(', ')
+                );
+                text += `\n${json.failed} baris gagal:\n` + detail.join('\n');
+            }
+            alert(text);
+            window.location.href = window.location.pathname;
+        })
+        .catch(() => alert('Terjadi kesalahan saat import.'));
+});
+
+document.addEventListener('click', function (e) {
+    // EDIT button
+    if (e.target.closest('.edit-btn')) {  // Change from matches() to closest()
+        const btn = e.target.closest('.edit-btn');  // Get the button even if icon was clicked
+        const row = btn.closest('tr');
+        const id = btn.dataset.id;
+        const namaCell = row.querySelector('.nama');
+        const npmCell = row.querySelector('.npm');
+        const emailCell = row.querySelector('.email');
+        const noHpCell = row.querySelector('.no_hp');
+        const jurusanCell = row.querySelector('.jurusan');
+        const alamatCell = row.querySelector('.alamat');
+
+        const editing = btn.dataset.editing === 'true';
+        if (!editing) {
+            btn.dataset.editing = 'true';
+            btn.innerHTML = '<i class="bi bi-check-lg me-1"></i>Save';  // Update button content with icon
+            let cancel = row.querySelector('.cancel-btn');
+            if (!cancel) {
+                cancel = document.createElement('button');
+                cancel.type = 'button';
+                cancel.className = 'btn btn-sm btn-secondary ms-1 cancel-btn';
+                cancel.textContent = 'Cancel';
+                row.querySelector('.aksi').appendChild(cancel);
+            }
+
+            namaCell.dataset.old = namaCell.textContent.trim();
+            npmCell.dataset.old = npmCell.textContent.trim();
+            emailCell.dataset.old = emailCell.textContent.trim();
+            if (noHpCell) noHpCell.dataset.old = noHpCell.textContent.trim();
+            jurusanCell.dataset.old = jurusanCell.textContent.trim();
+            alamatCell.dataset.old = alamatCell.textContent.trim();
+
+            namaCell.innerHTML = `<input class="form-control form-control-sm" value="${namaCell.dataset.old}">`;
+            npmCell.innerHTML = `<input class="form-control form-control-sm" value="${npmCell.dataset.old}">`;
+            emailCell.innerHTML = `<input class="form-control form-control-sm" value="${emailCell.dataset.old}">`;
+            if (noHpCell) noHpCell.innerHTML = `<input class="form-control form-control-sm" value="${noHpCell.dataset.old}">`;
+            jurusanCell.innerHTML = `<select class="form-control form-control-sm">
+        <option value="">Pilih Jurusan</option>
+        <option value="Teknologi Informasi" ${jurusanCell.dataset.old === 'Teknologi Informasi' ? 'selected' : ''}>Teknologi Informasi</option>
+        <option value="Sains Data" ${jurusanCell.dataset.old === 'Sains Data' ? 'selected' : ''}>Sains Data</option>
+    </select>`;
+            alamatCell.innerHTML = `<textarea class="form-control form-control-sm" rows="2">${alamatCell.dataset.old}</textarea>`;
+            return;
+        }
+
+        // Save flow
+        const newNama = namaCell.querySelector('input').value.trim();
+        const newNpm = npmCell.querySelector('input').value.trim();
+        const newEmail = emailCell.querySelector('input').value.trim();
+        const newNoHp = noHpCell ? noHpCell.querySelector('input').value.trim() : '';
+        const newJurusan = jurusanCell.querySelector('select') ? jurusanCell.querySelector('select').value.trim() : jurusanCell.querySelector('input').value.trim();
+        const newAlamat = alamatCell.querySelector('textarea').value.trim();
+
+        const updateUrl = btn.dataset.updateUrl;
+        fetch(updateUrl, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrftoken,
+            },
+            body: JSON.stringify({ nama: newNama, npm: newNpm, email: newEmail, no_hp: newNoHp, jurusan: newJurusan, alamat: newAlamat })
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    namaCell.textContent = newNama;
+                    npmCell.textContent = newNpm;
+                    emailCell.textContent = newEmail;
+                    if (noHpCell) noHpCell.textContent = newNoHp;
+                    if (jurusanCell) jurusanCell.textContent = newJurusan;
+                    if (alamatCell) alamatCell.textContent = newAlamat;
+                    btn.dataset.editing = 'false';
+                    btn.innerHTML = '<i class="bi bi-pencil-square me-1"></i>Edit';  // Reset button content
+                    const cancelBtn = row.querySelector('.cancel-btn');
+                    if (cancelBtn) cancelBtn.remove();
+                } else {
+                    alert(json.error || 'Gagal menyimpan perubahan.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menyimpan.'));
+    }
+
+    // CANCEL button
+    if (e.target.matches('.cancel-btn')) {
+        const row = e.target.closest('tr');
+        const btn = row.querySelector('.edit-btn');
+        const namaCell = row.querySelector('.nama');
+        const npmCell = row.querySelector('.npm');
+        const emailCell = row.querySelector('.email');
+        const noHpCell = row.querySelector('.no_hp');
+        const jurusanCell = row.querySelector('.jurusan');
+        const alamatCell = row.querySelector('.alamat');
+
+        namaCell.textContent = namaCell.dataset.old || namaCell.textContent;
+        npmCell.textContent = npmCell.dataset.old || npmCell.textContent;
+        emailCell.textContent = emailCell.dataset.old || emailCell.textContent;
+        if (noHpCell) noHpCell.textContent = noHpCell.dataset.old || noHpCell.textContent;
+        jurusanCell.textContent = jurusanCell.dataset.old || jurusanCell.textContent;
+        alamatCell.textContent = alamatCell.dataset.old || alamatCell.textContent;
+
+        btn.dataset.editing = 'false';
+        btn.textContent = 'Edit';
+        e.target.remove();
+    }
+
+    // DELETE button
+    if (e.target.closest('.delete-btn')) {  // Change from matches() to closest()
+        const btn = e.target.closest('.delete-btn');  // Get the button even if icon was clicked
+        const id = btn.dataset.id;
+        const row = btn.closest('tr');
+        if (!confirm('Hapus data ini?')) return;
+
+        const deleteUrl = btn.dataset.deleteUrl;
+        fetch(deleteUrl, {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': csrftoken,
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({})
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    row.remove();
+                    updateRowNumbers();
+                    // Add this to prevent the duplicate issue on refresh
+                    window.location.href = window.location.pathname;  // Redirect to same page
+                } else {
+                    alert(json.error || 'Gagal menghapus data.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menghapus.'));
+    }
+});
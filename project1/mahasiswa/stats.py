@@ -0,0 +1,185 @@
+"""
+Statistik dashboard (mahasiswa per jurusan, dosen per homebase, mata
+kuliah per semester).
+
+Hitungan disimpan di tabel DashboardStat (satu baris per nilai) dan
+diperbarui secara inkremental oleh signal post_save/post_delete (lihat
+signals.py) dengan UPDATE count = count +/- 1 di transaksi yang sama dengan
+perubahan datanya, jadi tetap benar walau beberapa worker menulis
+bersamaan. Jalur bulk yang melewati signal menambah hitungannya sendiri:
+add_counts() (import), change_counts() (bulk_update) dan remove_counts()
+(bulk_delete). rebuild_stats() menghitung ulang penuh untuk perubahan yang
+nilai lamanya tidak diketahui (seed_data, save() instance yang tidak dimuat
+dari database).
+
+Payload dashboard di-cache dengan kunci berisi versi data
+(project1/versioning.py): selama data tidak berubah dashboard tidak
+menyentuh database, dan isi cache tidak pernah diubah sebagian
+(read-modify-write) oleh worker yang berbeda.
+"""
+
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from dosen.models import Dosen
+from matakuliah.models import MataKuliah
+from project1.versioning import VERSIONED_MODELS, bump_version, get_versions
+from .models import DashboardStat, Mahasiswa
+
+CACHE_KEY = 'dashboard_stats'
+DEFAULT_TIMEOUT = 60 * 60
+
+# Versi tambahan yang dinaikkan rebuild_stats(), karena hitungan ulang
+# selesai setelah versi data entitas dinaikkan oleh jalur bulk
+STATS_VERSION = 'dashboard.stats'
+VERSION_LABELS = (*VERSIONED_MODELS, STATS_VERSION)
+
+# nama statistik -> (model, field yang dikelompokkan)
+STAT_GROUPS = {
+    'mahasiswa_by_jurusan': (Mahasiswa, 'jurusan'),
+    'dosen_by_homebase': (Dosen, 'homebase'),
+    'matakuliah_by_semester': (MataKuliah, 'semester'),
+}
+
+
+def _timeout():
+    return getattr(settings, 'DASHBOARD_STATS_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def group_for_model(model):
+    """Nama statistik dan field untuk model, atau (None, None)"""
+    for name, (group_model, field) in STAT_GROUPS.items():
+        if group_model is model:
+            return name, field
+    return None, None
+
+
+def count_group(name):
+    """{nilai field: jumlah} untuk satu statistik (satu query GROUP BY)"""
+    model, field = STAT_GROUPS[name]
+    return dict(model.objects.values_list(field).annotate(count=Count('id')).order_by())
+
+
+def read_counts():
+    """{nama statistik: {nilai: jumlah}} dari tabel DashboardStat (satu query)"""
+    counts = {name: {} for name in STAT_GROUPS}
+    for name, value, count in DashboardStat.objects.filter(count__gt=0).values_list('name', 'value', 'count'):
+        if name in STAT_GROUPS:
+            model, field = STAT_GROUPS[name]
+            counts[name][model._meta.get_field(field).to_python(value)] = count
+    return counts
+
+
+def rebuild_stats():
+    """
+    Hitung ulang semua statistik dari database (tiga GROUP BY) dan tulis
+    hasilnya ke DashboardStat.
+
+    Baris hitungan dikunci dulu (select_for_update; di SQLite transaksi
+    tulis sudah saling menunggu) lalu ditimpa di tempat, tidak dihapus:
+    add_counts() dari transaksi lain menunggu sampai hitungan ulang commit
+    dan diterapkan di atasnya, jadi tidak hilang tertimpa.
+    """
+    with transaction.atomic():
+        rows = list(DashboardStat.objects.select_for_update())
+        counts = {name: count_group(name) for name in STAT_GROUPS}
+        fresh = {(name, str(value)): count for name, group in counts.items() for value, count in group.items()}
+        for row in rows:
+            row.count = fresh.pop((row.name, row.value), 0)
+        DashboardStat.objects.bulk_update(rows, ['count'])
+        # Nilai baru; baris yang sama bisa saja baru dibuat add_counts() lain
+        DashboardStat.objects.bulk_create(
+            [DashboardStat(name=name, value=value, count=count) for (name, value), count in fresh.items()],
+            update_conflicts=True, unique_fields=['name', 'value'], update_fields=['count'],
+        )
+        transaction.on_commit(lambda: bump_version(STATS_VERSION))
+    return counts
+
+
+def get_stats():
+    """
+    Statistik dari cache; pada cache miss dibaca dari DashboardStat.
+    'version' (untuk ETag) dan 'last_modified' diambil dari versi data.
+    """
+    versions = get_versions(VERSION_LABELS)
+    key = CACHE_KEY + ':' + '-'.join(str(versions[label]) for label in VERSION_LABELS)
+    data = cache.get(key)
+    if data is None:
+        data = read_counts()
+        # Versi berbasis waktu (nanodetik), lihat versioning._new_version()
+        data['version'] = max(versions.values())
+        data['last_modified'] = data['version'] / 1e9
+        cache.set(key, data, _timeout())
+    return data
+
+
+async def aget_stats():
+    return await sync_to_async(get_stats)()
+
+
+def _add(name, value, delta):
+    return DashboardStat.objects.filter(name=name, value=str(value)).update(count=F('count') + delta)
+
+
+def add_counts(name, counts):
+    """
+    Tambahkan {nilai: selisih} ke statistik name, satu UPDATE per nilai.
+    Dipanggil di dalam transaksi perubahan data, jadi ikut di-rollback.
+    """
+    for value, delta in counts.items():
+        if not delta or _add(name, value, delta) or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                DashboardStat.objects.create(name=name, value=str(value), count=delta)
+        except IntegrityError:
+            # Baris yang sama baru dibuat oleh request lain
+            _add(name, value, delta)
+
+
+def apply_delta(name, old_value=None, new_value=None, removed=False, added=False):
+    """Pindahkan satu hitungan dari old_value ke new_value pada statistik name"""
+    counts = Counter()
+    if removed:
+        counts[old_value] -= 1
+    if added:
+        counts[new_value] += 1
+    add_counts(name, counts)
+
+
+def change_counts(model, instances):
+    """
+    Pindahkan hitungan untuk instance yang diubah bulk_update(): nilai lama
+    dari loaded_values, tanpa query jika field statistik tidak berubah.
+    """
+    name, field = group_for_model(model)
+    counts = Counter()
+    for instance in instances:
+        old_value, new_value = instance.loaded_values[field], getattr(instance, field)
+        if old_value != new_value:
+            counts[old_value] -= 1
+            counts[new_value] += 1
+    add_counts(name, counts)
+
+
+def remove_counts(model, instances):
+    """Kurangi hitungan untuk instance yang dihapus bulk_delete(), satu UPDATE per nilai"""
+    name, field = group_for_model(model)
+    removed = Counter(getattr(instance, field) for instance in instances)
+    add_counts(name, {value: -count for value, count in removed.items()})
+
+
+def stats_payload(data):
+    """Format JSON dashboard_stats: list {field: value, count: n} terurut"""
+    payload = {}
+    for name, (model, field) in STAT_GROUPS.items():
+        payload[name] = [
+            {field: value, 'count': count}
+            for value, count in sorted(data[name].items())
+        ]
+    return payload
@@ -3,10 +3,19 @@ Test suite untuk form validation dan data standardization
 Mendemonstrasikan implementasi clean() method
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.core.exceptions import ValidationError
+from django.http import FileResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.core.cache import cache
 from .models import Mahasiswa
 from .forms import MahasiswaForm
+from . import stats
+from dosen.models import Dosen
+from matakuliah.models import MataKuliah
+from project1.testing import LoginMixin, async_get
 
 
 class MahasiswaFormValidationTests(TestCase):
@@ -329,4 +338,645 @@ class DataStandardizationIntegrationTests(TestCase):
         self.assertTrue(len(errors_str) > 0)
 
 
+class StreamingCsvExportTests(LoginMixin, TestCase):
+    """Test export CSV dikirim secara streaming"""
+
+    def setUp(self):
+        super().setUp()
+        self.budi = Mahasiswa.objects.create(
+            nama='Budi Santoso', npm='2023001', email='budi@example.com',
+            jurusan='Teknologi Informasi'
+        )
+        Mahasiswa.objects.create(
+            nama='Siti Nurhaliza', npm='2023002', email='siti@example.com',
+            jurusan='Sains Data'
+        )
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        mk = MataKuliah.objects.create(
+            nama_mk='Basis Data', kode_mk='IF201', sks=3, semester=2, dosen_mk=dosen
+        )
+        mk.mhs_mk.add(self.budi)
+
+    def get_csv(self, url_name, params=None):
+        response = self.client.get(reverse(url_name), params or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return b''.join(response.streaming_content).decode().splitlines()
+
+    def test_export_mahasiswa_csv_streaming(self):
+        """Test: Semua mahasiswa diexport dengan nomor urut"""
+        lines = self.get_csv('export_mahasiswa_csv')
+        self.assertEqual(lines[0], 'No,Nama,NPM,Email,No. HP,Jurusan,Alamat')
+        self.assertEqual(lines[1], '1,Budi Santoso,2023001,budi@example.com,,Teknologi Informasi,')
+        self.assertEqual(len(lines), 3)
+
+    def test_export_mahasiswa_csv_filter(self):
+        """Test: Filter jurusan tetap berlaku pada export"""
+        lines = self.get_csv('export_mahasiswa_csv', {'jurusan': 'Sains Data'})
+        self.assertEqual(len(lines), 2)
+        self.assertIn('Siti Nurhaliza', lines[1])
+
+    def test_export_matakuliah_csv_streaming(self):
+        """Test: Nama dosen dan jumlah mahasiswa ikut diexport"""
+        lines = self.get_csv('export_matakuliah_csv')
+        self.assertEqual(lines[1], '1,Basis Data,IF201,3,2,Dr. Andi,1')
+
+    def test_export_all_data_csv_sections(self):
+        """Test: Export semua data berisi tiga section"""
+        lines = self.get_csv('export_all_data_csv')
+        self.assertEqual(lines[0], '=== DATA MAHASISWA ===')
+        self.assertIn('=== DATA DOSEN ===', lines)
+        self.assertIn('=== DATA MATA KULIAH ===', lines)
+        self.assertEqual(lines[-1], '1,Basis Data,IF201,3,2,Dr. Andi,1')
+
+
+class KeysetPaginationTests(LoginMixin, TestCase):
+    """Test keyset pagination di halaman input mahasiswa"""
+
+    def setUp(self):
+        super().setUp()
+        for i in range(1, 8):
+            Mahasiswa.objects.create(
+                nama=f'Mahasiswa {i}', npm=f'202300{i}', email=f'mhs{i}@example.com',
+                jurusan='Sains Data' if i % 2 else 'Teknologi Informasi'
+            )
+        self.ids = list(Mahasiswa.objects.order_by('id').values_list('id', flat=True))
+
+    def page_ids(self, params):
+        response = self.client.get(reverse('input_mahasiswa'), params)
+        self.assertEqual(response.status_code, 200)
+        return response, [m.id for m in response.context['mahasiswa']]
+
+    def test_halaman_pertama_dan_berikutnya(self):
+        """Test: ?after= melanjutkan dari id terakhir halaman sebelumnya"""
+        response, ids = self.page_ids({'per_page': 3})
+        self.assertEqual(ids, self.ids[:3])
+        self.assertTrue(response.context['page'].has_next)
+        self.assertFalse(response.context['page'].has_previous)
+
+        response, ids = self.page_ids({'per_page': 3, 'after': self.ids[2]})
+        self.assertEqual(ids, self.ids[3:6])
+        self.assertTrue(response.context['page'].has_previous)
+
+    def test_halaman_sebelumnya(self):
+        """Test: ?before= mengambil halaman sebelum id pertama"""
+        response, ids = self.page_ids({'per_page': 3, 'before': self.ids[6]})
+        self.assertEqual(ids, self.ids[3:6])
+        self.assertTrue(response.context['page'].has_next)
+        self.assertTrue(response.context['page'].has_previous)
+
+    def test_tanpa_offset(self):
+        """Test: Query halaman tidak memakai OFFSET"""
+        with CaptureQueriesContext(connection) as ctx:
+            self.page_ids({'per_page': 2, 'after': self.ids[3]})
+        listing = [q['sql'] for q in ctx.captured_queries if 'mahasiswa_mahasiswa' in q['sql']]
+        self.assertTrue(listing)
+        self.assertFalse(any('OFFSET' in sql for sql in listing))
+
+    def test_filter_dipertahankan_di_link_halaman(self):
+        """Test: Link berikutnya membawa q dan jurusan"""
+        response, ids = self.page_ids({'per_page': 2, 'jurusan': 'Sains Data', 'q': 'Mahasiswa'})
+        self.assertEqual(ids, [self.ids[0], self.ids[2]])
+        self.assertContains(
+            response, f'?per_page=2&amp;jurusan=Sains+Data&amp;q=Mahasiswa&amp;after={self.ids[2]}'
+        )
+
+
+class WriteOnlyExcelExportTests(LoginMixin, TestCase):
+    """Test export Excel memakai workbook write_only dan FileResponse"""
+
+    def setUp(self):
+        super().setUp()
+        Mahasiswa.objects.create(
+            nama='Budi Santoso', npm='2023001', email='budi@example.com',
+            jurusan='Teknologi Informasi'
+        )
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        MataKuliah.objects.create(nama_mk='Basis Data', kode_mk='IF201', sks=3, semester=2, dosen_mk=dosen)
+
+    def load_workbook(self, url_name):
+        from io import BytesIO
+        from openpyxl import load_workbook
+
+        response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, FileResponse)
+        self.assertIn('.xlsx', response['Content-Disposition'])
+        return load_workbook(BytesIO(b''.join(response.streaming_content)))
+
+    def test_export_mahasiswa_excel(self):
+        """Test: Header bergaya dan baris data tertulis"""
+        wb = self.load_workbook('export_mahasiswa_excel')
+        ws = wb['Mahasiswa']
+        rows = list(ws.iter_rows(values_only=True))
+        self.assertEqual(rows[0], ('No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat'))
+        self.assertEqual(rows[1][:3], (1, 'Budi Santoso', '2023001'))
+        self.assertTrue(ws['A1'].font.bold)
+        self.assertEqual(ws.column_dimensions['B'].width, 25)
+
+    def test_export_all_data_excel_tiga_sheet(self):
+        """Test: Export semua data berisi sheet Mahasiswa, Dosen, Mata Kuliah"""
+        wb = self.load_workbook('export_all_data_excel')
+        self.assertEqual(wb.sheetnames, ['Mahasiswa', 'Dosen', 'Mata Kuliah'])
+        mk_rows = list(wb['Mata Kuliah'].iter_rows(values_only=True))
+        self.assertEqual(mk_rows[1], (1, 'Basis Data', 'IF201', 3, 2, 'Dr. Andi', 0))
+
+
+class DashboardStatsCacheTests(LoginMixin, TestCase):
+    """Test cache statistik dashboard yang diperbarui oleh signal"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.budi = Mahasiswa.objects.create(
+            nama='Budi Santoso', npm='2023001', email='budi@example.com',
+            jurusan='Teknologi Informasi'
+        )
+
+    def create_mahasiswa(self, npm, jurusan):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Mahasiswa.objects.create(
+                nama='Siti Nurhaliza', npm=npm, email=f'{npm}@example.com', jurusan=jurusan
+            )
+
+    def test_endpoint_format(self):
+        """Test: Format JSON sama dengan hasil GROUP BY sebelumnya"""
+        response = self.client.get(reverse('dashboard_stats'))
+        self.assertEqual(response.json(), {
+            'mahasiswa_by_jurusan': [{'jurusan': 'Teknologi Informasi', 'count': 1}],
+            'dosen_by_homebase': [],
+            'matakuliah_by_semester': [],
+        })
+
+    def test_update_inkremental_tanpa_query(self):
+        """Test: Insert, ubah jurusan dan delete memperbarui hitungan tanpa GROUP BY"""
+        stats.get_stats()
+        siti = self.create_mahasiswa('2023002', 'Sains Data')
+        self.create_mahasiswa('2023003', 'Sains Data')
+
+        siti = Mahasiswa.objects.get(pk=siti.pk)
+        siti.jurusan = 'Teknologi Informasi'
+        with self.captureOnCommitCallbacks(execute=True):
+            siti.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            Mahasiswa.objects.filter(pk=self.budi.pk).delete()
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = stats.get_stats()
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertNotIn('GROUP BY', ctx.captured_queries[0]['sql'])
+        with self.assertNumQueries(0):
+            self.assertEqual(stats.get_stats(), data)
+        self.assertEqual(data['mahasiswa_by_jurusan'], {'Teknologi Informasi': 1, 'Sains Data': 1})
+        self.assertEqual(data, {**stats.rebuild_stats(), 'version': data['version'],
+                                'last_modified': data['last_modified']})
+
+    def test_hitungan_bersama_antar_worker(self):
+        """Test: Hitungan ada di database, cache kosong (worker lain) tidak menghitung ulang"""
+        from django.db.models.signals import post_init
+        self.assertFalse(post_init.has_listeners(Mahasiswa))
+        self.create_mahasiswa('2023002', 'Sains Data')
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            data = stats.get_stats()
+        self.assertNotIn('GROUP BY', ' '.join(q['sql'] for q in ctx.captured_queries))
+        self.assertEqual(data['mahasiswa_by_jurusan'], {'Teknologi Informasi': 1, 'Sains Data': 1})
+        # Nilai lama dicatat saat dimuat dari database (from_db), bukan post_init
+        self.assertEqual(Mahasiswa.objects.get(pk=self.budi.pk).loaded_values, {'jurusan': 'Teknologi Informasi'})
+        self.assertFalse(hasattr(Mahasiswa(nama='Baru'), 'loaded_values'))
+
+    def test_etag_304(self):
+        """Test: Request dengan If-None-Match yang sama mendapat 304"""
+        response = self.client.get(reverse('dashboard_stats'))
+        self.assertTrue(response.has_header('Last-Modified'))
+        etag = response['ETag']
+
+        response = self.client.get(reverse('dashboard_stats'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.create_mahasiswa('2023002', 'Sains Data')
+        response = self.client.get(reverse('dashboard_stats'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class BulkImportTests(LoginMixin, TestCase):
+    """Test import massal mahasiswa dari CSV/XLSX"""
+
+    CSV_DATA = (
+        'No,Nama,NPM,Email,No. HP,Jurusan,Alamat\n'
+        '1,budi santoso,2023001,BUDI@EXAMPLE.COM,08-1234-567-890,Teknologi Informasi,jl.  merdeka\n'
+        '2,Siti Nurhaliza,2023002,siti@example.com,,Sains Data,\n'
+        '3,AB,2023003,ab@example.com,,Sains Data,\n'
+        '4,Rina Kartika,2023002,rina@example.com,,Sains Data,\n'
+        '5,Lama Terdaftar,2020001,lama@example.com,,Sains Data,\n'
+    )
+
+    def setUp(self):
+        super().setUp()
+        Mahasiswa.objects.create(
+            nama='Mahasiswa Lama', npm='2020001', email='lama.asli@example.com', jurusan='Sains Data'
+        )
+
+    def run_import(self, data=None, **kwargs):
+        from io import BytesIO
+        from .importer import import_mahasiswa, iter_rows
+        rows = iter_rows(BytesIO((data or self.CSV_DATA).encode()), 'data.csv')
+        return import_mahasiswa(rows, **kwargs)
+
+    def test_import_csv_normalisasi_dan_error_per_baris(self):
+        """Test: Baris valid disimpan ter-normalisasi, baris gagal dilaporkan"""
+        result = self.run_import()
+        self.assertEqual((result.total, result.created), (5, 2))
+        budi = Mahasiswa.objects.get(npm='2023001')
+        self.assertEqual(budi.nama, 'Budi Santoso')
+        self.assertEqual(budi.email, 'budi@example.com')
+        self.assertEqual(budi.no_hp, '081234567890')
+        self.assertEqual(budi.alamat, 'jl. merdeka')
+
+        errors = dict(result.errors)
+        self.assertEqual(sorted(errors), [4, 5, 6])
+        self.assertIn('nama', errors[4])
+        self.assertIn('duplikat dengan baris 3', errors[5]['npm'][0])
+        self.assertIn('sudah terdaftar', errors[6]['npm'][0])
+
+    def test_satu_query_keunikan_per_batch(self):
+        """Test: Cek keunikan dan insert tidak bergantung jumlah baris per batch"""
+        rows = ''.join(
+            f'Mahasiswa Ke {i},2024{i:03d},m{i}@example.com,,Sains Data,\n' for i in range(40)
+        )
+        data = 'Nama,NPM,Email,No HP,Jurusan,Alamat\n' + rows
+        with CaptureQueriesContext(connection) as ctx:
+            result = self.run_import(data, batch_size=20)
+        self.assertEqual(result.created, 40)
+        # per batch: satu SELECT keunikan + satu INSERT (tanpa SAVEPOINT),
+        # lalu satu UPDATE hitungan statistik per jurusan
+        statements = [q['sql'].split()[0] for q in ctx.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(statements, ['SELECT', 'INSERT', 'UPDATE', 'SELECT', 'INSERT', 'UPDATE'])
+        self.assertEqual(stats.read_counts()['mahasiswa_by_jurusan'], {'Sains Data': 41})
+
+    def test_dry_run_tidak_menyimpan(self):
+        """Test: --dry-run hanya memvalidasi"""
+        result = self.run_import(dry_run=True)
+        self.assertEqual(result.created, 2)
+        self.assertFalse(Mahasiswa.objects.filter(npm='2023001').exists())
+
+    def test_import_xlsx(self):
+        """Test: File XLSX dibaca dengan mode read_only"""
+        from io import BytesIO
+        from openpyxl import Workbook
+        from .importer import import_mahasiswa, iter_rows
+        wb = Workbook()
+        wb.active.append(['Nama', 'NPM', 'Email', 'Jurusan'])
+        wb.active.append(['Dewi Lestari', 2023010, 'dewi@example.com', 'Sains Data'])
+        buffer = BytesIO()
+        wb.save(buffer)
+        buffer.seek(0)
+        result = import_mahasiswa(iter_rows(buffer, 'data.xlsx'))
+        self.assertEqual(result.created, 1, result.errors)
+        self.assertTrue(Mahasiswa.objects.filter(npm='2023010').exists())
+
+    def test_command_dengan_laporan(self):
+        """Test: manage.py import_mahasiswa menulis laporan error"""
+        import os
+        import tempfile
+        from io import StringIO
+        from django.core.management import call_command
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.csv')
+            report = os.path.join(tmp, 'report.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.CSV_DATA)
+            out = StringIO()
+            call_command('import_mahasiswa', path, report=report, stdout=out, stderr=StringIO())
+            self.assertIn('2 dari 5 baris berhasil di-import, 3 baris gagal', out.getvalue())
+            with open(report, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        self.assertEqual(lines[0], 'Baris,Field,Pesan')
+        self.assertEqual(len(lines), 4)
+
+    def test_endpoint_import(self):
+        """Test: Endpoint import menerima upload dan mengembalikan ringkasan JSON"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        upload = SimpleUploadedFile('data.csv', self.CSV_DATA.encode(), content_type='text/csv')
+        response = self.client.post(reverse('import_mahasiswa'), {'file': upload})
+        data = response.json()
+        self.assertEqual((data['created'], data['failed']), (2, 3))
+        self.assertEqual(data['errors'][0]['row'], 4)
+
+
+    def test_nomor_baris_setelah_baris_kosong(self):
+        """Test: Nomor baris error mengikuti baris file, baris kosong tetap dihitung"""
+        data = (
+            'Nama,NPM,Email,Jurusan\n'
+            'Budi Santoso,2023101,budi.x@example.com,Sains Data\n'
+            '\n'
+            ',,,\n'
+            '"Siti\nNurhaliza",2023102,siti.x@example.com,Sains Data\n'
+            'AB,2023103,ab.x@example.com,Sains Data\n'
+        )
+        result = self.run_import(data)
+        self.assertEqual([line for line, errors in result.errors], [7])
+
+    def test_nomor_baris_xlsx_dengan_baris_kosong(self):
+        """Test: Baris kosong di sheet tidak menggeser nomor baris error"""
+        from io import BytesIO
+        from openpyxl import Workbook
+        from .importer import import_mahasiswa, iter_rows
+        wb = Workbook()
+        wb.active.append(['Nama', 'NPM', 'Email', 'Jurusan'])
+        wb.active.append(['Dewi Lestari', 2023011, 'dewi.y@example.com', 'Sains Data'])
+        wb.active.append([])
+        wb.active.append(['AB', 2023012, 'ab.y@example.com', 'Sains Data'])
+        buffer = BytesIO()
+        wb.save(buffer)
+        buffer.seek(0)
+        result = import_mahasiswa(iter_rows(buffer, 'data.xlsx'))
+        self.assertEqual([line for line, errors in result.errors], [4])
+
+    def test_file_rusak_400(self):
+        """Test: XLSX rusak atau CSV bukan UTF-8 -> 400 dengan pesan, bukan 500"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        for name, content in [('data.xlsx', b'bukan file zip'), ('data.csv', b'Nama,NPM\n\xff\xfe,1\n')]:
+            response = self.client.post(reverse('import_mahasiswa'), {'file': SimpleUploadedFile(name, content)})
+            self.assertEqual(response.status_code, 400, name)
+            self.assertFalse(response.json()['success'])
+
+    def test_file_rusak_di_tengah_tidak_menyimpan_apa_pun(self):
+        """Test: Error baca setelah beberapa chunk -> 400 dan chunk sebelumnya tidak tersimpan"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from project1.versioning import MAHASISWA, get_versions
+        rows = ''.join(
+            f'Mahasiswa {"".join(chr(97 + int(d)) for d in f"{i:03d}")},2023{i:04d},m{i}@example.com,Sains Data\n'
+            for i in range(300)
+        )
+        content = ('Nama,NPM,Email,Jurusan\n' + rows).encode() + b'\xff\xfe,1,x,\n'
+        before = get_versions([MAHASISWA])[MAHASISWA]
+        with override_settings(IMPORT_BATCH_SIZE=100), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('import_mahasiswa'), {'file': SimpleUploadedFile('data.csv', content)})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Mahasiswa.objects.count(), 1)
+        self.assertEqual(get_versions([MAHASISWA])[MAHASISWA], before)
+
+    def test_bentrok_saat_simpan_dilaporkan_per_baris(self):
+        """Test: IntegrityError saat bulk_create (race) menjadi error per baris"""
+        from unittest import mock
+        from django.db import IntegrityError
+        with mock.patch.object(Mahasiswa.objects, 'bulk_create', side_effect=IntegrityError('UNIQUE')):
+            result = self.run_import()
+        self.assertEqual(result.created, 0)
+        errors = dict(result.errors)
+        self.assertIn('__all__', errors[2])
+        self.assertIn('__all__', errors[3])
+
+
+class LookupIndexTests(TestCase):
+    """Test unique index npm/email dan index field filter"""
+
+    def indexed_columns(self, table):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+        return {
+            tuple(c['columns']): c['unique']
+            for c in constraints.values()
+            if c['index'] or c['unique']
+        }
+
+    def test_index_terpasang(self):
+        """Test: npm/email unique, jurusan/homebase/semester ber-index"""
+        mahasiswa = self.indexed_columns(Mahasiswa._meta.db_table)
+        self.assertIs(mahasiswa[('npm',)], True)
+        self.assertIs(mahasiswa[('email',)], True)
+        self.assertIn(('jurusan',), mahasiswa)
+        self.assertIn(('homebase',), self.indexed_columns(Dosen._meta.db_table))
+        self.assertIn(('semester',), self.indexed_columns(MataKuliah._meta.db_table))
+
+    def test_npm_duplikat_ditolak_database(self):
+        """Test: Insert NPM yang sama tetap ditolak walau melewati form"""
+        from django.db import IntegrityError
+        Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com')
+        with self.assertRaises(IntegrityError):
+            Mahasiswa.objects.create(nama='Budi Lain', npm='2023001', email='lain@example.com')
+
+    def test_form_cek_keunikan_sekali(self):
+        """Test: Form mengecek NPM dan email dengan satu query"""
+        form = MahasiswaForm(data={
+            'nama': 'Budi Santoso',
+            'npm': '2023001',
+            'email': 'budi@example.com',
+            'jurusan': 'Teknologi Informasi',
+        })
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+
+class SeedDataCommandTests(TestCase):
+    """Test manage.py seed_data"""
+
+    def seed(self, **options):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('seed_data', stdout=out, **options)
+        return out.getvalue()
+
+    def test_seed_data_valid(self):
+        """Test: Data sintetis lolos validasi model dan enrolment terbentuk"""
+        output = self.seed(mahasiswa=50, enrolments=3)
+        self.assertIn('50 mahasiswa, 2 dosen, 5 mata kuliah, 150 enrolment dibuat', output)
+        for mhs in Mahasiswa.objects.all()[:10]:
+            mhs.full_clean()
+        self.assertEqual(MataKuliah.mhs_mk.through.objects.count(), 150)
+
+    def test_seed_data_bisa_diulang(self):
+        """Test: Menjalankan seed_data dua kali tidak bentrok NPM/email"""
+        self.seed(mahasiswa=20)
+        self.seed(mahasiswa=20)
+        self.assertEqual(Mahasiswa.objects.count(), 40)
+        self.seed(mahasiswa=5, clear=True)
+        self.assertEqual(Mahasiswa.objects.count(), 5)
+
+
+class ExportJobTests(LoginMixin, TestCase):
+    """Test export background: dedupe, artifact di disk dan versi data"""
+
+    def setUp(self):
+        super().setUp()
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        settings_override = override_settings(EXPORT_JOB_WORKERS=0, EXPORT_JOB_DIR=self.tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com', jurusan='Sains Data')
+
+    def create_job(self, **data):
+        return self.client.post(reverse('export_job_create'), {'kind': 'mahasiswa', 'format': 'csv', **data})
+
+    def test_job_selesai_dan_bisa_diunduh(self):
+        """Test: Job inline langsung selesai dan file-nya bisa diunduh"""
+        response = self.create_job()
+        self.assertEqual(response.status_code, 200)
+        job = response.json()['job']
+        self.assertEqual(job['status'], 'done')
+        download = self.client.get(job['download_url'])
+        content = b''.join(download.streaming_content).decode()
+        self.assertTrue(content.startswith('No,Nama,NPM'))
+        self.assertIn('2023001', content)
+
+    def test_request_identik_memakai_job_yang_sama(self):
+        """Test: Request dengan jenis, filter dan versi data sama tidak membuat job baru"""
+        first = self.create_job(q='Budi').json()
+        second = self.create_job(q='Budi').json()
+        self.assertEqual(first['job']['id'], second['job']['id'])
+        self.assertFalse(second['created'])
+        other = self.create_job(q='Andi').json()
+        self.assertNotEqual(first['job']['id'], other['job']['id'])
+
+    def test_job_pending_dipakai_bersama(self):
+        """Test: Job yang belum dikerjakan worker dipakai oleh request identik"""
+        from .export_jobs import request_export
+        with override_settings(EXPORT_JOB_WORKERS=2):
+            job, created = request_export('all', 'csv')
+            again, created_again = request_export('all', 'csv')
+        self.assertEqual(job.pk, again.pk)
+        self.assertEqual((created, created_again), (True, False))
+        response = self.client.get(reverse('export_job_download', args=[job.pk]))
+        self.assertEqual(response.status_code, 409)
+
+    def test_artifact_diganti_setelah_data_berubah(self):
+        """Test: Perubahan data menaikkan versi, artifact lama di-expire"""
+        import os
+        from .models import ExportJob
+        first = ExportJob.objects.get(pk=self.create_job().json()['job']['id'])
+        with self.captureOnCommitCallbacks(execute=True):
+            Mahasiswa.objects.create(nama='Andi', npm='2023002', email='andi@example.com')
+        second = self.create_job().json()
+        self.assertTrue(second['created'])
+        first.refresh_from_db()
+        self.assertEqual(first.status, ExportJob.STATUS_EXPIRED)
+        self.assertFalse(os.path.exists(first.file_path))
+
+    def test_export_xlsx(self):
+        """Test: Artifact XLSX berisi tiga sheet untuk export semua data"""
+        from openpyxl import load_workbook
+        job = self.create_job(kind='all', format='xlsx').json()['job']
+        download = self.client.get(job['download_url'])
+        self.assertEqual(download['Content-Type'], 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        from io import BytesIO
+        workbook = load_workbook(BytesIO(b''.join(download.streaming_content)), read_only=True)
+        self.assertEqual(workbook.sheetnames, ['Mahasiswa', 'Dosen', 'Mata Kuliah'])
+
+    def test_jenis_tidak_valid(self):
+        """Test: Jenis export yang tidak dikenal ditolak"""
+        response = self.create_job(kind='nilai')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+
+class FragmentCacheTests(LoginMixin, TestCase):
+    """Test fragment cache per tabel di tampilkan_semua_data"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com')
+
+    def test_render_ulang_tanpa_query_tabel(self):
+        """Test: Render kedua memakai fragment, tabel data tidak di-query"""
+        url = reverse('tampilkan_semua_data')
+        self.assertContains(self.client.get(url), 'Budi')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertContains(response, 'Budi')
+        tables = ('mahasiswa_mahasiswa', 'dosen_dosen', 'matakuliah_matakuliah')
+        self.assertFalse([q for q in ctx.captured_queries if any(t in q['sql'] for t in tables)])
+
+    def test_fragment_basi_setelah_data_berubah(self):
+        """Test: Versi data naik -> hanya tabel yang berubah dirender ulang"""
+        url = reverse('tampilkan_semua_data')
+        self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Mahasiswa.objects.create(nama='Andi', npm='2023002', email='andi@example.com')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertContains(response, 'Andi')
+        self.assertTrue([q for q in ctx.captured_queries if 'mahasiswa_mahasiswa' in q['sql']])
+        # Tabel dosen tidak bergantung pada mahasiswa
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('SELECT "dosen_dosen"')])
+
+
+class AsyncDashboardStatsTests(LoginMixin, TestCase):
+    """Test dashboard_stats async"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com', jurusan='Sains Data')
+        Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com', homebase='Informatika')
+
+    def test_statistik_async(self):
+        """Test: Statistik async sama dengan hasil rebuild_stats() dan mendukung 304"""
+        from mahasiswa import async_views
+        response = async_get(async_views.dashboard_stats, self.user)
+        import json
+        data = json.loads(response.content)
+        self.assertEqual(data['mahasiswa_by_jurusan'], [{'jurusan': 'Sains Data', 'count': 1}])
+        again = async_get(async_views.dashboard_stats, self.user,
+                          headers={'If-None-Match': response['ETag']})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(data, stats.stats_payload(stats.rebuild_stats()))
+
+
+class ValidationServiceTests(LoginMixin, TestCase):
+    """Test validation.py: normalisasi, format dan keunikan batch"""
+
+    def setUp(self):
+        super().setUp()
+        self.budi = Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com')
+        self.siti = Mahasiswa.objects.create(nama='Siti', npm='2023002', email='siti@example.com')
+
+    def test_normalisasi(self):
+        """Test: Normalizer sama dengan aturan form sebelumnya"""
+        from mahasiswa import validation
+        self.assertEqual(validation.normalize_nama('  budi   santoso '), 'Budi Santoso')
+        self.assertEqual(validation.normalize_no_hp('+62 (812) 3456-7890'), '6281234567890')
+        self.assertEqual(validation.npm_error('２０２３００１'), validation.npm_error('abc'))
+        self.assertIsNone(validation.no_hp_error('081234567890'))
+
+    def test_unique_errors_satu_query_untuk_batch(self):
+        """Test: Satu query untuk seluruh batch, field yang bentrok disebutkan"""
+        from mahasiswa.validation import unique_errors
+        instances = [
+            Mahasiswa(npm='2023001', email='baru@example.com'),
+            Mahasiswa(npm='2029999', email='siti@example.com'),
+            Mahasiswa(npm='2023002', email='budi@example.com'),
+            Mahasiswa(npm='2028888', email='lain@example.com'),
+        ]
+        self.budi.email = 'budi@example.com'
+        with CaptureQueriesContext(connection) as ctx:
+            errors = unique_errors(instances + [self.budi])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual([sorted(e) for e in errors], [['npm'], ['email'], ['email', 'npm'], [], []])
+        self.assertIn('NPM 2023001 sudah terdaftar', errors[0]['npm'])
+
+    def test_update_cek_keunikan(self):
+        """Test: mahasiswa_update menolak NPM/email milik mahasiswa lain"""
+        url = reverse('mahasiswa_update', args=[self.budi.pk])
+        response = self.post_json(url, {'email': 'SITI@example.com'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.json()['errors'])
+        response = self.post_json(url, {'nama': 'budi  santoso'})
+        self.assertTrue(response.json()['success'])
+        self.budi.refresh_from_db()
+        self.assertEqual(self.budi.nama, 'Budi Santoso')
+
+    def test_update_no_hp_mengikuti_aturan_form(self):
+        """Test: mahasiswa_update memakai aturan no HP form (10-15 digit), bukan hanya awalan"""
+        url = reverse('mahasiswa_update', args=[self.budi.pk])
+        response = self.post_json(url, {'no_hp': '08123'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('terlalu pendek', response.json()['errors']['no_hp'][0])
+
 # Run tests dengan: python manage.py test mahasiswa.tests
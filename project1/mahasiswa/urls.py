@@ -1,14 +1,25 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# View baca versi async saat dijalankan di ASGI (settings.ASYNC_VIEWS)
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     path('input/', views.input_mahasiswa, name='input_mahasiswa'), 
     path('update/<int:pk>/', views.mahasiswa_update, name='mahasiswa_update'),
     path('delete/<int:pk>/', views.mahasiswa_delete, name='mahasiswa_delete'),
-    path('export/csv/', views.export_mahasiswa_csv, name='export_mahasiswa_csv'),
+    path('bulk-update/', views.mahasiswa_bulk_update, name='mahasiswa_bulk_update'),
+    path('bulk-delete/', views.mahasiswa_bulk_delete, name='mahasiswa_bulk_delete'),
+    path('import/', views.import_mahasiswa_file, name='import_mahasiswa'),
+    path('export/csv/', read_views.export_mahasiswa_csv, name='export_mahasiswa_csv'),
     path('export/excel/', views.export_mahasiswa_excel, name='export_mahasiswa_excel'),
-    path('export/all/csv/', views.export_all_data_csv, name='export_all_data_csv'),
+    path('export/all/csv/', read_views.export_all_data_csv, name='export_all_data_csv'),
     path('export/all/excel/', views.export_all_data_excel, name='export_all_data_excel'),
-    path('api/dashboard-stats/', views.dashboard_stats, name='dashboard_stats'),
+    path('export/jobs/', views.export_job_create, name='export_job_create'),
+    path('export/jobs/<int:pk>/', views.export_job_status, name='export_job_status'),
+    path('export/jobs/<int:pk>/download/', views.export_job_download, name='export_job_download'),
+    path('api/list/', read_views.mahasiswa_list_api, name='mahasiswa_list_api'),
+    path('api/dashboard-stats/', read_views.dashboard_stats, name='dashboard_stats'),
 ]
 
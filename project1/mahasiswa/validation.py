@@ -0,0 +1,156 @@
+"""
+Normalisasi dan validasi data Mahasiswa yang dipakai bersama oleh
+MahasiswaForm, Mahasiswa.clean, mahasiswa_update, bulk update dan import.
+
+Regex dikompilasi sekali saat modul di-load. Keunikan NPM dan email dicek
+dengan satu query Q(npm__in=...) | Q(email__in=...) untuk satu record
+maupun satu batch, dan hasilnya menyebut field mana yang bentrok.
+
+Aturan format mengikuti MahasiswaForm. Sebelumnya Mahasiswa.clean (dipakai
+admin dan endpoint JSON mahasiswa_update) hanya mengecek awalan no HP;
+sekarang no HP juga harus hanya angka dengan panjang 10-15 digit, dan NPM
+maksimal 20 digit, sama seperti input lewat form.
+"""
+
+import re
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+WHITESPACE_RE = re.compile(r'\s+')
+PHONE_SEPARATORS_RE = re.compile(r'[\s\-\+\(\)]+')
+DIGITS_RE = re.compile(r'[0-9]+')
+
+UNIQUE_FIELDS = ('npm', 'email')
+UNIQUE_LABELS = {'npm': 'NPM', 'email': 'Email'}
+
+
+def squash_whitespace(value):
+    return WHITESPACE_RE.sub(' ', value).strip()
+
+
+def normalize_nama(nama):
+    """Rapikan spasi dan title case: budi  santoso -> Budi Santoso"""
+    return squash_whitespace(nama).title()
+
+
+def normalize_email(email):
+    return email.lower().strip()
+
+
+def normalize_no_hp(no_hp):
+    """Hapus spasi, strip, tanda + dan kurung: +62 (812) 3456 -> 628123456"""
+    return PHONE_SEPARATORS_RE.sub('', no_hp)
+
+
+def normalize_alamat(alamat):
+    return squash_whitespace(alamat)
+
+
+NORMALIZERS = {
+    'nama': normalize_nama,
+    'email': normalize_email,
+    'no_hp': normalize_no_hp,
+    'alamat': normalize_alamat,
+}
+
+
+def npm_error(npm):
+    """Pesan error format NPM, None jika valid"""
+    if not DIGITS_RE.fullmatch(npm):
+        return 'NPM harus berupa angka saja (tidak boleh ada huruf atau simbol)'
+    if len(npm) < 5:
+        return 'NPM minimal 5 digit'
+    if len(npm) > 20:
+        return 'NPM maksimal 20 digit'
+    return None
+
+
+def no_hp_error(no_hp):
+    """Pesan error no HP (sudah dinormalisasi), None jika valid"""
+    if not DIGITS_RE.fullmatch(no_hp):
+        return 'Nomor HP hanya boleh berisi angka'
+    if not no_hp.startswith(('08', '628')):
+        return 'Nomor HP harus format Indonesia (08xx atau 628xx)'
+    if len(no_hp) < 10:
+        return 'Nomor HP terlalu pendek'
+    if len(no_hp) > 15:
+        return 'Nomor HP terlalu panjang'
+    return None
+
+
+def clean_instance(instance):
+    """
+    Normalisasi field teks instance (in-place) lalu validasi format.
+    Return {field: pesan}; dict kosong berarti valid.
+    """
+    for field, normalize in NORMALIZERS.items():
+        value = getattr(instance, field)
+        if value:
+            setattr(instance, field, normalize(value))
+
+    errors = {}
+    if instance.npm:
+        message = npm_error(instance.npm)
+        if message:
+            errors['npm'] = message
+    if instance.no_hp:
+        message = no_hp_error(instance.no_hp)
+        if message:
+            errors['no_hp'] = message
+    if instance.jurusan and instance.jurusan not in dict(instance.JURUSAN_CHOICES):
+        errors['jurusan'] = f'Jurusan "{instance.jurusan}" tidak valid'
+    return errors
+
+
+def unique_errors(instances, ignore_pks=()):
+    """
+    Cek keunikan NPM dan email untuk banyak instance dengan satu query.
+
+    Nilai kosong dilewati dan instance tidak bentrok dengan barisnya
+    sendiri. Baris dengan pk di ignore_pks tidak dihitung (dipakai bulk
+    update: nilai lama item lain di batch yang sama ikut berubah).
+    Return list {field: pesan} sejajar dengan instances.
+    """
+    from .models import Mahasiswa
+
+    instances = list(instances)
+    query = Q()
+    for field in UNIQUE_FIELDS:
+        values = {getattr(instance, field) for instance in instances} - {None, ''}
+        if values:
+            query |= Q(**{f'{field}__in': values})
+    errors = [{} for _ in instances]
+    if not query:
+        return errors
+
+    owners = {field: {} for field in UNIQUE_FIELDS}
+    rows = Mahasiswa.objects.filter(query).exclude(pk__in=list(ignore_pks)).values_list('pk', *UNIQUE_FIELDS)
+    for pk, *values in rows:
+        for field, value in zip(UNIQUE_FIELDS, values):
+            owners[field][value] = pk
+
+    for instance, instance_errors in zip(instances, errors):
+        for field in UNIQUE_FIELDS:
+            value = getattr(instance, field)
+            owner = owners[field].get(value)
+            if value and owner is not None and owner != instance.pk:
+                instance_errors[field] = f'{UNIQUE_LABELS[field]} {value} sudah terdaftar di sistem'
+    return errors
+
+
+def validate_unique(instance):
+    """unique_errors() untuk satu instance, raise ValidationError jika bentrok"""
+    errors = unique_errors([instance])[0]
+    if errors:
+        raise ValidationError(errors)
+
+
+def bulk_unique_errors(objects):
+    """Hook unique_errors untuk project1.bulk.bulk_update: {pk: {field: [pesan]}}"""
+    instances = list(objects.values())
+    return {
+        instance.pk: {field: [message] for field, message in errors.items()}
+        for instance, errors in zip(instances, unique_errors(instances, ignore_pks=objects))
+        if errors
+    }
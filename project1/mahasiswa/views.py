@@ -1,42 +1,75 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse, HttpResponse
-from django.views.decorators.http import require_POST, require_http_methods
-from django.views.decorators.cache import never_cache
+from django.http import FileResponse, JsonResponse, HttpResponse
+from django.views.decorators.http import condition, require_POST, require_http_methods
+from django.views.decorators.cache import cache_control, never_cache
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Count
 from django.core.exceptions import ValidationError
 from .forms import MahasiswaForm
-from .models import Mahasiswa
+from .models import ExportJob, Mahasiswa
+from .export_jobs import EXPORT_FORMATS, EXPORT_KINDS, job_payload, request_export
+from .stats import change_counts, get_stats, remove_counts, stats_payload
+from .importer import DEFAULT_BATCH_SIZE, import_mahasiswa, iter_rows
+from .validation import bulk_unique_errors, validate_unique
 from dosen.models import Dosen
 from matakuliah.models import MataKuliah
+from project1.conditional import conditional_on
+from project1.pagination import get_page_size, keyset_paginate
+from project1.versioning import DOSEN, MAHASISWA, MATAKULIAH_SUMMARY, VERSIONED_MODELS, get_versions
+from project1.search import search
+from project1.bulk import bulk_delete_response, bulk_update_response
+from project1.listing import Listing, list_response
+from project1.exports import HAS_OPENPYXL, XLSX_CONTENT_TYPE, export_filename, stream_csv, stream_csv_sections, xlsx_response
+from . import exports as mahasiswa_exports
+from dosen import exports as dosen_exports
+from matakuliah import exports as matakuliah_exports
 import json
-import csv
-from datetime import datetime
+from datetime import datetime, timezone
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import PatternFill, Font, Alignment
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+
+def filter_mahasiswa(queryset, params):
+    """Pencarian ?q= dan filter ?jurusan=; dipakai juga oleh async_views.py dan export_jobs.py"""
+    search_query = params.get('q', '')
+    jurusan_filter = params.get('jurusan', '')
+    if search_query:
+        queryset = search(queryset, search_query)
+    if jurusan_filter:
+        queryset = queryset.filter(jurusan=jurusan_filter)
+    return queryset
 
 @login_required(login_url='/admin/login/')
-@never_cache
+@cache_control(private=True, no_cache=True)
+@conditional_on(*VERSIONED_MODELS)
 def tampilkan_semua_data(request):
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    dosen = Dosen.objects.all().order_by('id')
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    
+    # Hanya halaman pertama yang dirender server, sisanya dimuat saat tabel
+    # di-scroll lewat endpoint api/list/ (lihat project1/listing.py)
+    per_page = get_page_size({})
+    mahasiswa = Mahasiswa.objects.all().order_by('id')[:per_page]
+    dosen = Dosen.objects.all().order_by('id')[:per_page]
+    matakuliah = MataKuliah.objects.with_summary().order_by('id')[:per_page]
+
+    # Kunci fragment {% cache %} per tabel: selama versi data sama, tabel
+    # diambil dari cache dan queryset di atas tidak pernah dievaluasi
+    versions = get_versions(VERSIONED_MODELS)
+    fragment_versions = {
+        'mahasiswa': versions[MAHASISWA],
+        'dosen': versions[DOSEN],
+        'matakuliah': '-'.join(str(versions[label]) for label in MATAKULIAH_SUMMARY),
+    }
+
     return render(request, 'tampilkan_semua_data.html', {
         'mahasiswa': mahasiswa,
         'dosen': dosen,
         'matakuliah': matakuliah,
+        'fragment_versions': fragment_versions,
+        'fragment_timeout': getattr(settings, 'TEMPLATE_FRAGMENT_CACHE_TIMEOUT', 60 * 60),
     })
 
 @login_required(login_url='/admin/login/')
-@never_cache
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
 def input_mahasiswa(request):
     pesan = None
     if request.method == 'POST':
@@ -44,10 +77,9 @@ def input_mahasiswa(request):
         if form.is_valid():
             try:
                 with transaction.atomic():
-                    # Call full_clean() untuk memastikan model-level validation
-                    instance = form.save(commit=False)
-                    instance.full_clean()  # Model validation
-                    instance.save()  # Save ke database
+                    # Model-level validation (Mahasiswa.clean) dan keunikan
+                    # sudah dijalankan form.is_valid(), dijaga juga oleh unique index
+                    instance = form.save()
                 messages.success(request, f'Data mahasiswa "{instance.nama}" berhasil ditambahkan!', extra_tags='success')
                 return redirect('input_mahasiswa')  # Redirect after POST
             except ValidationError as e:
@@ -65,22 +97,17 @@ def input_mahasiswa(request):
     else:
         form = MahasiswaForm()
 
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    
     # Search and Filter
     search_query = request.GET.get('q', '')
     jurusan_filter = request.GET.get('jurusan', '')
+    mahasiswa = filter_mahasiswa(Mahasiswa.objects.all().order_by('id'), request.GET)
 
-    if search_query:
-        from django.db.models import Q
-        mahasiswa = mahasiswa.filter(Q(nama__icontains=search_query) | Q(npm__icontains=search_query))
-    
-    if jurusan_filter:
-        mahasiswa = mahasiswa.filter(jurusan=jurusan_filter)
+    page = keyset_paginate(request, mahasiswa)
 
     return render(request, 'mahasiswa/input.html', {
         'form': form,
-        'mahasiswa': mahasiswa,
+        'mahasiswa': page,
+        'page': page,
         'pesan': pesan,
         'search_query': search_query,
         'jurusan_filter': jurusan_filter,
@@ -120,14 +147,22 @@ def mahasiswa_update(request, pk):
         mahasiswa.jurusan = data.get('jurusan', mahasiswa.jurusan)
         mahasiswa.alamat = data.get('alamat', mahasiswa.alamat)
         
-        # Validate and save
-        mahasiswa.full_clean()
+        # Validate and save: format lewat Mahasiswa.clean, keunikan NPM dan
+        # email dengan satu query (validation.py)
+        mahasiswa.full_clean(validate_unique=False)
+        validate_unique(mahasiswa)
         mahasiswa.save()
         
         return JsonResponse({
             'success': True,
             'message': 'Data berhasil diupdate'
         })
+    except ValidationError as e:
+        return JsonResponse({
+            'success': False,
+            'error': ' | '.join(e.messages),
+            'errors': e.message_dict,
+        }, status=400)
     except json.JSONDecodeError:
         return JsonResponse({
             'success': False,
@@ -139,288 +174,188 @@ def mahasiswa_update(request, pk):
             'error': str(e)
         }, status=400)
 
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def import_mahasiswa_file(request):
+    """
+    Import massal mahasiswa dari file CSV/XLSX (field upload: file).
+    Mengembalikan ringkasan dan error per baris dalam JSON.
+    """
+    uploaded = request.FILES.get('file')
+    if uploaded is None:
+        return JsonResponse({'success': False, 'error': 'File tidak ditemukan'}, status=400)
+
+    try:
+        rows = iter_rows(uploaded.file, uploaded.name)
+        result = import_mahasiswa(rows, batch_size=getattr(settings, 'IMPORT_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    if result.created:
+        messages.success(request, f'{result.created} data mahasiswa berhasil di-import!', extra_tags='success')
+    return JsonResponse({'success': not result.errors, **result.as_dict()})
+
+
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
 def export_mahasiswa_csv(request):
     """Export mahasiswa data to CSV"""
     # Get filtered data if search/filter exists
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    jurusan_filter = request.GET.get('jurusan', '')
+    mahasiswa = filter_mahasiswa(Mahasiswa.objects.all().order_by('id'), request.GET)
 
-    if search_query:
-        from django.db.models import Q
-        mahasiswa = mahasiswa.filter(Q(nama__icontains=search_query) | Q(npm__icontains=search_query))
-    
-    if jurusan_filter:
-        mahasiswa = mahasiswa.filter(jurusan=jurusan_filter)
-    
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="mahasiswa_{timestamp}.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat'])
-    
-    for index, m in enumerate(mahasiswa, 1):
-        writer.writerow([
-            index,
-            m.nama,
-            m.npm,
-            m.email,
-            m.no_hp or '',
-            m.jurusan or '',
-            m.alamat or ''
-        ])
-    
-    return response
+    return stream_csv('mahasiswa', mahasiswa_exports.HEADERS, mahasiswa_exports.export_rows(mahasiswa))
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
 def export_mahasiswa_excel(request):
     """Export mahasiswa data to Excel"""
     if not HAS_OPENPYXL:
         return HttpResponse("openpyxl library is not installed", status=400)
     
     # Get filtered data if search/filter exists
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    jurusan_filter = request.GET.get('jurusan', '')
+    mahasiswa = filter_mahasiswa(Mahasiswa.objects.all().order_by('id'), request.GET)
 
-    if search_query:
-        from django.db.models import Q
-        mahasiswa = mahasiswa.filter(Q(nama__icontains=search_query) | Q(npm__icontains=search_query))
-    
-    if jurusan_filter:
-        mahasiswa = mahasiswa.filter(jurusan=jurusan_filter)
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Mahasiswa"
-    
-    # Header styling
-    header_fill = PatternFill(start_color="667eea", end_color="667eea", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    
-    headers = ['No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    # Data rows
-    for row_num, m in enumerate(mahasiswa, 2):
-        ws.cell(row=row_num, column=1).value = row_num - 1
-        ws.cell(row=row_num, column=2).value = m.nama
-        ws.cell(row=row_num, column=3).value = m.npm
-        ws.cell(row=row_num, column=4).value = m.email
-        ws.cell(row=row_num, column=5).value = m.no_hp or ''
-        ws.cell(row=row_num, column=6).value = m.jurusan or ''
-        ws.cell(row=row_num, column=7).value = m.alamat or ''
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 5
-    ws.column_dimensions['B'].width = 25
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 25
-    ws.column_dimensions['E'].width = 15
-    ws.column_dimensions['F'].width = 20
-    ws.column_dimensions['G'].width = 25
-    
-    # Create response
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="mahasiswa_{timestamp}.xlsx"'
-    wb.save(response)
-    
-    return response
+    return xlsx_response('mahasiswa', [mahasiswa_exports.excel_sheet(mahasiswa)])
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*VERSIONED_MODELS)
 def export_all_data_csv(request):
     """Export all data (mahasiswa, dosen, matakuliah) to CSV files"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Create a combined CSV
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="semua_data_{timestamp}.csv"'
-    
-    writer = csv.writer(response)
-    
-    # Write Mahasiswa data
-    writer.writerow(['=== DATA MAHASISWA ==='])
-    writer.writerow(['No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat'])
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    for index, m in enumerate(mahasiswa, 1):
-        writer.writerow([index, m.nama, m.npm, m.email, m.no_hp or '', m.jurusan or '', m.alamat or ''])
-    
-    writer.writerow([])
-    writer.writerow(['=== DATA DOSEN ==='])
-    writer.writerow(['No', 'Nama', 'NIDN', 'Email', 'No. HP', 'Homebase', 'Alamat'])
-    dosen = Dosen.objects.all().order_by('id')
-    for index, d in enumerate(dosen, 1):
-        writer.writerow([index, d.nama, d.nidn, d.email, d.no_hp or '', d.homebase or '', d.alamat or ''])
-    
-    writer.writerow([])
-    writer.writerow(['=== DATA MATA KULIAH ==='])
-    writer.writerow(['No', 'Nama MK', 'Kode MK', 'SKS', 'Semester', 'Dosen', 'Jumlah Mahasiswa'])
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    for index, mk in enumerate(matakuliah, 1):
-        writer.writerow([index, mk.nama_mk, mk.kode_mk, mk.sks, mk.semester, 
-                        mk.dosen_mk.nama if mk.dosen_mk else '', mk.mhs_mk.all().count()])
-    
-    return response
+    return stream_csv_sections('semua_data', [
+        ('=== DATA MAHASISWA ===', mahasiswa_exports.HEADERS,
+         mahasiswa_exports.export_rows(Mahasiswa.objects.all())),
+        ('=== DATA DOSEN ===', dosen_exports.HEADERS,
+         dosen_exports.export_rows(Dosen.objects.all())),
+        ('=== DATA MATA KULIAH ===', matakuliah_exports.HEADERS,
+         matakuliah_exports.export_rows(MataKuliah.objects.all())),
+    ])
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*VERSIONED_MODELS)
 def export_all_data_excel(request):
     """Export all data (mahasiswa, dosen, matakuliah) to Excel"""
     if not HAS_OPENPYXL:
         return HttpResponse("openpyxl library is not installed", status=400)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Create workbook with multiple sheets
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
-    
-    # Mahasiswa sheet
-    ws_mhs = wb.create_sheet("Mahasiswa")
-    header_fill = PatternFill(start_color="667eea", end_color="667eea", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    
-    headers = ['No', 'Nama', 'NPM', 'Email', 'No. HP', 'Jurusan', 'Alamat']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws_mhs.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    mahasiswa = Mahasiswa.objects.all().order_by('id')
-    for row_num, m in enumerate(mahasiswa, 2):
-        ws_mhs.cell(row=row_num, column=1).value = row_num - 1
-        ws_mhs.cell(row=row_num, column=2).value = m.nama
-        ws_mhs.cell(row=row_num, column=3).value = m.npm
-        ws_mhs.cell(row=row_num, column=4).value = m.email
-        ws_mhs.cell(row=row_num, column=5).value = m.no_hp or ''
-        ws_mhs.cell(row=row_num, column=6).value = m.jurusan or ''
-        ws_mhs.cell(row=row_num, column=7).value = m.alamat or ''
-    
-    ws_mhs.column_dimensions['A'].width = 5
-    ws_mhs.column_dimensions['B'].width = 25
-    ws_mhs.column_dimensions['C'].width = 15
-    ws_mhs.column_dimensions['D'].width = 25
-    ws_mhs.column_dimensions['E'].width = 15
-    ws_mhs.column_dimensions['F'].width = 20
-    ws_mhs.column_dimensions['G'].width = 25
-    
-    # Dosen sheet
-    ws_dos = wb.create_sheet("Dosen")
-    header_fill = PatternFill(start_color="28a745", end_color="28a745", fill_type="solid")
-    
-    headers = ['No', 'Nama', 'NIDN', 'Email', 'No. HP', 'Homebase', 'Alamat']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws_dos.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    dosen = Dosen.objects.all().order_by('id')
-    for row_num, d in enumerate(dosen, 2):
-        ws_dos.cell(row=row_num, column=1).value = row_num - 1
-        ws_dos.cell(row=row_num, column=2).value = d.nama
-        ws_dos.cell(row=row_num, column=3).value = d.nidn
-        ws_dos.cell(row=row_num, column=4).value = d.email
-        ws_dos.cell(row=row_num, column=5).value = d.no_hp or ''
-        ws_dos.cell(row=row_num, column=6).value = d.homebase or ''
-        ws_dos.cell(row=row_num, column=7).value = d.alamat or ''
-    
-    ws_dos.column_dimensions['A'].width = 5
-    ws_dos.column_dimensions['B'].width = 25
-    ws_dos.column_dimensions['C'].width = 15
-    ws_dos.column_dimensions['D'].width = 25
-    ws_dos.column_dimensions['E'].width = 15
-    ws_dos.column_dimensions['F'].width = 20
-    ws_dos.column_dimensions['G'].width = 25
-    
-    # Mata Kuliah sheet
-    ws_mk = wb.create_sheet("Mata Kuliah")
-    header_fill = PatternFill(start_color="ffc107", end_color="ffc107", fill_type="solid")
-    
-    headers = ['No', 'Nama MK', 'Kode MK', 'SKS', 'Semester', 'Dosen', 'Jumlah Mahasiswa']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws_mk.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    for row_num, mk in enumerate(matakuliah, 2):
-        ws_mk.cell(row=row_num, column=1).value = row_num - 1
-        ws_mk.cell(row=row_num, column=2).value = mk.nama_mk
-        ws_mk.cell(row=row_num, column=3).value = mk.kode_mk
-        ws_mk.cell(row=row_num, column=4).value = mk.sks
-        ws_mk.cell(row=row_num, column=5).value = mk.semester
-        ws_mk.cell(row=row_num, column=6).value = mk.dosen_mk.nama if mk.dosen_mk else ''
-        ws_mk.cell(row=row_num, column=7).value = mk.mhs_mk.all().count()
-    
-    ws_mk.column_dimensions['A'].width = 5
-    ws_mk.column_dimensions['B'].width = 25
-    ws_mk.column_dimensions['C'].width = 15
-    ws_mk.column_dimensions['D'].width = 8
-    ws_mk.column_dimensions['E'].width = 12
-    ws_mk.column_dimensions['F'].width = 20
-    ws_mk.column_dimensions['G'].width = 18
-    
-    # Create response
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = f'attachment; filename="semua_data_{timestamp}.xlsx"'
-    wb.save(response)
-    
-    return response
+    return xlsx_response('semua_data', [
+        mahasiswa_exports.excel_sheet(Mahasiswa.objects.all()),
+        dosen_exports.excel_sheet(Dosen.objects.all()),
+        matakuliah_exports.excel_sheet(MataKuliah.objects.all()),
+    ])
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+def export_job_create(request):
+    """
+    Minta export di background (POST kind, format, dan filter q/jurusan).
+    Job identik yang masih aktif dipakai ulang, jadi klik berulang tidak
+    membuat file baru.
+    """
+    kind = request.POST.get('kind', '')
+    fmt = request.POST.get('format', 'csv')
+    if kind not in EXPORT_KINDS or fmt not in EXPORT_FORMATS:
+        return JsonResponse({'success': False, 'error': 'Jenis atau format export tidak valid'}, status=400)
+    if fmt == 'xlsx' and not HAS_OPENPYXL:
+        return JsonResponse({'success': False, 'error': 'openpyxl library is not installed'}, status=400)
+
+    job, created = request_export(kind, fmt, request.POST, user=request.user)
+    status = 200 if job.status == ExportJob.STATUS_DONE else 202
+    return JsonResponse({'success': True, 'created': created, 'job': job_payload(job)}, status=status)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@never_cache
+def export_job_status(request, pk):
+    job = get_object_or_404(ExportJob, pk=pk)
+    return JsonResponse({'success': True, 'job': job_payload(job)})
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+def export_job_download(request, pk):
+    job = get_object_or_404(ExportJob, pk=pk)
+    if job.status != ExportJob.STATUS_DONE:
+        return JsonResponse({'success': False, 'error': 'Export belum selesai', 'job': job_payload(job)}, status=409)
+    try:
+        fileobj = open(job.file_path, 'rb')
+    except OSError:
+        return JsonResponse({'success': False, 'error': 'File export sudah tidak tersedia'}, status=410)
+    content_type = XLSX_CONTENT_TYPE if job.format == 'xlsx' else 'text/csv'
+    filename = export_filename(EXPORT_KINDS[job.kind].prefix, job.format)
+    return FileResponse(fileobj, as_attachment=True, filename=filename, content_type=content_type)
+
+
+def _dashboard_stats_etag(request):
+    return 'stats-%d' % get_stats()['version']
+
+
+def _dashboard_stats_last_modified(request):
+    return datetime.fromtimestamp(get_stats()['last_modified'], tz=timezone.utc)
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@condition(etag_func=_dashboard_stats_etag, last_modified_func=_dashboard_stats_last_modified)
 def dashboard_stats(request):
-    """Return dashboard statistics as JSON for charts"""
-    
-    # Mahasiswa by Jurusan
-    mahasiswa_by_jurusan = list(
-        Mahasiswa.objects.values('jurusan')
-        .annotate(count=Count('id'))
-        .order_by('jurusan')
-    )
-    
-    # Dosen by Homebase
-    dosen_by_homebase = list(
-        Dosen.objects.values('homebase')
-        .annotate(count=Count('id'))
-        .order_by('homebase')
-    )
-    
-    # Mata Kuliah by Semester
-    matakuliah_by_semester = list(
-        MataKuliah.objects.values('semester')
-        .annotate(count=Count('id'))
-        .order_by('semester')
+    """
+    Return dashboard statistics as JSON for charts.
+    Data diambil dari cache statistik (lihat stats.py): tanpa query selama
+    data tidak berubah, satu query kecil ke DashboardStat setelahnya.
+    """
+    return JsonResponse(stats_payload(get_stats()))
+
+
+# Field yang boleh diubah lewat mahasiswa_bulk_update
+BULK_EDITABLE_FIELDS = ('nama', 'npm', 'email', 'no_hp', 'jurusan', 'alamat')
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def mahasiswa_bulk_update(request):
+    """
+    Update banyak mahasiswa sekaligus.
+    Body: {"items": [{"pk": 1, "fields": {...}}], "atomic": false}
+    """
+    return bulk_update_response(
+        request, Mahasiswa, BULK_EDITABLE_FIELDS, on_updated=change_counts, unique_errors=bulk_unique_errors,
     )
-    
-    return JsonResponse({
-        'mahasiswa_by_jurusan': mahasiswa_by_jurusan,
-        'dosen_by_homebase': dosen_by_homebase,
-        'matakuliah_by_semester': matakuliah_by_semester,
-    })
-    return response
\ No newline at end of file
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def mahasiswa_bulk_delete(request):
+    """Hapus banyak mahasiswa sekaligus. Body: {"pks": [1, 2, 3]}"""
+    return bulk_delete_response(request, Mahasiswa, on_deleted=remove_counts)
+
+
+LISTING = Listing(
+    Mahasiswa.objects.all,
+    columns=('id', 'nama', 'npm', 'email', 'no_hp', 'jurusan', 'alamat'),
+    sortable=('nama', 'npm', 'email', 'jurusan'),
+    filters=('jurusan',),
+)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA)
+def mahasiswa_list_api(request):
+    """Daftar mahasiswa per halaman dalam format kolom (lihat project1/listing.py)"""
+    return list_response(request, LISTING)
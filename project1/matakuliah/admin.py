@@ -1,8 +1,24 @@
 from django.contrib import admin
+from project1.admin import SearchAdminMixin
 from .models import MataKuliah
 
 @admin.register(MataKuliah)
-class MataKuliahAdmin(admin.ModelAdmin):
-    list_display = ('id', 'nama_mk', 'kode_mk', 'sks', 'semester', 'dosen_mk')
+class MataKuliahAdmin(SearchAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'nama_mk', 'kode_mk', 'sks', 'semester', 'dosen_mk', 'jumlah_mahasiswa')
+    list_select_related = ('dosen_mk',)
     search_fields = ('nama_mk', 'kode_mk')
-    filter_horizontal = ('mhs_mk',)
+    code_search_mode = 'exact'
+    # Select2 + AJAX: hanya pilihan yang sudah terpilih yang dimuat, bukan
+    # seluruh mahasiswa seperti filter_horizontal
+    autocomplete_fields = ('dosen_mk', 'mhs_mk')
+    show_full_result_count = False
+    # Urutan stabil untuk paginasi changelist dan autocomplete (primary key)
+    ordering = ('id',)
+
+    def get_queryset(self, request):
+        # Dosen lewat JOIN dan jumlah mahasiswa lewat COUNT di query changelist
+        return super().get_queryset(request).with_summary()
+
+    @admin.display(description='Jumlah Mahasiswa', ordering='jumlah_mahasiswa')
+    def jumlah_mahasiswa(self, obj):
+        return obj.jumlah_mahasiswa
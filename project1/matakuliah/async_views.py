@@ -0,0 +1,30 @@
+"""Versi async view baca mata kuliah untuk ASGI (lihat mahasiswa/async_views.py)"""
+
+from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_http_methods
+
+from project1.conditional import conditional_on
+from project1.exports import astream_csv
+from project1.listing import alist_response
+from project1.versioning import MATAKULIAH_SUMMARY
+from . import exports as matakuliah_exports
+from .models import MataKuliah
+from .views import LISTING, filter_matakuliah
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
+async def matakuliah_list_api(request):
+    return await alist_response(request, LISTING)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
+async def export_matakuliah_csv(request):
+    matakuliah = filter_matakuliah(MataKuliah.objects.all(), request.GET)
+    return astream_csv('matakuliah', matakuliah_exports.HEADERS, matakuliah_exports.aexport_rows(matakuliah))
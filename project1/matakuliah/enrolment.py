@@ -0,0 +1,92 @@
+"""
+Enrolment mahasiswa ke mata kuliah (relasi mhs_mk) dengan diff berbasis set.
+
+Perubahan bisa dikirim sebagai {"add": [...], "remove": [...]} atau sebagai
+set akhir {"set": [...]}. Selisihnya dihitung di database terhadap tabel
+penghubung, lalu diterapkan dengan bulk_create (ignore_conflicts) dan satu
+DELETE terfilter; baris yang tidak berubah tidak disentuh. Berbeda dengan
+form.save() yang menulis ulang seluruh relasi.
+"""
+
+from functools import partial
+
+from django.db import transaction
+
+from mahasiswa.models import Mahasiswa
+from project1.pagination import is_valid_id
+from project1.versioning import MATAKULIAH, bump_version
+from .models import MataKuliah
+
+Enrolment = MataKuliah.mhs_mk.through
+
+
+class EnrolmentError(ValueError):
+    """Payload enrolment tidak valid"""
+
+
+def _id_list(data, key):
+    values = data.get(key, [])
+    if not isinstance(values, list):
+        raise EnrolmentError(f'"{key}" harus berupa list id mahasiswa')
+    try:
+        ids = {int(value) for value in values if not isinstance(value, bool)}
+    except (TypeError, ValueError):
+        raise EnrolmentError(f'"{key}" harus berisi id mahasiswa (angka)')
+    # Id di luar BIGINT membuat database OverflowError
+    if not all(is_valid_id(value) for value in ids):
+        raise EnrolmentError(f'"{key}" berisi id mahasiswa di luar rentang')
+    return ids
+
+
+def parse_changes(data):
+    """(add, remove, desired) dari payload; desired None jika tidak ada "set" """
+    if not isinstance(data, dict):
+        raise EnrolmentError('Payload enrolment harus berupa object')
+    if 'set' in data:
+        if 'add' in data or 'remove' in data:
+            raise EnrolmentError('Gunakan "set" atau "add"/"remove", tidak keduanya')
+        return set(), set(), _id_list(data, 'set')
+    add, remove = _id_list(data, 'add'), _id_list(data, 'remove')
+    if add & remove:
+        raise EnrolmentError('Id yang sama tidak boleh ada di "add" dan "remove"')
+    return add, remove, None
+
+
+def apply_changes(matakuliah, add=(), remove=(), desired=None):
+    """
+    Terapkan perubahan enrolment. Mengembalikan dict jumlah yang ditambah
+    dan dihapus serta id mahasiswa yang tidak ditemukan.
+    """
+    enrolled = Enrolment.objects.filter(matakuliah_id=matakuliah.pk)
+    with transaction.atomic():
+        if desired is not None:
+            removed, _ = enrolled.exclude(mahasiswa_id__in=desired).delete()
+            add = desired
+        elif remove:
+            removed, _ = enrolled.filter(mahasiswa_id__in=remove).delete()
+        else:
+            removed = 0
+
+        added, unknown = 0, []
+        if add:
+            # Mahasiswa yang ada dan belum terdaftar, dihitung di database
+            new_ids = set(
+                Mahasiswa.objects.filter(pk__in=add)
+                .exclude(pk__in=enrolled.values('mahasiswa_id'))
+                .values_list('pk', flat=True)
+            )
+            candidates = set(add) - new_ids
+            if candidates:
+                known = set(Mahasiswa.objects.filter(pk__in=candidates).values_list('pk', flat=True))
+                unknown = sorted(candidates - known)
+            Enrolment.objects.bulk_create(
+                [Enrolment(matakuliah_id=matakuliah.pk, mahasiswa_id=pk) for pk in sorted(new_ids)],
+                ignore_conflicts=True,
+            )
+            added = len(new_ids)
+
+        if added or removed:
+            # Akses langsung ke tabel penghubung tidak mengirim m2m_changed
+            transaction.on_commit(partial(bump_version, MATAKULIAH))
+
+    return {'added': added, 'removed': removed, 'unknown': unknown}
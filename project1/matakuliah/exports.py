@@ -0,0 +1,36 @@
+"""
+Definisi kolom export untuk data Mata Kuliah
+"""
+
+from project1.exports import ExcelSheet, anumbered_rows, numbered_rows
+
+HEADERS = ['No', 'Nama MK', 'Kode MK', 'SKS', 'Semester', 'Dosen', 'Jumlah Mahasiswa']
+FIELDS = ('nama_mk', 'kode_mk', 'sks', 'semester', 'dosen_mk__nama', 'jumlah_mahasiswa')
+
+# Tampilan sheet Excel
+COLUMN_WIDTHS = [5, 25, 15, 8, 12, 20, 18]
+HEADER_COLOR = 'ffc107'
+HEADER_FONT_COLOR = '333333'
+
+
+def export_values(queryset, named=False):
+    return queryset.with_summary().order_by('id').values_list(*FIELDS, named=named)
+
+
+def export_rows(queryset):
+    """
+    Baris export (tuple) tanpa membuat instance MataKuliah.
+    Nama dosen dan jumlah mahasiswa berasal dari with_summary(),
+    bukan query terpisah per baris.
+    """
+    return numbered_rows(export_values(queryset))
+
+
+def aexport_rows(queryset):
+    """Versi async export_rows() untuk view async"""
+    return anumbered_rows(export_values(queryset, named=True))
+
+
+def excel_sheet(queryset):
+    """Sheet Excel Mata Kuliah dengan baris dari export_rows()"""
+    return ExcelSheet('Mata Kuliah', HEADERS, export_rows(queryset), COLUMN_WIDTHS, HEADER_COLOR, HEADER_FONT_COLOR)
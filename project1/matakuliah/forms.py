@@ -1,4 +1,5 @@
 from django import forms
+from .enrolment import apply_changes
 from .models import MataKuliah
 
 class MataKuliahForm(forms.ModelForm):
@@ -22,10 +23,25 @@ class MataKuliahForm(forms.ModelForm):
                 'class': 'form-control form-control-sm',
                 'placeholder': 'Masukkan semester'
             }),
-            'mhs_mk': forms.CheckboxSelectMultiple(attrs={
-                'class': 'form-check-input',
-            }),
+            # Daftar mahasiswa dimuat bertahap oleh picker di template,
+            # form hanya membawa id yang dipilih
+            'mhs_mk': forms.MultipleHiddenInput(),
             'dosen_mk': forms.Select(attrs={
                 'class': 'form-control form-control-sm',
             }),
         }
+
+    def save(self, commit=True):
+        instance = super().save(commit=False)
+        if commit:
+            instance.save()
+            self._save_enrolment()
+        else:
+            self.save_m2m = self._save_enrolment
+        return instance
+
+    def _save_enrolment(self):
+        """Simpan mhs_mk lewat diff enrolment, bukan .set() dari form"""
+        selected = self.cleaned_data.get('mhs_mk')
+        desired = set(selected.values_list('pk', flat=True)) if selected is not None else set()
+        apply_changes(self.instance, desired=desired)
@@ -0,0 +1,16 @@
+# Tabel FTS5 untuk pencarian mata kuliah (hanya SQLite, lihat project1/search.py)
+
+from django.db import migrations
+
+from project1.search import sqlite_fts_operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matakuliah', '0001_initial'),
+    ]
+
+    operations = [
+        sqlite_fts_operation('matakuliah_matakuliah', ['kode_mk', 'nama_mk']),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matakuliah', '0002_matakuliah_fts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='matakuliah',
+            name='semester',
+            field=models.IntegerField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Index GIN trigram untuk pencarian mata kuliah (hanya PostgreSQL, lihat project1/search.py)
+
+from django.db import migrations
+
+from project1.search import postgres_trigram_operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matakuliah', '0003_alter_matakuliah_semester'),
+    ]
+
+    operations = [
+        postgres_trigram_operation('matakuliah_matakuliah', ['kode_mk', 'nama_mk']),
+    ]
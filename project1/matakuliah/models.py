@@ -1,14 +1,32 @@
 from django.db import models
+from django.db.models import Count
 from mahasiswa.models import Mahasiswa
 from dosen.models import Dosen
+from project1.tracking import LoadedValuesMixin
 
-class MataKuliah(models.Model):
+
+class MataKuliahQuerySet(models.QuerySet):
+    def with_summary(self):
+        """
+        Ambil dosen lewat JOIN dan hitung mahasiswa lewat COUNT dalam satu
+        query, sehingga listing/export tidak menjalankan query per baris.
+        Hasil: mk.dosen_mk sudah terisi dan mk.jumlah_mahasiswa tersedia.
+        """
+        return self.select_related('dosen_mk').annotate(jumlah_mahasiswa=Count('mhs_mk'))
+
+
+class MataKuliah(LoadedValuesMixin, models.Model):
     nama_mk = models.CharField(max_length=100)
     kode_mk = models.CharField(max_length=20, unique=True)
     sks = models.IntegerField()
-    semester = models.IntegerField()
+    semester = models.IntegerField(db_index=True)
     mhs_mk = models.ManyToManyField(Mahasiswa, related_name='matakuliah_set', blank=True)
     dosen_mk = models.ForeignKey(Dosen, on_delete=models.PROTECT, related_name='matakuliah_set')
 
+    objects = MataKuliahQuerySet.as_manager()
+
+    # Untuk statistik dashboard (lihat mahasiswa/stats.py)
+    tracked_fields = ('semester',)
+
     def __str__(self):
         return f"{self.nama_mk} ({self.kode_mk})"
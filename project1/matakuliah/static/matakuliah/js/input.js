@@ -0,0 +1,216 @@
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let c of cookies) {
+            const cookie = c.trim();
+            if (cookie.startsWith(name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+const csrftoken = getCookie('csrftoken');
+
+// Picker mahasiswa: daftar dimuat per halaman dari server, pilihan
+// disimpan sebagai hidden input mhs_mk
+(function () {
+    const picker = document.getElementById('mhs-picker');
+    if (!picker) return;
+    const list = document.getElementById('mhs-picker-list');
+    const inputs = document.getElementById('mhs-picker-inputs');
+    const more = document.getElementById('mhs-picker-more');
+    const count = document.getElementById('mhs-picker-count');
+    const query = document.getElementById('mhs-picker-q');
+    const selected = new Set(Array.from(inputs.querySelectorAll('input')).map(i => i.value));
+    let cursor = null;
+    let timer = null;
+
+    function syncInputs() {
+        inputs.innerHTML = '';
+        selected.forEach(id => {
+            const input = document.createElement('input');
+            input.type = 'hidden';
+            input.name = 'mhs_mk';
+            input.value = id;
+            inputs.appendChild(input);
+        });
+        count.textContent = selected.size;
+    }
+
+    function load(reset) {
+        const params = new URLSearchParams({ q: query.value.trim() });
+        if (!reset && cursor) params.set('after', cursor);
+        fetch(picker.dataset.url + '?' + params, { headers: { 'Accept': 'application/json' } })
+            .then(r => r.json())
+            .then(json => {
+                if (reset) list.innerHTML = '';
+                json.results.forEach(m => {
+                    const id = String(m.id);
+                    const label = document.createElement('label');
+                    label.className = 'form-check d-block';
+                    label.innerHTML = '<input type="checkbox" class="form-check-input me-2"><span></span>';
+                    label.querySelector('span').textContent = `${m.nama} (${m.npm})`;
+                    const checkbox = label.querySelector('input');
+                    checkbox.checked = selected.has(id);
+                    checkbox.addEventListener('change', () => {
+                        checkbox.checked ? selected.add(id) : selected.delete(id);
+                        syncInputs();
+                    });
+                    list.appendChild(label);
+                });
+                if (reset && !json.results.length) {
+                    list.innerHTML = '<small class="text-muted">Mahasiswa tidak ditemukan</small>';
+                }
+                cursor = json.next_cursor;
+                more.classList.toggle('d-none', !cursor);
+            })
+            .catch(() => { list.innerHTML = '<small class="text-danger">Gagal memuat data mahasiswa</small>'; });
+    }
+
+    more.addEventListener('click', () => load(false));
+    query.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => load(true), 300);
+    });
+    // Enter di kotak pencarian tidak men-submit form
+    query.addEventListener('keydown', e => { if (e.key === 'Enter') e.preventDefault(); });
+    syncInputs();
+    load(true);
+})();
+
+function updateRowNumbers() {
+    const tbody = document.querySelector('tbody');
+    const rows = tbody.querySelectorAll('tr');
+    rows.forEach((row, index) => {
+        const numberCell = row.querySelector('th');
+        if (numberCell) {
+            numberCell.textContent = index + 1;
+        }
+    });
+}
+
+document.addEventListener('click', function (e) {
+    // EDIT button
+    if (e.target.closest('.edit-btn')) {
+        const btn = e.target.closest('.edit-btn');
+        const row = btn.closest('tr');
+        const id = btn.dataset.id;
+        const namaMkCell = row.querySelector('.nama_mk');
+        const kodeMkCell = row.querySelector('.kode_mk');
+        const sksCell = row.querySelector('.sks');
+        const semesterCell = row.querySelector('.semester');
+        const dosenMkCell = row.querySelector('.dosen_mk');
+
+        const editing = btn.dataset.editing === 'true';
+        if (!editing) {
+            btn.dataset.editing = 'true';
+            btn.innerHTML = '<i class="bi bi-check-lg me-1"></i>Save';
+            let cancel = row.querySelector('.cancel-btn');
+            if (!cancel) {
+                cancel = document.createElement('button');
+                cancel.type = 'button';
+                cancel.className = 'btn btn-sm btn-secondary ms-1 cancel-btn';
+                cancel.textContent = 'Cancel';
+                row.querySelector('.aksi').appendChild(cancel);
+            }
+
+            namaMkCell.dataset.old = namaMkCell.textContent.trim();
+            kodeMkCell.dataset.old = kodeMkCell.textContent.trim();
+            sksCell.dataset.old = sksCell.textContent.trim();
+            semesterCell.dataset.old = semesterCell.textContent.trim();
+            dosenMkCell.dataset.old = dosenMkCell.textContent.trim();
+
+            namaMkCell.innerHTML = `<input class="form-control form-control-sm" value="${namaMkCell.dataset.old}">`;
+            kodeMkCell.innerHTML = `<input class="form-control form-control-sm" value="${kodeMkCell.dataset.old}">`;
+            sksCell.innerHTML = `<input class="form-control form-control-sm" type="number" value="${sksCell.dataset.old}">`;
+            semesterCell.innerHTML = `<input class="form-control form-control-sm" type="number" value="${semesterCell.dataset.old}">`;
+            dosenMkCell.innerHTML = `<input class="form-control form-control-sm" value="${dosenMkCell.dataset.old}" disabled>`;
+            return;
+        }
+
+        // Save flow
+        const newNamaMk = namaMkCell.querySelector('input').value.trim();
+        const newKodeMk = kodeMkCell.querySelector('input').value.trim();
+        const newSks = sksCell.querySelector('input').value.trim();
+        const newSemester = semesterCell.querySelector('input').value.trim();
+
+        const updateUrl = btn.dataset.updateUrl;
+        fetch(updateUrl, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrftoken,
+            },
+            body: JSON.stringify({ nama_mk: newNamaMk, kode_mk: newKodeMk, sks: newSks, semester: newSemester })
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    namaMkCell.textContent = newNamaMk;
+                    kodeMkCell.textContent = newKodeMk;
+                    sksCell.textContent = newSks;
+                    semesterCell.textContent = newSemester;
+                    btn.dataset.editing = 'false';
+                    btn.innerHTML = '<i class="bi bi-pencil-square me-1"></i>Edit';
+                    const cancelBtn = row.querySelector('.cancel-btn');
+                    if (cancelBtn) cancelBtn.remove();
+                } else {
+                    alert(json.error || 'Gagal menyimpan perubahan.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menyimpan.'));
+    }
+
+    // CANCEL button
+    if (e.target.matches('.cancel-btn')) {
+        const row = e.target.closest('tr');
+        const btn = row.querySelector('.edit-btn');
+        const namaMkCell = row.querySelector('.nama_mk');
+        const kodeMkCell = row.querySelector('.kode_mk');
+        const sksCell = row.querySelector('.sks');
+        const semesterCell = row.querySelector('.semester');
+        const dosenMkCell = row.querySelector('.dosen_mk');
+
+        namaMkCell.textContent = namaMkCell.dataset.old || namaMkCell.textContent;
+        kodeMkCell.textContent = kodeMkCell.dataset.old || kodeMkCell.textContent;
+        sksCell.textContent = sksCell.dataset.old || sksCell.textContent;
+        semesterCell.textContent = semesterCell.dataset.old || semesterCell.textContent;
+        dosenMkCell.textContent = dosenMkCell.dataset.old || dosenMkCell.textContent;
+
+        btn.dataset.editing = 'false';
+        btn.textContent = 'Edit';
+        e.target.remove();
+    }
+
+    // DELETE button
+    if (e.target.closest('.delete-btn')) {
+        const btn = e.target.closest('.delete-btn');
+        const id = btn.dataset.id;
+        const row = btn.closest('tr');
+        if (!confirm('Hapus data ini?')) return;
+
+        const deleteUrl = btn.dataset.deleteUrl;
+        fetch(deleteUrl, {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': csrftoken,
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({})
+        })
+            .then(r => r.json())
+            .then(json => {
+                if (json.success) {
+                    row.remove();
+                    updateRowNumbers();
+                    window.location.href = window.location.pathname;
+                } else {
+                    alert(json.error || 'Gagal menghapus data.');
+                }
+            })
+            .catch(() => alert('Terjadi kesalahan saat menghapus.'));
+    }
+});
@@ -0,0 +1,185 @@
+"""
+Test suite untuk view dan API mata kuliah
+"""
+
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from .models import MataKuliah
+from dosen.models import Dosen
+from mahasiswa.models import Mahasiswa
+from project1.testing import LoginMixin
+
+
+class MataKuliahQueryCountTests(LoginMixin, TestCase):
+    """Regression test: jumlah query listing/export MataKuliah tidak bergantung jumlah baris"""
+
+    URL_NAMES = [
+        'tampilkan_semua_data',
+        'input_matakuliah',
+        'export_matakuliah_csv',
+        'export_matakuliah_excel',
+        'export_all_data_csv',
+        'export_all_data_excel',
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.counter = 0
+        cache.clear()
+
+    def add_matakuliah(self, jumlah):
+        # on_commit dijalankan supaya versi data naik (fragment cache ikut basi)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._add_matakuliah(jumlah)
+
+    def _add_matakuliah(self, jumlah):
+        for _ in range(jumlah):
+            self.counter += 1
+            dosen = Dosen.objects.create(
+                nama=f'Dosen {self.counter}', nidn=f'00{self.counter:08d}',
+                email=f'dosen{self.counter}@example.com'
+            )
+            mhs = Mahasiswa.objects.create(
+                nama=f'Mahasiswa {self.counter}', npm=f'2023{self.counter:04d}',
+                email=f'mhs{self.counter}@example.com', jurusan='Sains Data'
+            )
+            mk = MataKuliah.objects.create(
+                nama_mk=f'MK {self.counter}', kode_mk=f'MK{self.counter:03d}',
+                sks=3, semester=1, dosen_mk=dosen
+            )
+            mk.mhs_mk.add(mhs)
+
+    def count_queries(self, url_name):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse(url_name))
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_query_count_tetap_untuk_banyak_baris(self):
+        """Test: 1 baris dan 6 baris menjalankan jumlah query yang sama"""
+        self.add_matakuliah(1)
+        sedikit = {name: self.count_queries(name) for name in self.URL_NAMES}
+        self.add_matakuliah(5)
+        banyak = {name: self.count_queries(name) for name in self.URL_NAMES}
+        self.assertEqual(sedikit, banyak)
+
+    def test_jumlah_mahasiswa_annotation(self):
+        """Test: with_summary() menghitung mahasiswa per mata kuliah"""
+        self.add_matakuliah(2)
+        mk = MataKuliah.objects.with_summary().get(kode_mk='MK001')
+        self.assertEqual(mk.jumlah_mahasiswa, 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(mk.dosen_mk.nama, 'Dosen 1')
+
+
+class MataKuliahBulkApiTests(LoginMixin, TestCase):
+    """Test endpoint bulk update mata kuliah"""
+
+    def test_update_foreign_key_matakuliah(self):
+        """Test: dosen_mk dicek sekali untuk seluruh batch"""
+        dosen_a = Dosen.objects.create(nama='Dosen A', nidn='0011', email='a@example.com')
+        dosen_b = Dosen.objects.create(nama='Dosen B', nidn='0022', email='b@example.com')
+        mk = MataKuliah.objects.create(nama_mk='Basis Data', kode_mk='IF101', sks=3, semester=1, dosen_mk=dosen_a)
+        mk2 = MataKuliah.objects.create(nama_mk='Kalkulus', kode_mk='IF102', sks=3, semester=1, dosen_mk=dosen_a)
+        data = self.post_json(reverse('matakuliah_bulk_update'), {'items': [
+            {'pk': mk.pk, 'fields': {'dosen_mk': dosen_b.pk, 'sks': '4'}},
+            {'pk': mk2.pk, 'fields': {'dosen_mk': 99999}},
+        ]}).json()
+        self.assertEqual((data['updated'], data['failed']), (1, 1))
+        mk.refresh_from_db()
+        self.assertEqual((mk.dosen_mk_id, mk.sks), (dosen_b.pk, 4))
+
+
+class EnrolmentApiTests(LoginMixin, TestCase):
+    """Test API enrolment mata kuliah (diff berbasis set) dan picker mahasiswa"""
+
+    def setUp(self):
+        super().setUp()
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        self.mk = MataKuliah.objects.create(nama_mk='Basis Data', kode_mk='BD01', sks=3, semester=3, dosen_mk=dosen)
+        self.mhs = [
+            Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202300{i}', email=f'm{i}@example.com')
+            for i in range(6)
+        ]
+        self.ids = [m.pk for m in self.mhs]
+        self.url = reverse('matakuliah_enrolment', args=[self.mk.pk])
+
+    def post(self, payload):
+        return self.post_json(self.url, payload)
+
+    def enrolled(self):
+        return set(self.mk.mhs_mk.values_list('pk', flat=True))
+
+    def test_add_remove(self):
+        """Test: add/remove diterapkan, id tidak dikenal dilaporkan"""
+        self.mk.mhs_mk.add(*self.ids[:2])
+        data = self.post({'add': self.ids[1:4] + [99999], 'remove': [self.ids[0]]}).json()
+        self.assertEqual((data['added'], data['removed'], data['unknown']), (2, 1, [99999]))
+        self.assertEqual(self.enrolled(), set(self.ids[1:4]))
+
+    def test_set_hanya_menulis_selisih(self):
+        """Test: Set akhir menghasilkan satu DELETE dan satu INSERT saja"""
+        self.mk.mhs_mk.add(*self.ids[:4])
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.post({'set': self.ids[2:]}).json()
+        self.assertEqual((data['added'], data['removed']), (2, 2))
+        self.assertEqual(self.enrolled(), set(self.ids[2:]))
+        writes = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith(('INSERT', 'DELETE'))]
+        self.assertEqual(len(writes), 2)
+
+    def test_payload_tidak_valid(self):
+        """Test: set bersama add/remove atau id bukan angka -> 400"""
+        self.assertEqual(self.post({'set': [], 'add': [1]}).status_code, 400)
+        self.assertEqual(self.post({'add': ['abc']}).status_code, 400)
+        self.assertEqual(self.post({'add': [1], 'remove': [1]}).status_code, 400)
+        # Di luar BIGINT: 400, bukan OverflowError dari database
+        self.assertEqual(self.post({'add': [10 ** 21]}).status_code, 400)
+        self.assertEqual(self.post({'set': [0]}).status_code, 400)
+
+    def test_versi_matakuliah_naik(self):
+        """Test: Perubahan enrolment menaikkan versi data mata kuliah"""
+        from project1.versioning import MATAKULIAH, get_versions
+        before = get_versions([MATAKULIAH])[MATAKULIAH]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post({'add': self.ids[:1]})
+        self.assertGreater(get_versions([MATAKULIAH])[MATAKULIAH], before)
+
+    def test_daftar_enrolment_dan_picker(self):
+        """Test: Daftar enrolment dan picker dipaginasi, picker menandai yang terdaftar"""
+        self.mk.mhs_mk.add(*self.ids[:3])
+        data = self.client.get(self.url, {'per_page': 2}).json()
+        self.assertEqual([row['id'] for row in data['results']], self.ids[:2])
+        self.assertEqual(data['next_cursor'], self.ids[1])
+
+        data = self.client.get(reverse('matakuliah_mahasiswa_options'), {
+            'matakuliah': self.mk.pk, 'after': self.ids[1], 'per_page': 2,
+        }).json()
+        self.assertEqual([(row['id'], row['enrolled']) for row in data['results']],
+                         [(self.ids[2], True), (self.ids[3], False)])
+
+    def test_picker_matakuliah_di_luar_rentang(self):
+        """Test: ?matakuliah= di luar BIGINT diabaikan, bukan OverflowError"""
+        response = self.client.get(reverse('matakuliah_mahasiswa_options'), {'matakuliah': '9' * 23})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any(row['enrolled'] for row in response.json()['results']))
+
+    def test_form_tidak_merender_semua_mahasiswa(self):
+        """Test: Form mata kuliah tidak lagi merender checkbox per mahasiswa"""
+        response = self.client.get(reverse('input_matakuliah'))
+        self.assertNotContains(response, 'Mhs 5 (2023005)')
+        self.assertContains(response, 'id="mhs-picker"')
+
+    def test_form_simpan_lewat_diff(self):
+        """Test: Form create menyimpan mahasiswa terpilih"""
+        response = self.client.post(reverse('input_matakuliah'), {
+            'nama_mk': 'Algoritma', 'kode_mk': 'AL01', 'sks': 3, 'semester': 1,
+            'dosen_mk': self.mk.dosen_mk_id, 'mhs_mk': self.ids[:2],
+        })
+        self.assertEqual(response.status_code, 302)
+        mk = MataKuliah.objects.get(kode_mk='AL01')
+        self.assertEqual(set(mk.mhs_mk.values_list('pk', flat=True)), set(self.ids[:2]))
@@ -1,9 +1,18 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# View baca versi async saat dijalankan di ASGI (settings.ASYNC_VIEWS)
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     path('input/', views.input_matakuliah, name='input_matakuliah'),
     path('update/<int:pk>/', views.matakuliah_update, name='matakuliah_update'),
     path('delete/<int:pk>/', views.matakuliah_delete, name='matakuliah_delete'),
-    path('export/csv/', views.export_matakuliah_csv, name='export_matakuliah_csv'),
+    path('<int:pk>/enrolment/', views.matakuliah_enrolment, name='matakuliah_enrolment'),
+    path('mahasiswa-options/', views.mahasiswa_options, name='matakuliah_mahasiswa_options'),
+    path('bulk-update/', views.matakuliah_bulk_update, name='matakuliah_bulk_update'),
+    path('bulk-delete/', views.matakuliah_bulk_delete, name='matakuliah_bulk_delete'),
+    path('api/list/', read_views.matakuliah_list_api, name='matakuliah_list_api'),
+    path('export/csv/', read_views.export_matakuliah_csv, name='export_matakuliah_csv'),
     path('export/excel/', views.export_matakuliah_excel, name='export_matakuliah_excel'),]
\ No newline at end of file
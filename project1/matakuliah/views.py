@@ -1,26 +1,38 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.http import require_POST, require_http_methods
-from django.views.decorators.cache import never_cache
+from django.views.decorators.cache import cache_control, never_cache
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db import transaction
+from django.db.models import Count, F
 from django.core.exceptions import ValidationError
+from .enrolment import Enrolment, EnrolmentError, apply_changes, parse_changes
 from .forms import MataKuliahForm
 from .models import MataKuliah
+from mahasiswa.models import Mahasiswa
+from mahasiswa.stats import change_counts, remove_counts
+from project1.conditional import conditional_on
+from project1.pagination import is_valid_id, keyset_paginate
+from project1.versioning import MAHASISWA, MATAKULIAH, MATAKULIAH_SUMMARY
+from project1.search import search
+from project1.bulk import bulk_delete_response, bulk_update_response
+from project1.listing import Listing, list_response
+from project1.exports import HAS_OPENPYXL, stream_csv, xlsx_response
+from . import exports as matakuliah_exports
 import json
-import csv
-from datetime import datetime
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import PatternFill, Font, Alignment
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+
+def filter_matakuliah(queryset, params):
+    """Pencarian ?q=; dipakai juga oleh async_views.py dan export_jobs.py"""
+    search_query = params.get('q', '')
+    if search_query:
+        queryset = search(queryset, search_query)
+    return queryset
 
 @login_required(login_url='/admin/login/')
-@never_cache
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
 def input_matakuliah(request):
     pesan = None
     if request.method == 'POST':
@@ -46,18 +58,16 @@ def input_matakuliah(request):
     else:
         form = MataKuliahForm()
 
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    
     # Search
     search_query = request.GET.get('q', '')
-    
-    if search_query:
-        from django.db.models import Q
-        matakuliah = matakuliah.filter(Q(nama_mk__icontains=search_query) | Q(kode_mk__icontains=search_query))
+    matakuliah = filter_matakuliah(MataKuliah.objects.with_summary().order_by('id'), request.GET)
+
+    page = keyset_paginate(request, matakuliah)
 
     return render(request, 'matakuliah/input.html', {
         'form': form,
-        'matakuliah': matakuliah,
+        'matakuliah': page,
+        'page': page,
         'pesan': pesan,
         'search_query': search_query,
     })
@@ -99,11 +109,17 @@ def matakuliah_update(request, pk):
         
         # Validate and save
         matakuliah.full_clean()
-        matakuliah.save()
+        with transaction.atomic():
+            matakuliah.save()
+            # Opsional: {"enrolment": {"add": [...], "remove": [...]}} atau {"set": [...]}
+            enrolment = None
+            if 'enrolment' in data:
+                enrolment = apply_changes(matakuliah, *parse_changes(data['enrolment']))
         
         return JsonResponse({
             'success': True,
-            'message': 'Data berhasil diupdate'
+            'message': 'Data berhasil diupdate',
+            'enrolment': enrolment,
         })
     except json.JSONDecodeError:
         return JsonResponse({
@@ -116,93 +132,137 @@ def matakuliah_update(request, pk):
             'error': str(e)
         }, status=400)
 
+def _mahasiswa_rows(page, enrolled=()):
+    return [
+        {'id': m.pk, 'npm': m.npm, 'nama': m.nama, 'jurusan': m.jurusan, 'enrolled': m.pk in enrolled}
+        for m in page
+    ]
+
+
+def _mahasiswa_page(request, queryset):
+    queryset = queryset.only('id', 'npm', 'nama', 'jurusan')
+    search_query = request.GET.get('q', '').strip()
+    if search_query:
+        queryset = search(queryset, search_query)
+    return keyset_paginate(request, queryset)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(MAHASISWA, MATAKULIAH)
+def mahasiswa_options(request):
+    """
+    Pilihan mahasiswa untuk picker di form mata kuliah, per halaman
+    (?q=, ?after=, ?per_page=). Dengan ?matakuliah=<pk> setiap baris diberi
+    tanda enrolled, dicek hanya untuk id di halaman ini.
+    """
+    page = _mahasiswa_page(request, Mahasiswa.objects.all())
+    enrolled = set()
+    matakuliah_id = request.GET.get('matakuliah', '')
+    if matakuliah_id.isdigit() and is_valid_id(int(matakuliah_id)) and page.object_list:
+        enrolled = set(
+            Enrolment.objects
+            .filter(matakuliah_id=int(matakuliah_id), mahasiswa_id__in=[m.pk for m in page])
+            .values_list('mahasiswa_id', flat=True)
+        )
+    return JsonResponse({
+        'success': True,
+        'results': _mahasiswa_rows(page, enrolled),
+        'next_cursor': page.next_cursor if page.has_next else None,
+    })
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET", "POST"])
+@never_cache
+def matakuliah_enrolment(request, pk):
+    """
+    GET: mahasiswa yang terdaftar di mata kuliah, per halaman (?q=, ?after=).
+    POST: ubah enrolment, body {"add": [id], "remove": [id]} atau {"set": [id]}.
+    """
+    matakuliah = get_object_or_404(MataKuliah, pk=pk)
+    if request.method == 'GET':
+        page = _mahasiswa_page(request, Mahasiswa.objects.filter(matakuliah_set=matakuliah))
+        return JsonResponse({
+            'success': True,
+            'results': _mahasiswa_rows(page, enrolled={m.pk for m in page}),
+            'next_cursor': page.next_cursor if page.has_next else None,
+        })
+
+    try:
+        result = apply_changes(matakuliah, *parse_changes(json.loads(request.body)))
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+    except EnrolmentError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    return JsonResponse({'success': True, **result})
+
+
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
 def export_matakuliah_csv(request):
     """Export matakuliah data to CSV"""
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    if search_query:
-        from django.db.models import Q
-        matakuliah = matakuliah.filter(Q(nama_mk__icontains=search_query) | Q(kode_mk__icontains=search_query))
-    
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="matakuliah_{timestamp}.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['No', 'Nama MK', 'Kode MK', 'SKS', 'Semester', 'Dosen', 'Jumlah Mahasiswa'])
-    
-    for index, mk in enumerate(matakuliah, 1):
-        writer.writerow([
-            index,
-            mk.nama_mk,
-            mk.kode_mk,
-            mk.sks,
-            mk.semester,
-            mk.dosen_mk.nama if mk.dosen_mk else '',
-            mk.mhs_mk.all().count()
-        ])
-    
-    return response
+    matakuliah = filter_matakuliah(MataKuliah.objects.all(), request.GET)
+
+    return stream_csv('matakuliah', matakuliah_exports.HEADERS, matakuliah_exports.export_rows(matakuliah))
 
 
 @login_required(login_url='/admin/login/')
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
 def export_matakuliah_excel(request):
     """Export matakuliah data to Excel"""
     if not HAS_OPENPYXL:
         return HttpResponse("openpyxl library is not installed", status=400)
     
-    matakuliah = MataKuliah.objects.all().order_by('id')
-    
-    search_query = request.GET.get('q', '')
-    if search_query:
-        from django.db.models import Q
-        matakuliah = matakuliah.filter(Q(nama_mk__icontains=search_query) | Q(kode_mk__icontains=search_query))
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Mata Kuliah"
-    
-    # Header styling
-    header_fill = PatternFill(start_color="ffc107", end_color="ffc107", fill_type="solid")
-    header_font = Font(bold=True, color="333333")
-    
-    headers = ['No', 'Nama MK', 'Kode MK', 'SKS', 'Semester', 'Dosen', 'Jumlah Mahasiswa']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    # Data rows
-    for row_num, mk in enumerate(matakuliah, 2):
-        ws.cell(row=row_num, column=1).value = row_num - 1
-        ws.cell(row=row_num, column=2).value = mk.nama_mk
-        ws.cell(row=row_num, column=3).value = mk.kode_mk
-        ws.cell(row=row_num, column=4).value = mk.sks
-        ws.cell(row=row_num, column=5).value = mk.semester
-        ws.cell(row=row_num, column=6).value = mk.dosen_mk.nama if mk.dosen_mk else ''
-        ws.cell(row=row_num, column=7).value = mk.mhs_mk.all().count()
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 5
-    ws.column_dimensions['B'].width = 25
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 8
-    ws.column_dimensions['E'].width = 12
-    ws.column_dimensions['F'].width = 20
-    ws.column_dimensions['G'].width = 18
-    
-    # Create response
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    response['Content-Disposition'] = f'attachment; filename="matakuliah_{timestamp}.xlsx"'
-    wb.save(response)
-    
-    return response
\ No newline at end of file
+    matakuliah = filter_matakuliah(MataKuliah.objects.all(), request.GET)
+
+    return xlsx_response('matakuliah', [matakuliah_exports.excel_sheet(matakuliah)])
+
+
+# Field yang boleh diubah lewat matakuliah_bulk_update
+BULK_EDITABLE_FIELDS = ('nama_mk', 'kode_mk', 'sks', 'semester', 'dosen_mk')
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def matakuliah_bulk_update(request):
+    """
+    Update banyak matakuliah sekaligus.
+    Body: {"items": [{"pk": 1, "fields": {...}}], "atomic": false}
+    """
+    return bulk_update_response(request, MataKuliah, BULK_EDITABLE_FIELDS, on_updated=change_counts)
+
+
+@login_required(login_url='/admin/login/')
+@require_POST
+@never_cache
+def matakuliah_bulk_delete(request):
+    """Hapus banyak matakuliah sekaligus. Body: {"pks": [1, 2, 3]}"""
+    return bulk_delete_response(request, MataKuliah, on_deleted=remove_counts)
+
+
+def _listing_queryset():
+    return MataKuliah.objects.annotate(dosen=F('dosen_mk__nama'), jumlah_mahasiswa=Count('mhs_mk'))
+
+
+LISTING = Listing(
+    _listing_queryset,
+    columns=('id', 'nama_mk', 'kode_mk', 'sks', 'semester', 'dosen', 'jumlah_mahasiswa'),
+    sortable=('nama_mk', 'kode_mk', 'sks', 'semester', 'dosen', 'jumlah_mahasiswa'),
+    filters=('semester',),
+)
+
+
+@login_required(login_url='/admin/login/')
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@conditional_on(*MATAKULIAH_SUMMARY)
+def matakuliah_list_api(request):
+    """Daftar mata kuliah per halaman dalam format kolom (lihat project1/listing.py)"""
+    return list_response(request, LISTING)
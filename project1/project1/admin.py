@@ -0,0 +1,49 @@
+"""
+Bagian bersama untuk ModelAdmin mahasiswa, dosen dan matakuliah.
+
+search_fields bawaan admin menjalankan LIKE '%q%' pada setiap kolom, yang
+tidak bisa memakai index. SearchAdminMixin memakai backend pencarian
+aplikasi (project1/search.py: FTS5 di SQLite, full-text + trigram di
+PostgreSQL) sehingga kode (npm/nidn/kode_mk) dicocokkan sebagai prefix dan
+nama per kata. Dipakai juga oleh autocomplete_fields.
+
+Hasil pencarian diurutkan dari yang paling relevan (search_rank), kecuali
+user memilih urutan sendiri dengan mengklik header kolom.
+"""
+
+from django.contrib.admin.views.main import ORDER_VAR
+
+from project1.search import rank, search_fields
+
+
+class SearchAdminMixin:
+    """
+    code_search_mode:
+    - 'prefix' (default): kode dicocokkan sebagai prefix oleh backend
+    - 'exact': kata kunci yang persis sama dengan kode dicari lewat unique
+      index dulu; jika tidak ada, diserahkan ke backend
+    email_search_field: kata kunci berisi '@' dicocokkan persis dengan field
+    ini (email disimpan lowercase, lihat validation.py), None = nonaktif.
+    search_fields tetap diisi: admin membutuhkannya untuk menampilkan kotak
+    pencarian dan untuk autocomplete_fields di admin lain.
+    """
+
+    code_search_mode = 'prefix'
+    email_search_field = None
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        if self.email_search_field and '@' in term:
+            return queryset.filter(**{self.email_search_field: term.lower()}), False
+        if self.code_search_mode == 'exact':
+            code, _ = search_fields(self.model)
+            exact = queryset.filter(**{code: term})
+            if exact.exists():
+                return exact, False
+        ranked = rank(queryset, term)
+        if request.GET.get(ORDER_VAR):
+            # Changelist sudah mengurutkan sesuai kolom yang diklik user
+            ranked = ranked.order_by(*queryset.query.order_by)
+        return ranked, False
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project1.settings')
+# Pakai view async untuk JSON dan export CSV (lihat ASYNC_VIEWS di settings)
+os.environ.setdefault('ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
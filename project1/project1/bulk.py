@@ -0,0 +1,351 @@
+"""
+Bulk update dan bulk delete untuk endpoint JSON mahasiswa, dosen dan
+matakuliah.
+
+Bulk update menerima {"items": [{"pk": 1, "fields": {...}}, ...]}:
+- semua target diambil dengan satu query in_bulk; pk yang sama tidak
+  boleh muncul dua kali
+- nilai dari JSON dikonversi dengan field.to_python() sebelum dipasang,
+  tipe yang salah (list/object, null) dilaporkan per item
+- setiap objek divalidasi dengan full_clean() tanpa validasi unique dan
+  tanpa cek foreign key per baris
+- keunikan dan foreign key dicek sekali per field untuk seluruh batch
+- perubahan disimpan dengan satu bulk_update di dalam satu transaksi
+
+Bulk delete menerima {"pks": [1, 2, ...]}; data yang masih dirujuk relasi
+PROTECT dilaporkan per item, sisanya dihapus dengan satu delete(). Handler
+post_delete per baris (statistik dashboard, versi data) dilewati selama
+delete() itu (bulk_deleting()); hitungan dikurangi sekali lewat on_deleted
+dan versi data dinaikkan sekali setelah commit.
+
+Item yang gagal dilaporkan per pk; item valid tetap disimpan kecuali
+payload berisi "atomic": true (semua atau tidak sama sekali).
+"""
+
+import json
+from collections import defaultdict
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+from django.http import JsonResponse
+from django.utils.text import capfirst
+
+from project1.pagination import is_valid_id
+from project1.versioning import bump_version
+
+DEFAULT_MAX_ITEMS = 500
+
+# Label field pada pesan error (default: verbose_name)
+FIELD_LABELS = {'npm': 'NPM', 'nidn': 'NIDN', 'kode_mk': 'Kode MK'}
+
+
+_bulk_deleting = ContextVar('bulk_deleting', default=False)
+
+
+def bulk_deleting():
+    """True selama delete() milik bulk_delete() berjalan"""
+    return _bulk_deleting.get()
+
+
+class BulkRequestError(ValueError):
+    """Payload bulk tidak valid (format JSON, jumlah item, dll)"""
+
+
+class BulkResult:
+    def __init__(self):
+        self.results = {}
+
+    def ok(self, pk):
+        self.results[pk] = {'pk': pk, 'success': True}
+
+    def skip(self, pks):
+        for pk in pks:
+            self.fail(pk, 'Tidak diproses karena ada item lain yang gagal (atomic)')
+
+    def fail(self, pk, errors):
+        if isinstance(errors, str):
+            errors = {'__all__': [errors]}
+        self.results[pk] = {'pk': pk, 'success': False, 'errors': errors}
+
+    @property
+    def succeeded(self):
+        return [pk for pk, item in self.results.items() if item['success']]
+
+    @property
+    def failed(self):
+        return [pk for pk, item in self.results.items() if not item['success']]
+
+    def as_dict(self, count_name):
+        return {
+            'success': not self.failed,
+            count_name: len(self.succeeded),
+            'failed': len(self.failed),
+            'results': list(self.results.values()),
+        }
+
+
+def _max_items():
+    return getattr(settings, 'BULK_MAX_ITEMS', DEFAULT_MAX_ITEMS)
+
+
+def parse_payload(request, key):
+    """Ambil list payload[key] dari body JSON request"""
+    try:
+        payload = json.loads(request.body)
+    except json.JSONDecodeError:
+        raise BulkRequestError('Invalid JSON format')
+    if not isinstance(payload, dict) or not isinstance(payload.get(key), list):
+        raise BulkRequestError(f'Payload harus berupa object dengan list "{key}"')
+    items = payload[key]
+    if not items:
+        raise BulkRequestError(f'"{key}" tidak boleh kosong')
+    if len(items) > _max_items():
+        raise BulkRequestError(f'Maksimal {_max_items()} item per request')
+    return items, bool(payload.get('atomic'))
+
+
+def _as_pk(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if is_valid_id(value) else None
+
+
+def _clean_value(field, value):
+    """Nilai JSON -> tipe Python field, ValidationError jika tipenya salah"""
+    if isinstance(value, (list, dict)):
+        raise ValidationError('Nilai harus berupa teks atau angka')
+    if value is None:
+        if not field.null:
+            raise ValidationError('Nilai tidak boleh null')
+        return None
+    value = field.to_python(value)
+    if field.is_relation and not is_valid_id(value):
+        raise ValidationError(f'{field.related_model._meta.verbose_name} tidak ditemukan')
+    return value
+
+
+def _unique_fields(model):
+    return [f for f in model._meta.concrete_fields if f.unique and not f.primary_key]
+
+
+def _field_label(field):
+    return FIELD_LABELS.get(field.name, capfirst(field.verbose_name))
+
+
+def _taken_errors(model, objects):
+    """Nilai unique yang sudah dipakai data lain: satu query per field unique"""
+    errors = defaultdict(dict)
+    for field in _unique_fields(model):
+        values = {getattr(obj, field.attname) for obj in objects.values()}
+        taken = set(
+            model.objects.filter(**{f'{field.attname}__in': list(values)})
+            .exclude(pk__in=list(objects)).values_list(field.attname, flat=True)
+        )
+        for obj in objects.values():
+            value = getattr(obj, field.attname)
+            if value in taken:
+                errors[obj.pk][field.name] = [f'{_field_label(field)} {value} sudah terdaftar di sistem']
+    return errors
+
+
+def _check_unique(model, objects, result, unique_errors=None):
+    """
+    Cek bentrok dengan data lain untuk seluruh batch, lalu duplikat di dalam
+    batch. unique_errors(objects) -> {pk: {field: [pesan]}} bisa diganti per
+    model (misalnya satu query untuk semua field unique).
+    """
+    taken = unique_errors(objects) if unique_errors else _taken_errors(model, objects)
+    for pk, errors in taken.items():
+        result.fail(pk, errors)
+
+    for field in _unique_fields(model):
+        owners = defaultdict(list)
+        for obj in objects.values():
+            owners[getattr(obj, field.attname)].append(obj.pk)
+        for value, pks in owners.items():
+            if len(pks) < 2:
+                continue
+            for pk in pks:
+                if pk not in taken:
+                    result.fail(pk, {field.name: [f'{_field_label(field)} {value} duplikat di dalam batch']})
+
+
+def _check_foreign_keys(model, objects, fields, result):
+    """Pastikan target foreign key ada, satu query per field"""
+    for field in fields:
+        ids = {getattr(obj, field.attname) for obj in objects.values()}
+        existing = set(
+            field.related_model._base_manager.filter(pk__in=ids).values_list('pk', flat=True)
+        )
+        for obj in objects.values():
+            if getattr(obj, field.attname) not in existing:
+                result.fail(obj.pk, {field.name: [f'{field.related_model._meta.verbose_name} tidak ditemukan']})
+
+
+def bulk_update(model, items, editable_fields, atomic=False, on_updated=None, unique_errors=None):
+    """
+    Terapkan patch items ke model. editable_fields: nama field yang boleh
+    diubah (untuk ForeignKey pakai nama field, nilainya pk target).
+    unique_errors: lihat _check_unique(). on_updated(model, instances)
+    dipanggil di dalam transaksi bulk_update; nilai sebelum patch ada di
+    instance.loaded_values (LoadedValuesMixin).
+    """
+    result = BulkResult()
+    fields = {name: model._meta.get_field(name) for name in editable_fields}
+    fk_names = [name for name, field in fields.items() if isinstance(field, models.ForeignKey)]
+
+    patches = {}
+    duplicates = set()
+    for item in items:
+        pk = _as_pk(item.get('pk')) if isinstance(item, dict) else None
+        changes = item.get('fields') if isinstance(item, dict) else None
+        if pk is None or not isinstance(changes, dict):
+            raise BulkRequestError('Setiap item harus berisi "pk" (id positif) dan object "fields"')
+        if pk in patches or pk in result.results:
+            duplicates.add(pk)
+            continue
+        unknown = set(changes) - set(fields)
+        if unknown:
+            result.fail(pk, f'Field tidak bisa diubah: {", ".join(sorted(unknown))}')
+            continue
+        patches[pk] = changes
+    # Patch mana yang berlaku tidak jelas: semua item dengan pk itu ditolak
+    for pk in duplicates:
+        patches.pop(pk, None)
+        result.fail(pk, 'pk muncul lebih dari sekali di dalam items')
+
+    objects = model.objects.in_bulk(list(patches))
+    changed_fields = set()
+    for pk, changes in patches.items():
+        obj = objects.get(pk)
+        if obj is None:
+            result.fail(pk, 'Data tidak ditemukan')
+            continue
+        errors = {}
+        for name, value in changes.items():
+            try:
+                value = _clean_value(fields[name], value)
+            except ValidationError as e:
+                errors[name] = e.messages
+                continue
+            setattr(obj, fields[name].attname, value)
+            changed_fields.add(fields[name].attname)
+        if errors:
+            result.fail(pk, errors)
+            del objects[pk]
+            continue
+        try:
+            # Unique dan foreign key dicek per batch di bawah
+            obj.full_clean(exclude=fk_names, validate_unique=False)
+        except ValidationError as e:
+            result.fail(pk, e.message_dict)
+            del objects[pk]
+
+    fk_fields = [fields[name] for name in fk_names if fields[name].attname in changed_fields]
+    _check_foreign_keys(model, objects, fk_fields, result)
+    objects = {pk: obj for pk, obj in objects.items() if pk not in result.results}
+    _check_unique(model, objects, result, unique_errors)
+
+    valid = [obj for pk, obj in objects.items() if pk not in result.results]
+    if atomic and result.failed:
+        result.skip(obj.pk for obj in valid)
+        return result
+    if valid and changed_fields:
+        try:
+            with transaction.atomic():
+                model.objects.bulk_update(valid, sorted(changed_fields))
+                # bulk_update tidak mengirim signal post_save
+                if on_updated:
+                    on_updated(model, valid)
+                transaction.on_commit(lambda: bump_version(model._meta.label_lower))
+        except IntegrityError as e:
+            for obj in valid:
+                result.fail(obj.pk, f'Gagal menyimpan: {e}')
+            return result
+    for obj in valid:
+        result.ok(obj.pk)
+    return result
+
+
+def protected_pks(model, pks):
+    """{pk: [nama model perujuk]} untuk pk yang masih dirujuk relasi PROTECT"""
+    protected = defaultdict(list)
+    for relation in model._meta.related_objects:
+        if relation.on_delete is not models.PROTECT:
+            continue
+        field = relation.field
+        referenced = (
+            relation.related_model._base_manager.filter(**{f'{field.attname}__in': pks})
+            .values_list(field.attname, flat=True).distinct()
+        )
+        for pk in referenced:
+            protected[pk].append(str(relation.related_model._meta.verbose_name_plural))
+    return protected
+
+
+def bulk_delete(model, pks, atomic=False, on_deleted=None):
+    """
+    on_deleted(model, instances) dipanggil di dalam transaksi delete dengan
+    instance yang dihapus (field tracked_fields ikut dimuat).
+    """
+    result = BulkResult()
+    clean_pks = []
+    for value in pks:
+        pk = _as_pk(value)
+        if pk is None:
+            raise BulkRequestError('"pks" harus berisi id (bilangan bulat positif)')
+        clean_pks.append(pk)
+
+    existing = model.objects.only('pk', *getattr(model, 'tracked_fields', ())).in_bulk(clean_pks)
+    protected = protected_pks(model, list(existing))
+    deletable = []
+    for pk in clean_pks:
+        if pk not in existing:
+            result.fail(pk, 'Data tidak ditemukan')
+        elif pk in protected:
+            result.fail(pk, f'Data masih dipakai oleh {", ".join(protected[pk])}')
+        else:
+            deletable.append(pk)
+
+    if atomic and result.failed:
+        result.skip(deletable)
+        return result
+    if deletable:
+        token = _bulk_deleting.set(True)
+        try:
+            with transaction.atomic():
+                model.objects.filter(pk__in=deletable).delete()
+                if on_deleted:
+                    on_deleted(model, [existing[pk] for pk in deletable])
+                transaction.on_commit(lambda: bump_version(model._meta.label_lower))
+        finally:
+            _bulk_deleting.reset(token)
+    for pk in deletable:
+        result.ok(pk)
+    return result
+
+
+def bulk_update_response(request, model, editable_fields, on_updated=None, unique_errors=None):
+    try:
+        items, atomic = parse_payload(request, 'items')
+        result = bulk_update(
+            model, items, editable_fields, atomic=atomic, on_updated=on_updated, unique_errors=unique_errors,
+        )
+    except BulkRequestError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    return JsonResponse(result.as_dict('updated'))
+
+
+def bulk_delete_response(request, model, on_deleted=None):
+    try:
+        pks, atomic = parse_payload(request, 'pks')
+        result = bulk_delete(model, pks, atomic=atomic, on_deleted=on_deleted)
+    except BulkRequestError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    return JsonResponse(result.as_dict('deleted'))
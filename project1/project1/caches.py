@@ -0,0 +1,44 @@
+"""
+Setting cache (alias 'default' dan 'sessions') untuk settings.py.
+
+Alias 'default' menyimpan versi data (project1/versioning.py) yang menjadi
+ETag listing/export, kunci fragment {% cache %} dan dedupe_key ExportJob,
+serta statistik dashboard. Nilai ini harus sama di semua worker: dengan
+locmem, perubahan yang ditangani worker A hanya menaikkan versi di A dan
+worker B tetap menjawab 304 dengan data lama. Karena itu default-nya
+FileBasedCache di STATE_DIR yang dipakai bersama semua worker di satu host.
+
+    DEFAULT_CACHE=file|locmem, DEFAULT_CACHE_LOCATION=<direktori>
+    SESSION_CACHE=file|locmem, SESSION_CACHE_LOCATION=<direktori>
+
+locmem hanya untuk satu proses (runserver, manage.py test). Deployment
+beberapa host membutuhkan cache jaringan (Redis/Memcached) di CACHES.
+"""
+
+import os
+
+from project1.environment import env_value
+
+CACHE_BACKENDS = {
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+}
+
+
+def cache_setting(prefix, default_location, env=os.environ, default_backend='file', **extra):
+    """Satu entri CACHES dari <prefix>=file|locmem dan <prefix>_LOCATION"""
+    backend = env_value(env, prefix, default_backend)
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f'{prefix} tidak dikenal: {backend} (pilihan: {", ".join(CACHE_BACKENDS)})')
+    if backend == 'locmem':
+        location = 'project1-' + prefix.lower()
+    else:
+        location = str(env_value(env, f'{prefix}_LOCATION', default_location))
+    return {'BACKEND': CACHE_BACKENDS[backend], 'LOCATION': location, **extra}
+
+
+def default_cache(default_location, env=os.environ, default_backend='file'):
+    """Setting cache alias 'default' (DEFAULT_CACHE=file|locmem)"""
+    # Versi data disimpan tanpa kedaluwarsa; entri lain memakai timeout sendiri
+    return cache_setting('DEFAULT_CACHE', default_location, env, default_backend,
+                         OPTIONS={'MAX_ENTRIES': 10000})
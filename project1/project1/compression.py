@@ -0,0 +1,231 @@
+"""
+Kompresi response (gzip/brotli) dan minify HTML.
+
+CompressionMiddleware dipasang tepat di bawah RequestProfilingMiddleware
+(sebelum middleware lain yang membaca/mengubah body):
+
+- encoding dipilih dari Accept-Encoding (termasuk q=0): br jika paket
+  brotli terpasang dan diterima client, selain itu gzip
+- hanya tipe teks (HTML, CSV, JSON, JS, CSS, SVG, ...); XLSX, gambar dan
+  response yang sudah punya Content-Encoding (static .gz/.br) dilewati
+- response biasa di bawah COMPRESSION_MIN_SIZE byte tidak dikompresi
+- StreamingHttpResponse (export CSV, termasuk versi async) dikompresi per
+  potongan tanpa membaca seluruh body ke memori
+- gzip memakai compress_string/compress_sequence Django yang menambah
+  byte acak di header gzip (mitigasi BREACH)
+
+HTML_MINIFY=True merapatkan whitespace HTML (di luar pre, textarea,
+script dan style) sebelum dikompresi.
+
+Ukuran sebelum/sesudah disimpan di request.compression dan dilaporkan oleh
+RequestProfilingMiddleware (Server-Timing + log). Untuk response streaming
+ukuran belum diketahui saat header dikirim, jadi tidak dilaporkan.
+"""
+
+import re
+from importlib.util import find_spec
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+
+# Cek ketersediaan tanpa meng-import; brotli baru di-import saat dipakai
+HAS_BROTLI = find_spec('brotli') is not None
+
+DEFAULT_MIN_SIZE = 1024
+
+# Byte acak maksimum di header gzip, sama dengan GZipMiddleware Django
+MAX_RANDOM_BYTES = 100
+
+# Kualitas brotli untuk response dinamis (11 terlalu lambat per request)
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+)
+
+PRESERVE_RE = re.compile(r'<(pre|textarea|script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+# Hanya whitespace ASCII: &nbsp; (U+00A0) tetap utuh
+WHITESPACE_RE = re.compile(r'[ \t\r\n\f]{2,}|[\t\r\n\f]')
+
+
+def _collapse(text):
+    return WHITESPACE_RE.sub(lambda match: '\n' if '\n' in match.group() else ' ', text)
+
+
+def minify_html(html):
+    """Rapatkan whitespace berurutan menjadi satu spasi/baris baru, kecuali di pre/textarea/script/style"""
+    parts = []
+    position = 0
+    for match in PRESERVE_RE.finditer(html):
+        parts.append(_collapse(html[position:match.start()]))
+        parts.append(match.group())
+        position = match.end()
+    parts.append(_collapse(html[position:]))
+    return ''.join(parts)
+
+
+def accepted_encodings(header):
+    """{encoding: q} dari header Accept-Encoding"""
+    accepted = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        if not name:
+            continue
+        quality = 1.0
+        match = re.search(r'q=([0-9.]+)', params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(header):
+    """'br', 'gzip' atau None sesuai Accept-Encoding dan brotli yang tersedia"""
+    accepted = accepted_encodings(header)
+    candidates = ('br', 'gzip') if HAS_BROTLI else ('gzip',)
+    for encoding in candidates:
+        if accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def _brotli_sequence(sequence):
+    import brotli
+
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        # flush agar client menerima data setiap potongan, bukan di akhir
+        data += compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _abrotli_sequence(sequence):
+    import brotli
+
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _agzip_sequence(sequence):
+    # Sama dengan GZipMiddleware Django: setiap potongan satu member gzip
+    async for chunk in sequence:
+        yield compress_string(chunk, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+def compress_body(content, encoding):
+    if encoding == 'br':
+        import brotli
+
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return compress_string(content, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+def compress_stream(response, encoding):
+    """Bungkus streaming_content (sync/async) dengan kompresor"""
+    original = response.streaming_content
+    if response.is_async:
+        wrapper = _abrotli_sequence if encoding == 'br' else _agzip_sequence
+        response.streaming_content = wrapper(original)
+    elif encoding == 'br':
+        response.streaming_content = _brotli_sequence(original)
+    else:
+        response.streaming_content = compress_sequence(original, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+def _is_compressible(response):
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def minify_response(response):
+    html = response.content.decode(response.charset)
+    response.content = minify_html(html).encode(response.charset)
+    if response.has_header('Content-Length'):
+        response['Content-Length'] = str(len(response.content))
+
+
+def _is_html(response):
+    return response.get('Content-Type', '').lower().startswith('text/html')
+
+
+class CompressionMiddleware:
+    """
+    Pengaturan (settings.py):
+
+    - COMPRESSION_MIN_SIZE: ukuran minimal (byte) response biasa yang dikompresi
+    - HTML_MINIFY: rapatkan whitespace HTML sebelum dikirim
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or not _is_compressible(response):
+            return response
+
+        sizes = {}
+        if not response.streaming:
+            sizes['original_bytes'] = len(response.content)
+            if _is_html(response) and getattr(settings, 'HTML_MINIFY', False):
+                minify_response(response)
+            sizes['sent_bytes'] = len(response.content)
+            # Dibaca RequestProfilingMiddleware
+            request.compression = sizes
+
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            compress_stream(response, encoding)
+            # Panjang hasil kompresi belum diketahui
+            response.headers.pop('Content-Length', None)
+        else:
+            if sizes['sent_bytes'] < getattr(settings, 'COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE):
+                return response
+            compressed = compress_body(response.content, encoding)
+            if len(compressed) >= sizes['sent_bytes']:
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+            sizes.update(encoding=encoding, sent_bytes=len(compressed))
+
+        # Isi berbeda per encoding: ETag kuat menjadi lemah (seperti GZipMiddleware)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,79 @@
+"""
+Conditional GET (ETag / 304 Not Modified) berbasis versi data.
+
+ETag dihitung dari versi entitas terkait (project1/versioning.py, dibaca
+dari cache), path + query string, user dan cookie CSRF. Jika browser
+mengirim If-None-Match yang sama, view tidak dijalankan sama sekali dan
+response 304 dikirim tanpa menyentuh tabel data.
+
+Halaman dengan pesan flash yang belum ditampilkan tidak diberi ETag agar
+pesan tersebut selalu dirender.
+
+Untuk view async, ETag dihitung di thread sinkron (user, sesi dan pesan
+flash dibaca lewat ORM sinkron) sebelum @condition memeriksa header.
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.views.decorators.http import condition
+
+from project1.versioning import version_token
+
+# Berbeda setiap proses dijalankan, jadi ETag lama tidak berlaku lagi
+# setelah deploy (template/kode bisa berubah walau data sama)
+PROCESS_SALT = str(time.time_ns())
+
+
+def has_pending_messages(request):
+    # len() tidak menandai pesan sebagai sudah dibaca
+    storage = getattr(request, '_messages', None)
+    return storage is not None and len(storage) > 0
+
+
+def data_etag(*labels):
+    """etag_func untuk @condition dari versi data labels"""
+
+    def etag_func(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or has_pending_messages(request):
+            return None
+        user = getattr(request, 'user', None)
+        parts = [
+            PROCESS_SALT,
+            version_token(labels),
+            request.path,
+            repr(sorted(request.GET.lists())),
+            str(user.pk if user is not None and user.is_authenticated else ''),
+            # Token CSRF di form halaman lama harus tetap cocok dengan cookie
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+        ]
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+    return etag_func
+
+
+def _precomputed_etag(request, *args, **kwargs):
+    return request._data_etag
+
+
+def conditional_on(*labels):
+    """Decorator view (sync/async): kirim 304 selama versi data labels tidak berubah"""
+    etag_func = data_etag(*labels)
+
+    def decorator(view):
+        if not iscoroutinefunction(view):
+            return condition(etag_func=etag_func)(view)
+
+        conditional_view = condition(etag_func=_precomputed_etag)(view)
+
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            request._data_etag = await sync_to_async(etag_func)(request, *args, **kwargs)
+            return await conditional_view(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
@@ -0,0 +1,128 @@
+"""
+Profil konfigurasi database, dipilih di settings.py lewat environment
+variable DB_PROFILE.
+
+- sqlite (default): SQLite dengan WAL dan pragma untuk beban web, koneksi
+  dipakai ulang antar request (CONN_MAX_AGE).
+- sqlite-basic: SQLite dengan pengaturan bawaan Django (koneksi baru per
+  request, journal rollback). Dipakai sebagai pembanding di benchmark.
+- postgres: PostgreSQL (psycopg 3) dari POSTGRES_* di environment, dengan
+  connection pool psycopg (DB_POOL=1, default) atau koneksi persisten
+  (DB_POOL=0). Lihat README.md.
+
+Di bawah ASGI (ASYNC_VIEWS=1, default di asgi.py) CONN_MAX_AGE default 0:
+setiap request async memakai thread sendiri, sehingga koneksi persisten
+tidak dipakai ulang dan hanya menumpuk (lihat dokumentasi Django, "Async
+support"). DB_CONN_MAX_AGE tetap bisa menimpanya.
+
+Pragma dijalankan lewat OPTIONS['init_command'] setiap kali Django membuka
+koneksi baru. journal_mode=WAL tersimpan di file database, pragma lain
+berlaku per koneksi.
+"""
+
+import os
+
+from project1.environment import env_value
+
+# Nilai default, bisa ditimpa dengan SQLITE_<NAMA> di environment,
+# contoh SQLITE_CACHE_SIZE=-131072
+SQLITE_PRAGMAS = {
+    # Pembaca tidak memblok penulis dan sebaliknya
+    'journal_mode': 'WAL',
+    # Aman untuk WAL: commit terakhir bisa hilang saat listrik mati, file tidak rusak
+    'synchronous': 'NORMAL',
+    # Negatif = KiB, jadi -65536 = 64 MiB page cache per koneksi
+    'cache_size': -65536,
+    # Baca file lewat memory map (256 MiB)
+    'mmap_size': 268435456,
+    # Tunggu lock penulis lain sampai 5 detik sebelum "database is locked"
+    'busy_timeout': 5000,
+    'temp_store': 'MEMORY',
+}
+
+DEFAULT_CONN_MAX_AGE = 600
+
+
+def conn_max_age(env=os.environ):
+    """DB_CONN_MAX_AGE, default 600 detik di WSGI dan 0 di ASGI"""
+    default = 0 if env.get('ASYNC_VIEWS') == '1' else DEFAULT_CONN_MAX_AGE
+    return int(env_value(env, 'DB_CONN_MAX_AGE', default))
+
+
+def sqlite_pragmas(env=os.environ):
+    return {name: env_value(env, f'SQLITE_{name.upper()}', value) for name, value in SQLITE_PRAGMAS.items()}
+
+
+def sqlite_database(name, env=os.environ):
+    """Setting database SQLite dengan WAL, pragma dan koneksi persisten"""
+    pragmas = sqlite_pragmas(env)
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {key}={value}' for key, value in pragmas.items()),
+            # BEGIN IMMEDIATE: transaksi tulis mengambil lock di awal, jadi
+            # menunggu busy_timeout alih-alih gagal saat upgrade read -> write
+            'transaction_mode': 'IMMEDIATE',
+            # Busy handler bawaan modul sqlite3 (detik), disamakan dengan busy_timeout
+            'timeout': int(pragmas['busy_timeout']) / 1000,
+        },
+        'CONN_MAX_AGE': conn_max_age(env),
+        'CONN_HEALTH_CHECKS': True,
+    }
+
+
+def sqlite_basic_database(name, env=os.environ):
+    """Pengaturan bawaan Django, tanpa tuning"""
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+    }
+
+
+def postgres_database(name, env=os.environ):
+    """
+    Setting PostgreSQL dari environment. name (path SQLite) diabaikan.
+    Pool butuh paket psycopg[pool]; Django mewajibkan CONN_MAX_AGE = 0
+    saat pool aktif karena koneksi dikembalikan ke pool setiap request.
+    """
+    config = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env_value(env, 'POSTGRES_DB', 'project1'),
+        'USER': env_value(env, 'POSTGRES_USER', 'project1'),
+        'PASSWORD': env_value(env, 'POSTGRES_PASSWORD', ''),
+        'HOST': env_value(env, 'POSTGRES_HOST', 'localhost'),
+        'PORT': env_value(env, 'POSTGRES_PORT', '5432'),
+        'OPTIONS': {},
+    }
+    if env_value(env, 'DB_POOL', '1') not in ('0', 'false', 'no'):
+        config['OPTIONS']['pool'] = {
+            'min_size': int(env_value(env, 'DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(env_value(env, 'DB_POOL_MAX_SIZE', 10)),
+            # Detik menunggu koneksi kosong sebelum error
+            'timeout': float(env_value(env, 'DB_POOL_TIMEOUT', 10)),
+        }
+        config['CONN_MAX_AGE'] = 0
+    else:
+        config['CONN_MAX_AGE'] = conn_max_age(env)
+        config['CONN_HEALTH_CHECKS'] = True
+    return config
+
+
+PROFILES = {
+    'sqlite': sqlite_database,
+    'sqlite-basic': sqlite_basic_database,
+    'postgres': postgres_database,
+}
+
+
+def is_postgres(config):
+    return config['ENGINE'] == 'django.db.backends.postgresql'
+
+
+def database_from_env(default_sqlite_path, env=os.environ):
+    """DATABASES['default'] sesuai DB_PROFILE (default: sqlite)"""
+    profile = env_value(env, 'DB_PROFILE', 'sqlite')
+    if profile not in PROFILES:
+        raise ValueError(f'DB_PROFILE tidak dikenal: {profile} (pilihan: {", ".join(PROFILES)})')
+    return PROFILES[profile](env_value(env, 'SQLITE_PATH', default_sqlite_path), env)
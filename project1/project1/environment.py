@@ -0,0 +1,10 @@
+"""
+Pembacaan environment variable untuk profil di settings.py (database.py,
+caches.py, sessions.py).
+"""
+
+
+def env_value(env, name, default):
+    """env[name], atau default jika tidak ada atau kosong"""
+    value = env.get(name)
+    return default if value in (None, '') else value
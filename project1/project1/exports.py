@@ -0,0 +1,249 @@
+"""
+Utilitas export bersama untuk app mahasiswa, dosen dan matakuliah.
+
+CSV ditulis secara streaming: baris diambil dari queryset.values_list()
+dengan .iterator(chunk_size=...), sehingga tidak ada instance model yang
+dibuat dan memori worker tetap datar berapa pun jumlah datanya. View async
+memakai pasangan a* (anumbered_rows, astream_csv) dengan
+QuerySet.aiterator(chunk_size=...): Django mengambil setiap potongan baris
+di thread sinkron, jadi event loop tidak ikut menunggu database.
+
+Excel ditulis dengan workbook openpyxl mode write_only ke file sementara,
+lalu dikirim dengan FileResponse. openpyxl baru di-import saat export Excel
+pertama (lihat manage.py startup_profile), bukan saat worker start.
+"""
+
+import csv
+import tempfile
+from datetime import datetime
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+
+# Cek ketersediaan tanpa meng-import (import openpyxl ~70 ms)
+HAS_OPENPYXL = find_spec('openpyxl') is not None
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Jumlah baris yang diambil dari database per fetch
+DEFAULT_EXPORT_CHUNK_SIZE = 2000
+
+# Ukuran minimal (karakter) sebelum potongan CSV dikirim ke client
+CSV_FLUSH_SIZE = 64 * 1024
+
+
+class Echo:
+    """
+    Pseudo-buffer untuk csv.writer: write() langsung mengembalikan
+    baris yang sudah diformat, bukan menyimpannya di memori.
+    """
+
+    def write(self, value):
+        return value
+
+
+def get_chunk_size():
+    return getattr(settings, 'EXPORT_CHUNK_SIZE', DEFAULT_EXPORT_CHUNK_SIZE)
+
+
+def export_filename(prefix, extension):
+    """Nama file export dengan timestamp, contoh: mahasiswa_20260120_143025.csv"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f'{prefix}_{timestamp}.{extension}'
+
+
+def numbered_rows(queryset, chunk_size=None):
+    """
+    Iterasi tuple dari queryset.values_list() dan tambahkan kolom No
+    di depan setiap baris.
+    """
+    rows = queryset.iterator(chunk_size=chunk_size or get_chunk_size())
+    for index, row in enumerate(rows, 1):
+        yield (index, *row)
+
+
+async def anumbered_rows(queryset, chunk_size=None):
+    """
+    numbered_rows() untuk view async, baris diambil dengan aiterator().
+    queryset harus values_list(..., named=True): pada values_list() biasa
+    Django menjalankan query saat aiterator() dimulai, masih di event loop
+    (SynchronousOnlyOperation); versi named baru query di thread sinkron.
+    """
+    index = 0
+    async for row in queryset.aiterator(chunk_size=chunk_size or get_chunk_size()):
+        index += 1
+        yield (index, *row)
+
+
+class CsvChunks:
+    """
+    Penyusun potongan teks CSV bersama untuk iter_csv() dan aiter_csv().
+    Baris dikumpulkan hingga CSV_FLUSH_SIZE agar server tidak menulis
+    satu syscall per baris.
+    """
+
+    def __init__(self):
+        self.writer = csv.writer(Echo())
+        self.buffer = []
+        self.size = 0
+
+    def section(self, position, title, headers):
+        """Pembuka section; selalu dikirim segera (time-to-first-byte konstan)"""
+        if position:
+            self.buffer.append(self.writer.writerow([]))
+        if title:
+            self.buffer.append(self.writer.writerow([title]))
+        self.buffer.append(self.writer.writerow(headers))
+        return self.flush()
+
+    def row(self, row):
+        """Tambah satu baris; kembalikan potongan jika buffer sudah penuh"""
+        line = self.writer.writerow(row)
+        self.buffer.append(line)
+        self.size += len(line)
+        if self.size >= CSV_FLUSH_SIZE:
+            return self.flush()
+        return None
+
+    def flush(self):
+        chunk = ''.join(self.buffer)
+        self.buffer, self.size = [], 0
+        return chunk
+
+
+def iter_csv(sections):
+    """
+    Hasilkan potongan teks CSV dari daftar section (title, headers, rows).
+
+    title boleh None untuk export satu tabel. Antar section dipisahkan
+    satu baris kosong, sama seperti format export semua data sebelumnya.
+    """
+    chunks = CsvChunks()
+    for position, (title, headers, rows) in enumerate(sections):
+        yield chunks.section(position, title, headers)
+        for row in rows:
+            chunk = chunks.row(row)
+            if chunk:
+                yield chunk
+    tail = chunks.flush()
+    if tail:
+        yield tail
+
+
+async def aiter_csv(sections):
+    """iter_csv() untuk rows berupa async iterable (lihat anumbered_rows)"""
+    chunks = CsvChunks()
+    for position, (title, headers, rows) in enumerate(sections):
+        yield chunks.section(position, title, headers)
+        async for row in rows:
+            chunk = chunks.row(row)
+            if chunk:
+                yield chunk
+    tail = chunks.flush()
+    if tail:
+        yield tail
+
+
+def _csv_response(filename_prefix, content):
+    response = StreamingHttpResponse(content, content_type='text/csv')
+    filename = export_filename(filename_prefix, 'csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def stream_csv_sections(filename_prefix, sections):
+    """StreamingHttpResponse CSV untuk satu atau beberapa section tabel"""
+    return _csv_response(filename_prefix, iter_csv(sections))
+
+
+def stream_csv(filename_prefix, headers, rows):
+    """StreamingHttpResponse CSV untuk satu tabel"""
+    return stream_csv_sections(filename_prefix, [(None, headers, rows)])
+
+
+def astream_csv_sections(filename_prefix, sections):
+    """
+    StreamingHttpResponse dengan async iterator: di bawah ASGI setiap
+    download hanya berupa coroutine, bukan satu thread worker per client.
+    """
+    return _csv_response(filename_prefix, aiter_csv(sections))
+
+
+def astream_csv(filename_prefix, headers, rows):
+    return astream_csv_sections(filename_prefix, [(None, headers, rows)])
+
+
+class ExcelSheet:
+    """
+    Definisi satu sheet export Excel: judul, header, baris (iterable tuple),
+    lebar kolom dan warna header.
+    """
+
+    def __init__(self, title, headers, rows, widths, header_color, header_font_color='FFFFFF'):
+        self.title = title
+        self.headers = headers
+        self.rows = rows
+        self.widths = widths
+        self.header_color = header_color
+        self.header_font_color = header_font_color
+
+
+def _header_row(worksheet, sheet):
+    """Baris header bergaya; objek style dibuat sekali per sheet"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    fill = PatternFill(start_color=sheet.header_color, end_color=sheet.header_color, fill_type='solid')
+    font = Font(bold=True, color=sheet.header_font_color)
+    alignment = Alignment(horizontal='center', vertical='center')
+
+    row = []
+    for header in sheet.headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.fill = fill
+        cell.font = font
+        cell.alignment = alignment
+        row.append(cell)
+    return row
+
+
+def write_xlsx(fileobj, sheets):
+    """
+    Tulis sheets ke fileobj memakai Workbook(write_only=True).
+    Baris langsung di-append sebagai tuple sehingga tidak ada objek Cell
+    yang tertahan di memori.
+    """
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(sheet.title)
+        # Lebar kolom harus diatur sebelum baris pertama ditulis
+        for col_num, width in enumerate(sheet.widths, 1):
+            worksheet.column_dimensions[get_column_letter(col_num)].width = width
+        worksheet.append(_header_row(worksheet, sheet))
+        for row in sheet.rows:
+            worksheet.append(row)
+    workbook.save(fileobj)
+
+
+def xlsx_response(filename_prefix, sheets):
+    """
+    FileResponse Excel: workbook ditulis ke file sementara lalu dikirim
+    per blok. File sementara dihapus otomatis saat response ditutup.
+    """
+    tmp = tempfile.TemporaryFile(suffix='.xlsx', dir=getattr(settings, 'EXPORT_TEMP_DIR', None))
+    try:
+        write_xlsx(tmp, sheets)
+        tmp.seek(0)
+    except Exception:
+        tmp.close()
+        raise
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename=export_filename(filename_prefix, 'xlsx'),
+        content_type=XLSX_CONTENT_TYPE,
+    )
@@ -0,0 +1,193 @@
+"""
+Endpoint JSON daftar data (mahasiswa, dosen, matakuliah) untuk tabel yang
+dimuat bertahap (fetch-on-scroll).
+
+Query string:
+- ?sort=<kolom> atau ?sort=-<kolom> (descending), hanya kolom di `sortable`
+- ?q= pencarian (project1.search) dan filter per kolom di `filters`;
+  tanpa ?sort hasil pencarian diurutkan dari yang paling relevan dan
+  kolom search_rank ditambahkan di akhir payload
+- ?cursor= dari response sebelumnya, atau ?after=<id> untuk urutan id
+- ?per_page= seperti keyset_paginate
+
+Baris diambil dengan values_list() (tanpa membuat objek model) dan dikirim
+dalam bentuk kolom: nama kolom sekali, lalu setiap baris sebagai array.
+
+    {"success": true, "columns": ["id", "nama", ...],
+     "rows": [[1, "Budi", ...], ...], "next_cursor": "..."}
+
+Cursor menyimpan (nilai kolom sort, id) baris terakhir, sehingga halaman
+berikutnya diambil dengan WHERE (kolom, id) > (nilai, id) tanpa OFFSET.
+Cursor datang dari client: nilainya dikonversi dengan to_python() field
+sort dan angka dibatasi ke rentang BIGINT, cursor tidak valid -> 400.
+"""
+
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import JsonResponse
+
+from project1.pagination import MAX_BIGINT, get_page_size, is_valid_id
+from project1.search import rank, search
+
+
+RANK_FIELD = 'search_rank'
+
+
+class ListingError(ValueError):
+    """Parameter sort/cursor tidak valid"""
+
+
+class Listing:
+    """
+    Definisi satu endpoint daftar. queryset: fungsi tanpa argumen yang
+    mengembalikan queryset dasar (boleh berisi annotate); columns: nama
+    kolom pada payload, dalam urutan tampil; kolom pertama harus 'id'.
+    """
+
+    def __init__(self, queryset, columns, sortable, filters=()):
+        self.queryset = queryset
+        self.columns = tuple(columns)
+        self.sortable = set(sortable)
+        self.filters = tuple(filters)
+
+    def sort_param(self, params):
+        sort = params.get('sort')
+        if not sort and params.get('q', '').strip():
+            return RANK_FIELD, True
+        sort = sort or 'id'
+        field = sort.lstrip('-')
+        if field not in self.sortable and field != 'id':
+            raise ListingError(f'Tidak bisa mengurutkan berdasarkan "{field}"')
+        return field, sort.startswith('-')
+
+    def filtered(self, params, ranked=False):
+        queryset = self.queryset()
+        for name in self.filters:
+            value = params.get(name, '').strip()
+            if value:
+                try:
+                    queryset = queryset.filter(**{name: value})
+                except (ValueError, ValidationError):
+                    raise ListingError(f'Filter "{name}" tidak valid')
+        query = params.get('q', '').strip()
+        if query:
+            queryset = (rank if ranked else search)(queryset, query)
+        return queryset
+
+
+def encode_cursor(value, pk):
+    raw = json.dumps([value, pk], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ListingError('Cursor tidak valid')
+    if not is_valid_id(pk) or value is None or isinstance(value, (list, dict)):
+        raise ListingError('Cursor tidak valid')
+    return value, pk
+
+
+def _sort_field(queryset, field):
+    """Field model atau output_field annotation untuk kolom sort"""
+    if field in queryset.query.annotations:
+        return queryset.query.annotations[field].output_field
+    return queryset.model._meta.get_field(field)
+
+
+def cursor_value(queryset, field, value):
+    """Nilai cursor dikonversi ke tipe kolom sort, ListingError jika tidak cocok"""
+    try:
+        value = _sort_field(queryset, field).to_python(value)
+    except (ValueError, TypeError, ValidationError):
+        raise ListingError('Cursor tidak valid')
+    if value is None or (isinstance(value, int) and not -MAX_BIGINT - 1 <= value <= MAX_BIGINT):
+        raise ListingError('Cursor tidak valid')
+    return value
+
+
+def _after(field, descending, value, pk):
+    """Baris sesudah (value, pk) pada urutan (field, id)"""
+    op = 'lt' if descending else 'gt'
+    if field == 'id':
+        return Q(**{f'pk__{op}': pk})
+    return Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': pk})
+
+
+def _page_queryset(listing, params):
+    """(queryset satu halaman + 1 baris, kolom, kolom sort, per_page)"""
+    field, descending = listing.sort_param(params)
+    ranked = field == RANK_FIELD
+    queryset = listing.filtered(params, ranked=ranked)
+    columns = listing.columns + (RANK_FIELD,) if ranked else listing.columns
+
+    cursor = params.get('cursor')
+    after = params.get('after', '')
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        if field != 'id':
+            value = cursor_value(queryset, field, value)
+        try:
+            queryset = queryset.filter(_after(field, descending, value, pk))
+        except (ValueError, TypeError, ValidationError):
+            raise ListingError('Cursor tidak valid')
+    elif after.isdigit() and field == 'id' and is_valid_id(int(after)):
+        # Lanjutan dari baris yang dirender server (urutan default id)
+        queryset = queryset.filter(_after(field, descending, int(after), int(after)))
+
+    prefix = '-' if descending else ''
+    per_page = get_page_size(params)
+    queryset = queryset.order_by(prefix + field, prefix + 'pk').values_list(*columns)[:per_page + 1]
+    return queryset, columns, field, per_page
+
+
+def _finish_page(columns, field, per_page, rows):
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[columns.index(field)], last[0])
+    return columns, rows, next_cursor
+
+
+def list_page(listing, params):
+    """(columns, rows, next_cursor) satu halaman sesuai params"""
+    queryset, columns, field, per_page = _page_queryset(listing, params)
+    return _finish_page(columns, field, per_page, list(queryset))
+
+
+async def alist_page(listing, params):
+    """list_page() dengan async ORM"""
+    queryset, columns, field, per_page = _page_queryset(listing, params)
+    return _finish_page(columns, field, per_page, [row async for row in queryset])
+
+
+def _payload(columns, rows, next_cursor):
+    return {
+        'success': True,
+        'columns': columns,
+        'rows': rows,
+        'next_cursor': next_cursor,
+    }
+
+
+def list_response(request, listing):
+    try:
+        page = list_page(listing, request.GET)
+    except ListingError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    return JsonResponse(_payload(*page))
+
+
+async def alist_response(request, listing):
+    try:
+        page = await alist_page(listing, request.GET)
+    except ListingError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    return JsonResponse(_payload(*page))
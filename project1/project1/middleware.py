@@ -0,0 +1,223 @@
+"""
+Instrumentasi per request: jumlah query SQL, total waktu SQL, waktu view
+dan puncak alokasi memori Python.
+
+Query dicatat lewat connection.execute_wrapper() (tanpa DEBUG=True), memori
+lewat tracemalloc yang hanya diaktifkan untuk sebagian request (sampling)
+karena tracemalloc memperlambat alokasi. Hasil dikirim sebagai header
+Server-Timing dan satu baris log JSON ke logger 'project1.profiling'.
+
+Request yang melewati ambang (jumlah query, query identik berulang seperti
+pola N+1, atau durasi) dicatat dengan level WARNING.
+
+Ukuran body sebelum/sesudah minify dan kompresi (CompressionMiddleware)
+ikut dilaporkan sebagai metrik bytes.
+
+Middleware ini sync dan async capable: di bawah ASGI view async dipanggil
+langsung tanpa pindah thread. Query async ORM dijalankan Django di thread
+sinkron milik request, jadi execute_wrapper dipasang di thread itu.
+
+Catatan: untuk StreamingHttpResponse/FileResponse, query yang dijalankan
+saat body dikirim (setelah view selesai) tidak ikut terhitung, begitu juga
+query di thread terpisah (sync_to_async(thread_sensitive=False)).
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('project1.profiling')
+
+DEFAULT_QUERY_THRESHOLD = 50
+DEFAULT_DUPLICATE_THRESHOLD = 10
+DEFAULT_TIME_THRESHOLD_MS = 1000
+DEFAULT_MEMORY_SAMPLE_RATE = 0.1
+
+# tracemalloc bersifat global per proses: hanya satu request yang diukur
+# dalam satu waktu
+_tracemalloc_lock = threading.Lock()
+
+
+class QueryRecorder:
+    """Callable untuk execute_wrapper: hitung query dan waktunya"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            # SQL masih berisi placeholder, jadi query N+1 punya teks yang sama
+            self.statements[sql] += 1
+
+    @property
+    def max_duplicates(self):
+        return max(self.statements.values(), default=0)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class RequestProfilingMiddleware:
+    """
+    Pasang paling atas di MIDDLEWARE agar seluruh request ikut terukur.
+    Pengaturan (settings.py):
+
+    - REQUEST_PROFILING: aktif/nonaktif
+    - REQUEST_PROFILE_HEADER: kirim header Server-Timing
+    - REQUEST_PROFILE_MEMORY_SAMPLE_RATE: porsi request yang diukur memorinya
+    - REQUEST_PROFILE_QUERY_THRESHOLD, REQUEST_PROFILE_DUPLICATE_THRESHOLD,
+      REQUEST_PROFILE_TIME_THRESHOLD_MS: ambang peringatan
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not _setting('REQUEST_PROFILING', True):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        traced = self._start_tracemalloc()
+        start = time.perf_counter()
+        try:
+            with self._record_queries(recorder):
+                response = self.get_response(request)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if traced else None
+        finally:
+            if traced:
+                self._stop_tracemalloc(traced)
+        return self.report(request, response, recorder, elapsed, peak)
+
+    async def __acall__(self, request):
+        if not _setting('REQUEST_PROFILING', True):
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        traced = self._start_tracemalloc()
+        start = time.perf_counter()
+        try:
+            stack = await sync_to_async(self._record_queries)(recorder)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if traced else None
+        finally:
+            if traced:
+                self._stop_tracemalloc(traced)
+        return self.report(request, response, recorder, elapsed, peak)
+
+    def _record_queries(self, recorder):
+        """ExitStack berisi execute_wrapper(recorder) untuk semua koneksi di thread ini"""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def report(self, request, response, recorder, elapsed, peak):
+        """Susun profil request, tulis header Server-Timing dan log"""
+        profile = {
+            'method': request.method,
+            'path': request.path,
+            'view': getattr(request.resolver_match, 'view_name', None),
+            'status': response.status_code,
+            'queries': recorder.count,
+            'duplicate_queries': recorder.max_duplicates,
+            'sql_ms': round(recorder.duration * 1000, 2),
+            'view_ms': round(elapsed * 1000, 2),
+            'peak_kib': round(peak / 1024, 1) if peak is not None else None,
+        }
+        # Dari CompressionMiddleware (project1/compression.py), hanya response non-streaming
+        compression = getattr(request, 'compression', None)
+        if compression:
+            profile['original_bytes'] = compression['original_bytes']
+            profile['sent_bytes'] = compression['sent_bytes']
+            profile['encoding'] = compression.get('encoding')
+        request.profile = profile
+
+        if _setting('REQUEST_PROFILE_HEADER', settings.DEBUG):
+            response['Server-Timing'] = server_timing(profile)
+
+        problems = self.check_thresholds(profile)
+        if problems:
+            profile['flags'] = problems
+            logger.warning(json.dumps(profile))
+        else:
+            logger.info(json.dumps(profile))
+        return response
+
+    def _start_tracemalloc(self):
+        """
+        Mulai tracemalloc untuk request ini jika terpilih sampling.
+        Mengembalikan 'own' (kita yang start), 'shared' (sudah aktif
+        sebelumnya) atau None.
+        """
+        rate = _setting('REQUEST_PROFILE_MEMORY_SAMPLE_RATE', DEFAULT_MEMORY_SAMPLE_RATE)
+        if rate <= 0 or random.random() >= rate:
+            return None
+        if not _tracemalloc_lock.acquire(blocking=False):
+            return None
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            return 'shared'
+        tracemalloc.start()
+        return 'own'
+
+    def _stop_tracemalloc(self, traced):
+        if traced == 'own':
+            tracemalloc.stop()
+        _tracemalloc_lock.release()
+
+    def check_thresholds(self, profile):
+        problems = []
+        if profile['queries'] > _setting('REQUEST_PROFILE_QUERY_THRESHOLD', DEFAULT_QUERY_THRESHOLD):
+            problems.append('too_many_queries')
+        if profile['duplicate_queries'] > _setting('REQUEST_PROFILE_DUPLICATE_THRESHOLD', DEFAULT_DUPLICATE_THRESHOLD):
+            problems.append('repeated_query')
+        if profile['view_ms'] > _setting('REQUEST_PROFILE_TIME_THRESHOLD_MS', DEFAULT_TIME_THRESHOLD_MS):
+            problems.append('slow')
+        return problems
+
+
+def server_timing(profile):
+    """Nilai header Server-Timing, contoh: sql;dur=3.1;desc="4 queries", view;dur=12.5"""
+    metrics = [
+        f'sql;dur={profile["sql_ms"]};desc="{profile["queries"]} queries"',
+        f'view;dur={profile["view_ms"]}',
+    ]
+    if profile['peak_kib'] is not None:
+        metrics.append(f'mem;desc="peak {profile["peak_kib"]} KiB"')
+    if 'sent_bytes' in profile:
+        saved = profile['original_bytes'] - profile['sent_bytes']
+        metrics.append(
+            f'bytes;desc="{profile["encoding"] or "identity"} '
+            f'{profile["original_bytes"]} -> {profile["sent_bytes"]} B, saved {saved} B"'
+        )
+    return ', '.join(metrics)
@@ -0,0 +1,90 @@
+"""
+Keyset (cursor) pagination berdasarkan kolom id.
+
+Halaman berikutnya diambil dengan WHERE id > ?after dan halaman sebelumnya
+dengan WHERE id < ?before, sehingga biaya query tetap sama di halaman
+mana pun (tidak memakai OFFSET).
+"""
+
+from django.conf import settings
+
+DEFAULT_PAGE_SIZE = 25
+DEFAULT_MAX_PAGE_SIZE = 200
+
+# Rentang integer 64-bit; id di luar ini ditolak database (OverflowError)
+MAX_BIGINT = 2 ** 63 - 1
+
+
+def is_valid_id(value):
+    """True untuk int (bukan bool) dalam rentang 1..MAX_BIGINT"""
+    return isinstance(value, int) and not isinstance(value, bool) and 1 <= value <= MAX_BIGINT
+
+
+def _int_param(params, name):
+    try:
+        value = int(params.get(name, ''))
+    except (TypeError, ValueError):
+        return None
+    return value if 0 <= value <= MAX_BIGINT else None
+
+
+def get_page_size(params):
+    """Ukuran halaman dari ?per_page=, dibatasi LISTING_MAX_PAGE_SIZE"""
+    default = getattr(settings, 'LISTING_PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    maximum = getattr(settings, 'LISTING_MAX_PAGE_SIZE', DEFAULT_MAX_PAGE_SIZE)
+    per_page = _int_param(params, 'per_page') or default
+    return min(per_page, maximum)
+
+
+class KeysetPage:
+    """Satu halaman hasil keyset pagination"""
+
+    def __init__(self, object_list, per_page, has_next, has_previous):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    @property
+    def next_cursor(self):
+        return self.object_list[-1].pk if self.object_list else None
+
+    @property
+    def previous_cursor(self):
+        return self.object_list[0].pk if self.object_list else None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def keyset_paginate(request, queryset, per_page=None):
+    """
+    Ambil satu halaman dari queryset berdasarkan ?after= / ?before=.
+
+    Query mengambil per_page + 1 baris untuk mengetahui apakah masih ada
+    halaman lanjutan, tanpa COUNT(*) atas seluruh tabel.
+    """
+    per_page = per_page or get_page_size(request.GET)
+    after = _int_param(request.GET, 'after')
+    before = _int_param(request.GET, 'before')
+
+    if before is not None:
+        rows = list(queryset.filter(pk__lt=before).order_by('-pk')[:per_page + 1])
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page]
+        rows.reverse()
+        return KeysetPage(rows, per_page, has_next=bool(rows), has_previous=has_previous)
+
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+    rows = list(queryset.order_by('pk')[:per_page + 1])
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    return KeysetPage(rows, per_page, has_next=has_next, has_previous=after is not None and bool(rows))
@@ -0,0 +1,281 @@
+"""
+Backend pencarian untuk kotak pencarian mahasiswa, dosen dan matakuliah.
+
+Backend dipilih lewat settings.SEARCH_BACKEND:
+
+- SQLiteFTSSearchBackend (default): tabel virtual FTS5 per model yang
+  disinkronkan oleh trigger database. Kode (npm/nidn/kode_mk) dan nama
+  dicocokkan per kata dengan prefix matching.
+- PostgresSearchBackend: SearchVector + trigram (butuh django.contrib.postgres
+  dan ekstensi pg_trgm).
+- IContainsSearchBackend: LIKE '%q%' seperti sebelumnya, juga dipakai
+  sebagai fallback bila database bukan SQLite.
+
+search() hanya memfilter; rank() memfilter dan menambah annotation
+search_rank (float, makin besar makin relevan) lalu mengurutkan hasilnya.
+rank() dipakai endpoint JSON listing (project1/listing.py) dan pencarian
+admin/autocomplete (project1/admin.py) saat user tidak memilih urutan
+sendiri. Halaman input_* dan export tetap urut id: keyset pagination
+(?after=<id>) dan nomor baris export bergantung pada urutan itu.
+"""
+
+import re
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, migrations
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+DEFAULT_SEARCH_BACKEND = 'project1.search.SQLiteFTSSearchBackend'
+
+# model -> (field kode dengan prefix matching, field nama yang di-ranking)
+SEARCH_FIELDS = {
+    'mahasiswa.mahasiswa': ('npm', 'nama'),
+    'dosen.dosen': ('nidn', 'nama'),
+    'matakuliah.matakuliah': ('kode_mk', 'nama_mk'),
+}
+
+TOKEN_RE = re.compile(r'\w+')
+
+_backends = {}
+
+
+def get_search_backend():
+    path = getattr(settings, 'SEARCH_BACKEND', DEFAULT_SEARCH_BACKEND)
+    if path not in _backends:
+        _backends[path] = import_string(path)()
+    return _backends[path]
+
+
+def search(queryset, query):
+    """Filter queryset dengan backend pencarian yang aktif"""
+    return get_search_backend().filter(queryset, query)
+
+
+def rank(queryset, query):
+    """search() + annotation search_rank, urut dari yang paling relevan"""
+    return get_search_backend().rank(queryset, query)
+
+
+def search_fields(model):
+    return SEARCH_FIELDS[model._meta.label_lower]
+
+
+class IContainsSearchBackend:
+    """Substring match (LIKE '%q%') pada field kode dan nama"""
+
+    def filter(self, queryset, query):
+        code, text = search_fields(queryset.model)
+        return queryset.filter(Q(**{f'{code}__icontains': query}) | Q(**{f'{text}__icontains': query}))
+
+    def rank(self, queryset, query):
+        """Kode yang diawali query lebih relevan dari kecocokan di tengah/nama"""
+        code, text = search_fields(queryset.model)
+        relevance = Case(
+            When(**{f'{code}__istartswith': query.strip()}, then=Value(1.0)),
+            default=Value(0.0), output_field=FloatField(),
+        )
+        return self.filter(queryset, query).annotate(search_rank=relevance).order_by('-search_rank', 'pk')
+
+
+class SQLiteFTSSearchBackend:
+    """
+    Pencarian dengan tabel FTS5 <db_table>_fts (external content).
+    Setiap kata pada query dicocokkan sebagai prefix ("kata"*), semua kata
+    harus ada. Ranking memakai bm25 dengan bobot lebih tinggi untuk kode.
+    """
+
+    fallback = IContainsSearchBackend()
+    code_weight = 10.0
+    text_weight = 1.0
+
+    def match_expression(self, query):
+        tokens = TOKEN_RE.findall(query)
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def _usable(self, queryset):
+        return connections[queryset.db].vendor == 'sqlite'
+
+    def filter(self, queryset, query):
+        match = self.match_expression(query)
+        if not match or not self._usable(queryset):
+            return self.fallback.filter(queryset, query)
+        fts = fts_table_name(queryset.model._meta.db_table)
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM "{fts}" WHERE "{fts}" MATCH %s', (match,))
+        )
+
+    def rank(self, queryset, query):
+        """
+        Filter lalu urutkan berdasarkan relevansi. bm25 bernilai kecil
+        (negatif) untuk yang relevan, jadi dibalik agar search_rank sama
+        arahnya dengan backend lain.
+        """
+        match = self.match_expression(query)
+        if not match or not self._usable(queryset):
+            return self.fallback.rank(queryset, query)
+        table = queryset.model._meta.db_table
+        fts = fts_table_name(table)
+        relevance = RawSQL(
+            f'SELECT -bm25("{fts}", {self.code_weight}, {self.text_weight}) FROM "{fts}" '
+            f'WHERE "{fts}" MATCH %s AND rowid = "{table}"."id"',
+            (match,), output_field=FloatField(),
+        )
+        return self.filter(queryset, query).annotate(search_rank=relevance).order_by('-search_rank', 'pk')
+
+
+class PostgresSearchBackend:
+    """
+    Pencarian PostgreSQL: prefix pada kode, full-text + trigram pada nama.
+    Index GIN trigram ditambahkan oleh migration khusus PostgreSQL.
+    """
+
+    config = 'simple'
+
+    def _expressions(self, queryset, query):
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        code, text = search_fields(queryset.model)
+        vector = SearchVector(text, config=self.config)
+        search_query = SearchQuery(query, config=self.config, search_type='websearch')
+        return code, text, vector, search_query
+
+    def filter(self, queryset, query):
+        code, text, vector, search_query = self._expressions(queryset, query)
+        return queryset.annotate(search_vector=vector).filter(
+            Q(**{f'{code}__startswith': query.strip()})
+            | Q(search_vector=search_query)
+            | Q(**{f'{text}__trigram_word_similar': query})
+        )
+
+    def rank(self, queryset, query):
+        from django.contrib.postgres.search import SearchRank, TrigramWordSimilarity
+
+        code, text, vector, search_query = self._expressions(queryset, query)
+        return self.filter(queryset, query).annotate(
+            search_rank=SearchRank(vector, search_query) + TrigramWordSimilarity(query, text)
+        ).order_by('-search_rank', 'pk')
+
+
+# ---------------------------------------------------------------------------
+# Skema FTS5 untuk SQLite
+# ---------------------------------------------------------------------------
+
+def fts_table_name(table):
+    return f'{table}_fts'
+
+
+def _fts_trigger_sql(table, columns):
+    fts = fts_table_name(table)
+    cols = ', '.join(columns)
+    new_values = ', '.join(f'new.{c}' for c in columns)
+    old_values = ', '.join(f'old.{c}' for c in columns)
+    return [
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" BEGIN '
+        f'INSERT INTO "{fts}"(rowid, {cols}) VALUES (new.id, {new_values}); END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" BEGIN '
+        f'INSERT INTO "{fts}"("{fts}", rowid, {cols}) VALUES (\'delete\', old.id, {old_values}); END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE OF {cols} ON "{table}" BEGIN '
+        f'INSERT INTO "{fts}"("{fts}", rowid, {cols}) VALUES (\'delete\', old.id, {old_values}); '
+        f'INSERT INTO "{fts}"(rowid, {cols}) VALUES (new.id, {new_values}); END',
+    ]
+
+
+def _rebuild_sql(table):
+    fts = fts_table_name(table)
+    return f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')'
+
+
+def sqlite_fts_operation(table, columns):
+    """
+    Operation migration yang membuat tabel FTS5 + trigger untuk table.
+    Tidak melakukan apa pun pada database selain SQLite.
+    """
+    fts = fts_table_name(table)
+
+    def create(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({", ".join(columns)}, '
+            f'content="{table}", content_rowid="id", '
+            f'tokenize="unicode61 remove_diacritics 2", prefix="2 3 4")'
+        )
+        for sql in _fts_trigger_sql(table, columns):
+            schema_editor.execute(sql)
+        schema_editor.execute(_rebuild_sql(table))
+
+    def drop(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS "{fts}_{suffix}"')
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{fts}"')
+
+    return migrations.RunPython(create, drop, elidable=False)
+
+
+# ---------------------------------------------------------------------------
+# Index trigram untuk PostgreSQL
+# ---------------------------------------------------------------------------
+
+def _trigram_indexes(table, columns):
+    """(nama index, ekspresi) untuk setiap kolom"""
+    indexes = []
+    for column in columns:
+        # icontains di PostgreSQL: UPPER("kolom"::text) LIKE UPPER('%q%')
+        indexes.append((f'{table}_{column}_upper_trgm', f'(UPPER("{column}"::text)) gin_trgm_ops'))
+        # trigram_word_similar / startswith pada kolom asli
+        indexes.append((f'{table}_{column}_trgm', f'"{column}" gin_trgm_ops'))
+    return indexes
+
+
+def postgres_trigram_operation(table, columns):
+    """
+    Operation migration yang membuat index GIN trigram (pg_trgm) untuk
+    pencarian icontains dan PostgresSearchBackend. Tidak melakukan apa pun
+    pada database selain PostgreSQL.
+    """
+
+    def create(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, expression in _trigram_indexes(table, columns):
+            schema_editor.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ({expression})')
+
+    def drop(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for name, expression in _trigram_indexes(table, columns):
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+    return migrations.RunPython(create, drop, elidable=False)
+
+
+def ensure_sqlite_fts(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Handler post_migrate: SQLite membuat ulang tabel saat AlterField, dan
+    trigger ikut terhapus. Pasang kembali trigger yang hilang lalu rebuild
+    index FTS agar tetap sinkron.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    from django.apps import apps
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = {row[0] for row in cursor.fetchall()}
+        for label, columns in SEARCH_FIELDS.items():
+            table = apps.get_model(label)._meta.db_table
+            fts = fts_table_name(table)
+            if fts not in existing:
+                continue
+            triggers = {f'{fts}_ai', f'{fts}_ad', f'{fts}_au'}
+            if triggers <= existing:
+                continue
+            for sql in _fts_trigger_sql(table, columns):
+                cursor.execute(sql)
+            cursor.execute(_rebuild_sql(table))
@@ -0,0 +1,50 @@
+"""
+Profil penyimpanan sesi dan pesan flash, dipilih di settings.py lewat
+environment variable SESSION_PROFILE.
+
+- cached_db (default): sesi dibaca dari cache, database hanya disentuh
+  saat cache kosong atau sesi berubah (login/logout). Pesan flash di cookie.
+- signed_cookies: seluruh sesi disimpan di cookie bertanda tangan
+  (SECRET_KEY), tanpa tabel django_session sama sekali. Sesi tidak bisa
+  dicabut dari server sebelum kedaluwarsa, dan isinya terbaca oleh client.
+- db: bawaan Django (sesi di database, pesan flash di sesi/cookie), untuk
+  pembanding benchmark.
+
+Pesan flash di cookie (CookieStorage) membuat messages.success() pada
+input_*/*_delete tidak lagi menulis sesi ke database. Cache sesi memakai
+alias 'sessions': FileBasedCache (default, di STATE_DIR, di luar source
+tree) dipakai bersama oleh semua worker di satu host; locmem hanya aman
+untuk satu proses, karena cached_db di proses lain bisa membaca salinan
+sesi yang sudah usang. Test suite memakai locmem (project1.testing.TestRunner).
+"""
+
+import os
+
+from project1.caches import cache_setting
+from project1.environment import env_value
+
+COOKIE_MESSAGES = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+# profil -> (SESSION_ENGINE, MESSAGE_STORAGE)
+PROFILES = {
+    'cached_db': ('django.contrib.sessions.backends.cached_db', COOKIE_MESSAGES),
+    'signed_cookies': ('django.contrib.sessions.backends.signed_cookies', COOKIE_MESSAGES),
+    'db': ('django.contrib.sessions.backends.db', 'django.contrib.messages.storage.fallback.FallbackStorage'),
+}
+
+def session_storage(env=os.environ):
+    """(SESSION_ENGINE, MESSAGE_STORAGE) sesuai SESSION_PROFILE"""
+    profile = env_value(env, 'SESSION_PROFILE', 'cached_db')
+    if profile not in PROFILES:
+        raise ValueError(f'SESSION_PROFILE tidak dikenal: {profile} (pilihan: {", ".join(PROFILES)})')
+    return PROFILES[profile]
+
+
+def session_cache(default_location, env=os.environ, default_backend='file'):
+    """Setting cache alias 'sessions' (SESSION_CACHE=file|locmem)"""
+    return cache_setting(
+        'SESSION_CACHE', default_location, env, default_backend,
+        # Sama dengan SESSION_COOKIE_AGE bawaan (2 minggu)
+        TIMEOUT=60 * 60 * 24 * 14,
+        OPTIONS={'MAX_ENTRIES': 10000},
+    )
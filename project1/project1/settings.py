@@ -10,11 +10,20 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import tempfile
 from pathlib import Path
 
+from project1.caches import default_cache
+from project1.database import database_from_env, is_postgres
+from project1.sessions import session_cache, session_storage
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# File runtime (cache) disimpan di luar source tree, bisa diganti lewat STATE_DIR
+STATE_DIR = Path(os.environ.get('STATE_DIR') or Path(tempfile.gettempdir()) / 'project1')
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -43,7 +52,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Paling atas agar seluruh request terukur (lihat REQUEST_PROFILING di bawah)
+    'project1.middleware.RequestProfilingMiddleware',
+    # gzip/brotli + minify HTML, sebelum middleware lain yang menyentuh body
+    'project1.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # /static/ dari STATIC_ROOT (setelah collectstatic), lihat project1/staticfiles.py
+    'project1.staticfiles.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -58,30 +73,80 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'home_templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Template di-parse sekali per proses lalu dipakai ulang
+            # (pengganti APP_DIRS; runserver tetap me-reset saat template berubah)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
 
 WSGI_APPLICATION = 'project1.wsgi.application'
 
+# View baca async (dashboard_stats, api/list/, export CSV) untuk ASGI, lihat
+# */async_views.py. asgi.py mengaktifkannya secara default; di WSGI view
+# async justru menambah overhead, jadi default mati.
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', '0') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Profil dipilih dengan DB_PROFILE (lihat project1/database.py dan README.md):
+# sqlite (default, WAL + pragma + koneksi persisten), sqlite-basic atau
+# postgres (POSTGRES_DB/USER/PASSWORD/HOST/PORT, pool psycopg).
+# SQLITE_PATH mengganti lokasi file database SQLite.
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_from_env(BASE_DIR / 'db.sqlite3'),
+}
+USING_POSTGRES = is_postgres(DATABASES['default'])
+
+if USING_POSTGRES:
+    # Lookup trigram dan SearchVector untuk PostgresSearchBackend
+    INSTALLED_APPS.append('django.contrib.postgres')
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'default' menyimpan versi data (ETag, fragment, dedupe export) dan
+# statistik dashboard, jadi harus dipakai bersama semua worker:
+# FileBasedCache di STATE_DIR (DEFAULT_CACHE=file|locmem, lihat
+# project1/caches.py). locmem hanya untuk satu proses.
+
+CACHES = {
+    'default': default_cache(STATE_DIR / 'cache' / 'default'),
+    # Cache sesi (cached_db), SESSION_CACHE=file|locmem, lihat project1/sessions.py
+    'sessions': session_cache(STATE_DIR / 'cache' / 'sessions'),
 }
 
+# Test memakai cache locmem, tidak menulis ke cache file bersama di STATE_DIR
+TEST_RUNNER = 'project1.testing.TestRunner'
+
+
+# Sesi dan pesan flash
+# SESSION_PROFILE: cached_db (default), signed_cookies atau db (bawaan Django)
+
+SESSION_ENGINE, MESSAGE_STORAGE = session_storage()
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Cache statistik dashboard dihitung ulang penuh paling lama setiap interval ini (detik)
+DASHBOARD_STATS_TIMEOUT = 60 * 60
+
+# Umur fragment {% cache %} tabel di tampilkan_semua_data (detik). Kunci
+# fragment memuat versi data, jadi perubahan data langsung terlihat.
+TEMPLATE_FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -118,6 +183,22 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = '/static/'
+# CSS/JS bersama halaman home_templates (per app: <app>/static/<app>/)
+STATICFILES_DIRS = [BASE_DIR / 'static']
+# Hasil collectstatic, disajikan oleh project1.staticfiles.StaticFilesMiddleware
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+# Cache-Control untuk file tanpa hash (detik); file ber-hash selalu 1 tahun
+STATIC_MAX_AGE = 60
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Nama ber-hash + varian .gz/.br saat collectstatic
+    'staticfiles': {
+        'BACKEND': 'project1.staticfiles.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -126,3 +207,64 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Login redirect URL
 LOGIN_REDIRECT_URL = '/'
+
+# Export CSV/Excel: jumlah baris yang diambil dari database per fetch
+EXPORT_CHUNK_SIZE = 2000
+# Direktori file sementara export Excel (None = direktori temp sistem)
+EXPORT_TEMP_DIR = None
+
+# Export background (mahasiswa/export_jobs.py): jumlah thread worker
+# (0 = dikerjakan langsung di request), lokasi artifact, dan batas waktu
+# sebelum job pending/running dianggap macet (detik)
+EXPORT_JOB_WORKERS = 2
+EXPORT_JOB_DIR = BASE_DIR / 'export_artifacts'
+EXPORT_JOB_TIMEOUT = 30 * 60
+
+# Import massal mahasiswa: jumlah baris per batch validasi dan bulk_create
+IMPORT_BATCH_SIZE = 500
+
+# Keyset pagination untuk halaman input_* (?per_page= dibatasi maksimum)
+LISTING_PAGE_SIZE = 25
+LISTING_MAX_PAGE_SIZE = 200
+
+# Backend pencarian kotak search (lihat project1/search.py)
+# Alternatif: 'project1.search.IContainsSearchBackend'
+if USING_POSTGRES:
+    SEARCH_BACKEND = 'project1.search.PostgresSearchBackend'
+else:
+    SEARCH_BACKEND = 'project1.search.SQLiteFTSSearchBackend'
+
+# Instrumentasi per request (project1/middleware.py): jumlah & waktu query,
+# waktu view, puncak memori. Header Server-Timing hanya dikirim saat DEBUG.
+REQUEST_PROFILING = True
+REQUEST_PROFILE_HEADER = DEBUG
+# Porsi request yang diukur memorinya dengan tracemalloc (0 = tidak pernah)
+REQUEST_PROFILE_MEMORY_SAMPLE_RATE = 0.1
+# Ambang peringatan: total query, query identik berulang (pola N+1), durasi
+REQUEST_PROFILE_QUERY_THRESHOLD = 50
+REQUEST_PROFILE_DUPLICATE_THRESHOLD = 10
+REQUEST_PROFILE_TIME_THRESHOLD_MS = 1000
+
+# Kompresi response (project1/compression.py): response biasa di bawah
+# ukuran ini (byte) dikirim apa adanya; streaming selalu dikompresi
+COMPRESSION_MIN_SIZE = 1024
+# Rapatkan whitespace HTML sebelum dikompresi
+HTML_MINIFY = not DEBUG
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        # WARNING: hanya request yang melewati ambang; INFO: semua request
+        'project1.profiling': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
@@ -0,0 +1,118 @@
+"""
+Pengukuran biaya import saat worker start.
+
+Skenario startup = django.setup() (settings, app registry, models,
+signals, admin), membuat handler WSGI (memuat semua MIDDLEWARE) dan resolve
+URLconf, yang meng-import semua modul views. Ini yang dibayar setiap
+worker baru dan setiap perintah manage.py yang menyentuh URL.
+
+Pengukuran dijalankan di subprocess baru agar sys.modules bersih:
+- import_times(): parse output `python -X importtime`
+- group_by_package(): total waktu per package top-level (app proyek,
+  django, pihak ketiga, stdlib)
+- startup_modules(): daftar modul yang ter-import, dipakai test regresi
+  agar dependensi berat (openpyxl, brotli) tidak kembali di-import saat
+  start
+- baseline_code(): skenario pembanding yang hanya memuat app dan
+  middleware bawaan Django dari settings. Selisih jumlah modul startup
+  terhadap baseline adalah modul yang ditambahkan proyek; angka ini yang
+  dibatasi test regresi, sehingga tidak ikut berubah saat Django/Python
+  di-upgrade
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+
+SETUP_CODE = 'import django\ndjango.setup()\n'
+HANDLER_CODE = 'from django.core.handlers.wsgi import WSGIHandler\nWSGIHandler()\n'
+URLS_CODE = 'from django.urls import get_resolver\nget_resolver().url_patterns\n'
+STARTUP_CODE = SETUP_CODE + HANDLER_CODE + URLS_CODE
+
+# import time: <self us> | <cumulative us> | <indentasi><nama modul>
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)$')
+
+
+class ImportTime:
+    def __init__(self, module, self_us, cumulative_us, depth):
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+    @property
+    def package(self):
+        return self.module.split('.')[0]
+
+
+def _run(args, code):
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'project1.settings')}
+    result = subprocess.run(
+        [sys.executable, *args, '-c', code],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'subprocess gagal')
+    return result
+
+
+def import_times(code=STARTUP_CODE):
+    """ImportTime untuk setiap modul yang di-import oleh code, urut seperti output importtime"""
+    entries = []
+    for line in _run(['-X', 'importtime'], code).stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def startup_modules(code=STARTUP_CODE):
+    """Nama modul di sys.modules setelah code dijalankan di interpreter baru"""
+    result = _run([], code + 'import json, sys\nprint(json.dumps(sorted(sys.modules)))\n')
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def baseline_code():
+    """Startup tanpa app, middleware dan URLconf proyek (hanya bagian django.* dari settings)"""
+    apps = [app for app in settings.INSTALLED_APPS if app.startswith('django.')]
+    middleware = [name for name in settings.MIDDLEWARE if name.startswith('django.')]
+    configure = (
+        'from django.conf import settings\n'
+        f'settings.configure(INSTALLED_APPS={apps!r}, MIDDLEWARE={middleware!r})\n'
+    )
+    return configure + SETUP_CODE + HANDLER_CODE
+
+
+def package_kind(package):
+    """'app', 'django', 'stdlib' atau 'pihak ketiga'"""
+    if package == 'django':
+        return 'django'
+    if package == 'project1' or package in {app.split('.')[0] for app in settings.INSTALLED_APPS}:
+        return 'app'
+    if package in sys.stdlib_module_names or package.startswith('_'):
+        return 'stdlib'
+    return 'pihak ketiga'
+
+
+def group_by_package(entries):
+    """
+    [(package, jenis, total self us, jumlah modul)] urut dari yang termahal.
+    Memakai waktu self agar import bersarang tidak terhitung dua kali;
+    modul stdlib digabung menjadi satu baris.
+    """
+    totals = defaultdict(lambda: [0, 0])
+    for entry in entries:
+        kind = package_kind(entry.package)
+        key = ('(stdlib)', kind) if kind == 'stdlib' else (entry.package, kind)
+        totals[key][0] += entry.self_us
+        totals[key][1] += 1
+    return sorted(
+        ((package, kind, self_us, count) for (package, kind), (self_us, count) in totals.items()),
+        key=lambda item: item[2], reverse=True,
+    )
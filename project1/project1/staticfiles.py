@@ -0,0 +1,222 @@
+"""
+Pipeline static file: nama ber-hash, varian terkompresi dan penyajian
+langsung dari app server.
+
+CompressedManifestStaticFilesStorage (STORAGES['staticfiles']):
+- collectstatic menyalin file ke STATIC_ROOT dengan nama ber-hash isi
+  (ManifestStaticFilesStorage), contoh css/input.3f2a9c1b7d4e.css
+- setelah itu file teks (CSS, JS, SVG, ...) dikompresi menjadi .gz dan,
+  jika paket brotli terpasang, .br. Varian hanya ditulis bila lebih kecil.
+- sebelum collectstatic pernah dijalankan (dev, test) URL memakai nama asli
+  seperti StaticFilesStorage biasa
+
+StaticFilesMiddleware menyajikan isi STATIC_ROOT dari proses Django (mirip
+WhiteNoise), sehingga tidak perlu web server terpisah untuk /static/:
+- file ber-hash: Cache-Control max-age 1 tahun + immutable
+- file tanpa hash: max-age STATIC_MAX_AGE (default 60 detik)
+- varian .br/.gz dipilih dari Accept-Encoding, dengan Vary: Accept-Encoding
+- ETag/Last-Modified dan 304 untuk If-None-Match/If-Modified-Since
+Daftar file dibaca sekali saat proses start; jalankan collectstatic lalu
+restart worker. Jika STATIC_ROOT kosong middleware dilepas
+(MiddlewareNotUsed) dan request diteruskan seperti biasa.
+"""
+
+import gzip
+import mimetypes
+import os
+from importlib.util import find_spec
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+# Cek ketersediaan tanpa meng-import; brotli baru di-import saat dipakai
+HAS_BROTLI = find_spec('brotli') is not None
+
+COMPRESS_EXTENSIONS = ('.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.xml', '.html', '.ico')
+
+# File lebih kecil dari ini tidak dikompresi (header gzip/br > penghematan)
+COMPRESS_MIN_SIZE = 256
+
+# Varian disimpan hanya jika ukurannya <= rasio ini dari file asli
+COMPRESS_MAX_RATIO = 0.95
+
+# (ekstensi varian, nilai Content-Encoding), urutan = prioritas
+ENCODINGS = (('.br', 'br'), ('.gz', 'gzip'))
+
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+DEFAULT_STATIC_MAX_AGE = 60
+
+
+def compress_gzip(data):
+    # mtime=0 agar hasil sama setiap collectstatic (ETag/cache stabil)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_brotli(data):
+    import brotli
+
+    return brotli.compress(data, quality=11)
+
+
+def compressors():
+    """(ekstensi, fungsi) yang tersedia: gzip selalu, brotli jika terpasang"""
+    found = [('.gz', compress_gzip)]
+    if HAS_BROTLI:
+        found.insert(0, ('.br', compress_brotli))
+    return found
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def stored_name(self, name):
+        # Belum ada staticfiles.json: dev/test tanpa collectstatic
+        if not self.hashed_files and not self.manifest_hash:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        # File asli dan versi ber-hash sama-sama disajikan
+        names = set(paths) | set(self.hashed_files.values())
+        for name in sorted(names):
+            for compressed_name in self.compress(name):
+                yield name, compressed_name, True
+
+    def compress(self, name):
+        """Tulis varian terkompresi untuk name, kembalikan nama yang ditulis"""
+        if not name.endswith(COMPRESS_EXTENSIONS) or not self.exists(name):
+            return []
+        with self.open(name) as original:
+            data = original.read()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return []
+        written = []
+        for extension, compress in compressors():
+            compressed = compress(data)
+            if len(compressed) > len(data) * COMPRESS_MAX_RATIO:
+                continue
+            path = self.path(name + extension)
+            with open(path, 'wb') as output:
+                output.write(compressed)
+            written.append(name + extension)
+        return written
+
+
+class StaticFile:
+    """Satu file di STATIC_ROOT beserta varian terkompresinya"""
+
+    def __init__(self, path, immutable):
+        stat = os.stat(path)
+        self.path = path
+        self.size = stat.st_size
+        self.last_modified = int(stat.st_mtime)
+        self.etag = f'"{self.size:x}-{self.last_modified:x}"'
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/') or self.content_type in ('application/javascript', 'image/svg+xml'):
+            self.content_type += '; charset=utf-8'
+        self.immutable = immutable
+        # {content-encoding: path}
+        self.variants = {
+            encoding: path + extension
+            for extension, encoding in ENCODINGS
+            if os.path.isfile(path + extension)
+        }
+
+    def pick(self, accept_encoding):
+        """(path, content-encoding atau None) sesuai Accept-Encoding client"""
+        accepted = {part.split(';')[0].strip() for part in accept_encoding.split(',')}
+        for extension, encoding in ENCODINGS:
+            if encoding in accepted and encoding in self.variants:
+                return self.variants[encoding], encoding
+        return self.path, None
+
+
+def scan_static_root(root):
+    """{path URL relatif: StaticFile} untuk semua file asli di root"""
+    root = str(root)
+    variant_extensions = tuple(extension for extension, encoding in ENCODINGS)
+    hashed_files, _ = CompressedManifestStaticFilesStorage(location=root).load_manifest()
+    immutable = set(hashed_files.values())
+
+    files = {}
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith(variant_extensions):
+                continue
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            files[name] = StaticFile(path, name in immutable)
+    return files
+
+
+class StaticFilesMiddleware:
+    """
+    Pasang setelah SecurityMiddleware. Hanya menangani GET/HEAD di bawah
+    STATIC_URL yang filenya ada di STATIC_ROOT; request lain diteruskan.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        root = settings.STATIC_ROOT
+        self.files = scan_static_root(root) if root and os.path.isdir(root) else {}
+        if not self.files:
+            raise MiddlewareNotUsed('STATIC_ROOT kosong, jalankan collectstatic')
+        self.prefix = settings.STATIC_URL if settings.STATIC_URL.startswith('/') else '/' + settings.STATIC_URL
+        self.max_age = getattr(settings, 'STATIC_MAX_AGE', DEFAULT_STATIC_MAX_AGE)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        static_file = self.match(request)
+        if static_file is not None:
+            return self.serve(request, static_file)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        static_file = self.match(request)
+        if static_file is not None:
+            return self.serve(request, static_file)
+        return await self.get_response(request)
+
+    def match(self, request):
+        """StaticFile untuk GET/HEAD di bawah STATIC_URL, atau None"""
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix):
+            return self.files.get(request.path_info[len(self.prefix):])
+        return None
+
+    def cache_control(self, static_file):
+        if static_file.immutable:
+            return f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+        return f'public, max-age={self.max_age}'
+
+    def serve(self, request, static_file):
+        not_modified = get_conditional_response(
+            request, etag=static_file.etag, last_modified=static_file.last_modified,
+        )
+        if not_modified is not None and not_modified.status_code == 304:
+            response = HttpResponseNotModified()
+        else:
+            path, encoding = static_file.pick(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+            response = FileResponse(open(path, 'rb'), content_type=static_file.content_type)
+            # FileResponse menambah "inline; filename=..." (bisa nama .gz/.br)
+            response.headers.pop('Content-Disposition', None)
+            if encoding:
+                response['Content-Encoding'] = encoding
+        response['ETag'] = static_file.etag
+        response['Last-Modified'] = http_date(static_file.last_modified)
+        response['Cache-Control'] = self.cache_control(static_file)
+        if static_file.variants:
+            response['Vary'] = 'Accept-Encoding'
+        return response
@@ -0,0 +1,75 @@
+"""
+Helper test yang dipakai bersama oleh tests.py di setiap app, dan
+TestRunner (settings.TEST_RUNNER).
+"""
+
+import json
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import AsyncRequestFactory, override_settings
+from django.test.runner import DiscoverRunner
+
+from project1.caches import default_cache
+from project1.sessions import session_cache
+
+
+class TestRunner(DiscoverRunner):
+    """
+    DiscoverRunner dengan cache locmem (profil DEFAULT_CACHE/SESSION_CACHE
+    =locmem): test tidak membaca atau menulis cache file yang dipakai
+    worker yang sedang berjalan.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        cache_dir = settings.STATE_DIR / 'cache'
+        self.cache_override = override_settings(CACHES={
+            'default': default_cache(cache_dir / 'default', env={}, default_backend='locmem'),
+            'sessions': session_cache(cache_dir / 'sessions', env={}, default_backend='locmem'),
+        })
+        self.cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.cache_override.disable()
+        super().teardown_test_environment(**kwargs)
+
+
+class LoginMixin:
+    """
+    Login sebagai self.user sebelum setiap test (semua view memerlukan
+    login). superuser = True untuk test halaman admin.
+    """
+
+    superuser = False
+
+    def setUp(self):
+        super().setUp()
+        if self.superuser:
+            self.user = User.objects.create_superuser('root', 'root@example.com', 'rahasia123')
+        else:
+            self.user = User.objects.create_user('admin', password='rahasia123')
+        self.client.force_login(self.user)
+
+    def post_json(self, url, payload):
+        return self.client.post(url, json.dumps(payload), content_type='application/json')
+
+
+def async_get(view, user, path='/', **extra):
+    """Panggil view async langsung dengan user yang sudah login"""
+    request = AsyncRequestFactory().get(path, **extra)
+    request.user = user
+
+    async def auser():
+        return user
+
+    request.auser = auser
+    return async_to_sync(view)(request)
+
+
+def consume_async(response):
+    async def read():
+        return b''.join([chunk async for chunk in response.streaming_content])
+
+    return async_to_sync(read)()
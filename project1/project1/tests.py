@@ -0,0 +1,894 @@
+"""
+Test suite untuk modul project1 yang dipakai bersama semua app:
+pencarian, middleware, bulk API, listing, admin, static files dan startup
+"""
+
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from mahasiswa import stats
+from mahasiswa.models import Mahasiswa
+from dosen.models import Dosen
+from matakuliah.models import MataKuliah
+from project1.testing import LoginMixin, async_get, consume_async
+
+
+class FullTextSearchTests(LoginMixin, TestCase):
+    """Test pencarian FTS5 untuk mahasiswa dan mata kuliah"""
+
+    def setUp(self):
+        super().setUp()
+        from project1.search import search
+        self.search = search
+        self.budi = Mahasiswa.objects.create(
+            nama='Budi Santoso', npm='2023001', email='budi@example.com', jurusan='Sains Data'
+        )
+        self.siti = Mahasiswa.objects.create(
+            nama='Siti Nurhaliza', npm='2024002', email='siti@example.com', jurusan='Sains Data'
+        )
+
+    def found(self, query, model=Mahasiswa):
+        return set(self.search(model.objects.all(), query))
+
+    def test_prefix_npm_dan_nama(self):
+        """Test: Prefix NPM dan prefix kata pada nama ditemukan"""
+        self.assertEqual(self.found('2023'), {self.budi})
+        self.assertEqual(self.found('bud'), {self.budi})
+        self.assertEqual(self.found('santo bud'), {self.budi})
+        self.assertEqual(self.found('nurhal 2023'), set())
+
+    def test_index_sinkron_setelah_update_dan_delete(self):
+        """Test: Trigger menjaga index FTS tetap sinkron"""
+        self.budi.nama = 'Bambang Wijaya'
+        self.budi.save()
+        self.assertEqual(self.found('budi'), set())
+        self.assertEqual(self.found('wija'), {self.budi})
+        self.siti.delete()
+        self.assertEqual(self.found('siti'), set())
+
+    def test_ranking_kode_lebih_relevan(self):
+        """Test: Kecocokan pada kode MK diberi ranking lebih tinggi dari nama"""
+        from project1.search import get_search_backend
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        mining = MataKuliah.objects.create(
+            nama_mk='Data Mining', kode_mk='IF301', sks=3, semester=5, dosen_mk=dosen
+        )
+        kode = MataKuliah.objects.create(
+            nama_mk='Statistika', kode_mk='DATA1', sks=3, semester=1, dosen_mk=dosen
+        )
+        ranked = list(get_search_backend().rank(MataKuliah.objects.all(), 'data'))
+        self.assertEqual(ranked, [kode, mining])
+
+    @override_settings(SEARCH_BACKEND='project1.search.IContainsSearchBackend')
+    def test_backend_icontains(self):
+        """Test: Backend dapat diganti lewat settings.SEARCH_BACKEND"""
+        from project1.search import rank
+        self.assertEqual(self.found('ntos'), {self.budi})
+        # Prefix NPM lebih relevan dari kecocokan di tengah nama
+        self.siti.nama = 'Siti 2023'
+        self.siti.save()
+        self.assertEqual(list(rank(Mahasiswa.objects.all(), '2023')), [self.budi, self.siti])
+
+    def test_trigger_dipasang_ulang_setelah_migrate(self):
+        """Test: ensure_sqlite_fts memasang kembali trigger yang hilang"""
+        from project1.search import ensure_sqlite_fts
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER "mahasiswa_mahasiswa_fts_ai"')
+        Mahasiswa.objects.create(nama='Rina Kartika', npm='2023003', email='rina@example.com')
+        ensure_sqlite_fts()
+        self.assertEqual(len(self.found('rina')), 1)
+        Mahasiswa.objects.create(nama='Rina Amelia', npm='2023004', email='amel@example.com')
+        self.assertEqual(len(self.found('rina')), 2)
+
+    def test_view_memakai_pencarian(self):
+        """Test: Kotak pencarian input_mahasiswa memakai backend pencarian"""
+        response = self.client.get(reverse('input_mahasiswa'), {'q': 'siti'})
+        self.assertEqual(list(response.context['mahasiswa']), [self.siti])
+
+
+@override_settings(REQUEST_PROFILE_HEADER=True, REQUEST_PROFILE_MEMORY_SAMPLE_RATE=1.0)
+class RequestProfilingMiddlewareTests(LoginMixin, TestCase):
+    """Test header Server-Timing dan log ambang dari RequestProfilingMiddleware"""
+
+    def setUp(self):
+        super().setUp()
+        # Fragment tabel dari test lain akan mengurangi jumlah query
+        cache.clear()
+        dosen = Dosen.objects.create(nama='Dosen A', nidn='0011', email='a@example.com')
+        for i in range(3):
+            mk = MataKuliah.objects.create(nama_mk=f'MK {i}', kode_mk=f'MK{i}', sks=3, semester=1, dosen_mk=dosen)
+            mk.mhs_mk.add(Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202300{i}', email=f'm{i}@example.com'))
+
+    def test_server_timing_header(self):
+        """Test: Header berisi jumlah query, waktu SQL, waktu view dan memori"""
+        response = self.client.get(reverse('tampilkan_semua_data'))
+        header = response['Server-Timing']
+        self.assertRegex(header, r'sql;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('view;dur=', header)
+        self.assertIn('mem;desc="peak', header)
+        profile = response.wsgi_request.profile
+        self.assertGreater(profile['queries'], 0)
+        self.assertIsNotNone(profile['peak_kib'])
+
+    def test_query_berulang_terdeteksi(self):
+        """Test: Query dengan teks SQL sama (pola N+1) dihitung berulang"""
+        from project1.middleware import QueryRecorder
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for mk in MataKuliah.objects.all():
+                mk.dosen_mk.nama
+        self.assertEqual(recorder.count, 4)
+        self.assertEqual(recorder.max_duplicates, 3)
+
+    @override_settings(REQUEST_PROFILE_QUERY_THRESHOLD=1)
+    def test_melewati_ambang_dicatat_warning(self):
+        """Test: Request yang melewati ambang dicatat dengan level WARNING"""
+        import json
+        with self.assertLogs('project1.profiling', level='WARNING') as logs:
+            self.client.get(reverse('tampilkan_semua_data'))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'tampilkan_semua_data')
+        self.assertIn('too_many_queries', record['flags'])
+
+    @override_settings(REQUEST_PROFILING=False)
+    def test_nonaktif(self):
+        """Test: REQUEST_PROFILING=False tidak menambah header"""
+        response = self.client.get(reverse('tampilkan_semua_data'))
+        self.assertNotIn('Server-Timing', response)
+
+
+class BulkApiTests(LoginMixin, TestCase):
+    """Test endpoint bulk update / bulk delete"""
+
+    def setUp(self):
+        super().setUp()
+        self.mhs = [
+            Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202300{i}', email=f'm{i}@example.com', jurusan='Sains Data')
+            for i in range(5)
+        ]
+
+    def post(self, name, payload):
+        return self.post_json(reverse(name), payload)
+
+    def test_update_sebagian_gagal(self):
+        """Test: Item valid disimpan, item tidak valid dilaporkan per pk"""
+        response = self.post('mahasiswa_bulk_update', {'items': [
+            {'pk': self.mhs[0].pk, 'fields': {'nama': 'budi santoso', 'email': 'BUDI@Example.com'}},
+            {'pk': self.mhs[1].pk, 'fields': {'npm': 'abc12'}},
+            {'pk': 99999, 'fields': {'nama': 'Tidak Ada'}},
+        ]})
+        data = response.json()
+        self.assertEqual((data['updated'], data['failed']), (1, 2))
+        results = {item['pk']: item for item in data['results']}
+        self.assertIn('npm', results[self.mhs[1].pk]['errors'])
+        self.assertFalse(results[99999]['success'])
+        self.mhs[0].refresh_from_db()
+        self.assertEqual((self.mhs[0].nama, self.mhs[0].email), ('Budi Santoso', 'budi@example.com'))
+
+    def test_update_tipe_nilai_salah_dilaporkan_per_item(self):
+        """Test: Nilai JSON bertipe salah tidak menyebabkan 500, dilaporkan per item"""
+        response = self.post('mahasiswa_bulk_update', {'items': [
+            {'pk': self.mhs[0].pk, 'fields': {'email': 123}},
+            {'pk': self.mhs[1].pk, 'fields': {'nama': ['Budi']}},
+            {'pk': self.mhs[2].pk, 'fields': {'alamat': None}},
+            {'pk': self.mhs[3].pk, 'fields': {'alamat': 'Jl. Baru'}},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        results = {item['pk']: item for item in response.json()['results']}
+        self.assertIn('email', results[self.mhs[0].pk]['errors'])
+        self.assertIn('nama', results[self.mhs[1].pk]['errors'])
+        self.assertIn('alamat', results[self.mhs[2].pk]['errors'])
+        self.assertTrue(results[self.mhs[3].pk]['success'])
+
+    def test_update_pk_duplikat_ditolak(self):
+        """Test: pk yang muncul dua kali ditolak, tidak saling menimpa"""
+        data = self.post('mahasiswa_bulk_update', {'items': [
+            {'pk': self.mhs[0].pk, 'fields': {'nama': 'Pertama'}},
+            {'pk': self.mhs[0].pk, 'fields': {'nama': 'Kedua'}},
+        ]}).json()
+        self.assertEqual((data['updated'], data['failed']), (0, 1))
+        self.mhs[0].refresh_from_db()
+        self.assertEqual(self.mhs[0].nama, 'Mhs 0')
+
+    def test_pk_di_luar_rentang_400(self):
+        """Test: pk melebihi BIGINT -> 400, bukan OverflowError"""
+        response = self.post('mahasiswa_bulk_update', {'items': [{'pk': 10 ** 20, 'fields': {'nama': 'X'}}]})
+        self.assertEqual(response.status_code, 400)
+        response = self.post('mahasiswa_bulk_delete', {'pks': [10 ** 20]})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse('input_mahasiswa'), {'after': 10 ** 20})
+        self.assertEqual(response.status_code, 200)
+
+    def test_update_cek_keunikan_per_batch(self):
+        """Test: NPM bentrok dengan data lain atau sesama item batch ditolak"""
+        data = self.post('mahasiswa_bulk_update', {'items': [
+            {'pk': self.mhs[0].pk, 'fields': {'npm': self.mhs[4].npm}},
+            {'pk': self.mhs[1].pk, 'fields': {'npm': '2029999'}},
+            {'pk': self.mhs[2].pk, 'fields': {'npm': '2029999'}},
+            {'pk': self.mhs[3].pk, 'fields': {'email': 'baru@example.com'}},
+        ]}).json()
+        self.assertEqual(data['updated'], 1)
+        errors = [item['errors']['npm'][0] for item in data['results'] if not item['success']]
+        self.assertIn('sudah terdaftar', errors[0])
+        self.assertIn('duplikat di dalam batch', errors[1])
+
+    def test_jumlah_query_tidak_bertambah_per_item(self):
+        """Test: Jumlah query tetap sama untuk 1 atau 5 item"""
+        def run(mhs):
+            items = [{'pk': m.pk, 'fields': {'alamat': 'Jl. Baru'}} for m in mhs]
+            with CaptureQueriesContext(connection) as ctx:
+                self.post('mahasiswa_bulk_update', {'items': items})
+            return len(ctx.captured_queries)
+        self.assertEqual(run(self.mhs[:1]), run(self.mhs))
+
+    def test_atomic(self):
+        """Test: atomic=true tidak menyimpan apa pun jika ada item gagal"""
+        data = self.post('mahasiswa_bulk_update', {'atomic': True, 'items': [
+            {'pk': self.mhs[0].pk, 'fields': {'nama': 'Nama Baru'}},
+            {'pk': self.mhs[1].pk, 'fields': {'jurusan': 'Kedokteran'}},
+        ]}).json()
+        self.assertEqual(data['updated'], 0)
+        self.mhs[0].refresh_from_db()
+        self.assertEqual(self.mhs[0].nama, 'Mhs 0')
+
+    def test_update_invalidasi_statistik_dan_versi(self):
+        """Test: bulk_update melewati signal, jadi statistik & versi diperbarui manual"""
+        from project1 import versioning
+        before = versioning.get_versions()[versioning.MAHASISWA]
+        stats.get_stats()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post('mahasiswa_bulk_update', {'items': [
+                {'pk': self.mhs[0].pk, 'fields': {'jurusan': 'Teknologi Informasi'}},
+            ]})
+        self.assertEqual(stats.get_stats()['mahasiswa_by_jurusan'], {'Sains Data': 4, 'Teknologi Informasi': 1})
+        self.assertGreater(versioning.get_versions()[versioning.MAHASISWA], before)
+
+    def test_delete_mahasiswa(self):
+        """Test: Bulk delete mahasiswa dengan satu delete()"""
+        data = self.post('mahasiswa_bulk_delete', {'pks': [m.pk for m in self.mhs[:3]] + [99999]}).json()
+        self.assertEqual((data['deleted'], data['failed']), (3, 1))
+        self.assertEqual(Mahasiswa.objects.count(), 2)
+
+    def test_update_statistik_inkremental(self):
+        """Test: Hanya perubahan jurusan yang menyentuh DashboardStat, tanpa hitung ulang"""
+        def run(fields):
+            items = [{'pk': m.pk, 'fields': fields} for m in self.mhs[:2]]
+            with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+                self.post('mahasiswa_bulk_update', {'items': items})
+            queries = [q['sql'] for q in ctx.captured_queries]
+            self.assertFalse([sql for sql in queries if 'GROUP BY' in sql])
+            return [sql for sql in queries if 'dashboardstat' in sql]
+
+        self.assertEqual(run({'alamat': 'Jl. Baru'}), [])
+        self.assertTrue(run({'jurusan': 'Teknologi Informasi'}))
+        self.assertEqual(stats.get_stats()['mahasiswa_by_jurusan'], {'Sains Data': 3, 'Teknologi Informasi': 2})
+
+    def test_delete_statistik_dan_versi_sekali_per_batch(self):
+        """Test: Jumlah query tidak bertambah per baris, versi data dinaikkan sekali"""
+        from unittest import mock
+        from project1 import bulk, versioning
+        extra = [
+            Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202310{i}', email=f'x{i}@example.com', jurusan='Sains Data')
+            for i in range(5)
+        ]
+
+        def run(mhs):
+            # Handler per baris memanggil versioning.bump_version, bulk_delete lewat bulk.bump_version
+            bump = mock.Mock()
+            with CaptureQueriesContext(connection) as ctx, \
+                    mock.patch.object(versioning, 'bump_version', bump), mock.patch.object(bulk, 'bump_version', bump), \
+                    self.captureOnCommitCallbacks(execute=True):
+                self.post('mahasiswa_bulk_delete', {'pks': [m.pk for m in mhs]})
+            bump.assert_called_once_with(versioning.MAHASISWA)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(self.mhs[:1]), run(extra))
+        self.assertEqual(stats.get_stats()['mahasiswa_by_jurusan'], {'Sains Data': 4})
+
+    def test_payload_tidak_valid(self):
+        """Test: Payload yang salah format ditolak dengan 400"""
+        response = self.client.post(reverse('mahasiswa_bulk_delete'), 'bukan json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        response = self.post('mahasiswa_bulk_update', {'items': [{'pk': 'x'}]})
+        self.assertEqual(response.status_code, 400)
+
+
+class ConditionalGetTests(LoginMixin, TestCase):
+    """Test ETag/304 dari versi data pada listing dan export"""
+
+    def setUp(self):
+        super().setUp()
+        Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com', jurusan='Sains Data')
+
+    def test_listing_304_tanpa_query_data(self):
+        """Test: If-None-Match yang cocok -> 304 tanpa query ke tabel mahasiswa"""
+        url = reverse('input_mahasiswa')
+        # Request pertama mengeset cookie CSRF yang ikut menentukan ETag
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertNotIn('no-store', response['Cache-Control'])
+        etag = response['ETag']
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([q for q in ctx.captured_queries if 'mahasiswa_mahasiswa' in q['sql']])
+
+    def test_etag_berubah_setelah_data_berubah(self):
+        """Test: Perubahan data menaikkan versi sehingga ETag lama tidak berlaku"""
+        url = reverse('tampilkan_semua_data')
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            Dosen.objects.create(nama='Dosen A', nidn='0011', email='a@example.com')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_tergantung_query_string(self):
+        """Test: Filter/halaman berbeda punya ETag berbeda"""
+        url = reverse('input_mahasiswa')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, {'jurusan': 'Sains Data'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_export_304(self):
+        """Test: Export ulang tanpa perubahan data cukup dijawab 304"""
+        url = reverse('export_mahasiswa_csv')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_tanpa_etag_saat_ada_pesan(self):
+        """Test: Halaman dengan pesan flash selalu dirender penuh"""
+        response = self.client.post(reverse('input_mahasiswa'), {
+            'nama': 'Andi Wijaya', 'npm': '2023002', 'email': 'andi@example.com',
+            'jurusan': 'Sains Data',
+        })
+        self.assertEqual(response.status_code, 302)
+        response = self.client.get(reverse('input_mahasiswa'))
+        self.assertNotIn('ETag', response)
+        self.assertContains(response, 'berhasil ditambahkan')
+
+    def test_versi_dipakai_bersama_antar_worker(self):
+        """Test: Versi yang dinaikkan worker A langsung terlihat oleh worker B (cache file bersama)"""
+        import tempfile
+        from unittest import mock
+        from django.core.cache.backends.filebased import FileBasedCache
+        from project1 import versioning
+        from project1.caches import default_cache
+        self.assertIn('FileBasedCache', default_cache('/tmp/x', env={})['BACKEND'])
+        with tempfile.TemporaryDirectory() as location:
+            worker_a, worker_b = FileBasedCache(location, {}), FileBasedCache(location, {})
+            with mock.patch.object(versioning, 'cache', worker_b):
+                token = versioning.version_token()
+            with mock.patch.object(versioning, 'cache', worker_a):
+                versioning.bump_version(versioning.MAHASISWA)
+            with mock.patch.object(versioning, 'cache', worker_b):
+                self.assertNotEqual(versioning.version_token(), token)
+
+
+class ListingApiTests(LoginMixin, TestCase):
+    """Test endpoint JSON daftar data (sorting, filter, cursor)"""
+
+    def setUp(self):
+        super().setUp()
+        for i, nama in enumerate(['Citra', 'Andi', 'Budi', 'Andi', 'Dewi']):
+            Mahasiswa.objects.create(
+                nama=nama, npm=f'202300{i}', email=f'm{i}@example.com',
+                jurusan='Sains Data' if i % 2 else 'Teknologi Informasi',
+            )
+
+    def get(self, name='mahasiswa_list_api', **params):
+        return self.client.get(reverse(name), params)
+
+    def fetch_all(self, name='mahasiswa_list_api', **params):
+        rows, cursor = [], None
+        while True:
+            if cursor:
+                params['cursor'] = cursor
+            data = self.get(name, **params).json()
+            rows += data['rows']
+            cursor = data['next_cursor']
+            if not cursor:
+                return data['columns'], rows
+
+    def test_payload_kolom(self):
+        """Test: Nama kolom dikirim sekali, setiap baris berupa array"""
+        data = self.get(per_page=2).json()
+        self.assertEqual(data['columns'][:3], ['id', 'nama', 'npm'])
+        self.assertEqual(len(data['rows']), 2)
+        self.assertEqual(data['rows'][0][1], 'Citra')
+        self.assertIsNotNone(data['next_cursor'])
+
+    def test_sort_dengan_cursor(self):
+        """Test: Urutan nama (nilai sama diurutkan id) stabil di semua halaman"""
+        columns, rows = self.fetch_all(sort='-nama', per_page=2)
+        self.assertEqual([row[1] for row in rows], ['Dewi', 'Citra', 'Budi', 'Andi', 'Andi'])
+        self.assertGreater(rows[3][0], rows[4][0])
+
+    def test_filter_dan_search(self):
+        """Test: Filter jurusan dan pencarian diterapkan di server"""
+        columns, rows = self.fetch_all(jurusan='Sains Data')
+        self.assertEqual([row[1] for row in rows], ['Andi', 'Andi'])
+        columns, rows = self.fetch_all(q='Budi')
+        self.assertEqual([row[1] for row in rows], ['Budi'])
+
+    def test_parameter_tidak_valid(self):
+        """Test: Kolom sort tidak dikenal, cursor rusak atau filter salah -> 400"""
+        self.assertEqual(self.get(sort='alamat').status_code, 400)
+        self.assertEqual(self.get(cursor='xxx').status_code, 400)
+        self.assertEqual(self.get('matakuliah_list_api', semester='abc').status_code, 400)
+
+    def test_nilai_cursor_tidak_cocok_tipe_kolom(self):
+        """Test: Nilai cursor salah tipe, null atau id di luar BIGINT -> 400, bukan 500"""
+        from project1.listing import encode_cursor
+        for sort, value, pk in [('sks', 'abc', 1), ('sks', None, 1), ('sks', 10 ** 20, 1),
+                                ('nama_mk', 'MK', 10 ** 20), ('jumlah_mahasiswa', [1], 1)]:
+            response = self.get('matakuliah_list_api', sort=sort, cursor=encode_cursor(value, pk))
+            self.assertEqual(response.status_code, 400, (sort, value, pk))
+            self.assertFalse(response.json()['success'])
+        # Angka dalam string dikonversi oleh to_python() field
+        response = self.get('matakuliah_list_api', sort='sks', cursor=encode_cursor('3', 1))
+        self.assertEqual(response.status_code, 200)
+
+    def test_matakuliah_sort_jumlah_mahasiswa(self):
+        """Test: Kolom hasil annotate bisa diurutkan dan dipaginasi"""
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        ids = list(Mahasiswa.objects.values_list('pk', flat=True))
+        for i in range(4):
+            mk = MataKuliah.objects.create(nama_mk=f'MK {i}', kode_mk=f'MK{i}', sks=3, semester=1, dosen_mk=dosen)
+            mk.mhs_mk.add(*ids[:i])
+        columns, rows = self.fetch_all('matakuliah_list_api', sort='-jumlah_mahasiswa', per_page=1)
+        index = columns.index('jumlah_mahasiswa')
+        self.assertEqual([row[index] for row in rows], [3, 2, 1, 0])
+        self.assertEqual(rows[0][columns.index('dosen')], 'Dr. Andi')
+
+    def test_pencarian_urut_relevansi(self):
+        """Test: Tanpa ?sort hasil ?q= diurutkan dari yang paling relevan, cursor tetap jalan"""
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        for i in range(3):
+            MataKuliah.objects.create(nama_mk=f'Data Mining {i}', kode_mk=f'IF30{i}', sks=3, semester=5,
+                                      dosen_mk=dosen)
+        MataKuliah.objects.create(nama_mk='Statistika', kode_mk='DATA1', sks=3, semester=1, dosen_mk=dosen)
+        columns, rows = self.fetch_all('matakuliah_list_api', q='data', per_page=1)
+        self.assertEqual(columns[-1], 'search_rank')
+        self.assertEqual([row[columns.index('kode_mk')] for row in rows], ['DATA1', 'IF302', 'IF301', 'IF300'])
+        # ?sort tetap diutamakan
+        columns, rows = self.fetch_all('matakuliah_list_api', q='data', sort='kode_mk')
+        self.assertNotIn('search_rank', columns)
+        self.assertEqual(rows[0][columns.index('kode_mk')], 'DATA1')
+
+    def test_halaman_awal_kecil(self):
+        """Test: tampilkan_semua_data hanya merender halaman pertama"""
+        cache.clear()
+        with self.settings(LISTING_PAGE_SIZE=2):
+            response = self.client.get(reverse('tampilkan_semua_data'))
+        self.assertContains(response, 'data-list-url', count=1)
+        self.assertEqual(response.content.decode().count('<tr data-id='), 2)
+
+
+class DatabaseProfileTests(TestCase):
+    """Test profil database dari environment (project1/database.py)"""
+
+    def test_profil_sqlite_default(self):
+        """Test: Profil default memakai WAL, BEGIN IMMEDIATE dan koneksi persisten"""
+        from project1.database import database_from_env
+        config = database_from_env('/tmp/db.sqlite3', env={})
+        self.assertIn('PRAGMA journal_mode=WAL', config['OPTIONS']['init_command'])
+        self.assertEqual(config['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertGreater(config['CONN_MAX_AGE'], 0)
+
+    def test_asgi_tanpa_koneksi_persisten(self):
+        """Test: CONN_MAX_AGE default 0 saat ASYNC_VIEWS aktif, tetap bisa ditimpa"""
+        from project1.database import database_from_env
+        config = database_from_env('/tmp/db.sqlite3', env={'ASYNC_VIEWS': '1'})
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        config = database_from_env('/tmp/db.sqlite3', env={'ASYNC_VIEWS': '1', 'DB_CONN_MAX_AGE': '60'})
+        self.assertEqual(config['CONN_MAX_AGE'], 60)
+
+    def test_override_dari_environment(self):
+        """Test: Pragma, path dan profil bisa diganti lewat environment"""
+        from project1.database import database_from_env
+        config = database_from_env('/tmp/db.sqlite3', env={'SQLITE_CACHE_SIZE': '-1000', 'SQLITE_PATH': '/data/x.db'})
+        self.assertIn('PRAGMA cache_size=-1000', config['OPTIONS']['init_command'])
+        self.assertEqual(config['NAME'], '/data/x.db')
+        basic = database_from_env('/tmp/db.sqlite3', env={'DB_PROFILE': 'sqlite-basic'})
+        self.assertNotIn('OPTIONS', basic)
+        with self.assertRaises(ValueError):
+            database_from_env('/tmp/db.sqlite3', env={'DB_PROFILE': 'oracle'})
+
+    def test_profil_postgres(self):
+        """Test: Profil postgres dari POSTGRES_*, pool atau koneksi persisten"""
+        from project1.database import database_from_env, is_postgres
+        env = {'DB_PROFILE': 'postgres', 'POSTGRES_DB': 'kampus', 'POSTGRES_PORT': '5433', 'DB_POOL_MAX_SIZE': '20'}
+        config = database_from_env('/tmp/db.sqlite3', env=env)
+        self.assertTrue(is_postgres(config))
+        self.assertEqual((config['NAME'], config['PORT']), ('kampus', '5433'))
+        self.assertEqual(config['OPTIONS']['pool']['max_size'], 20)
+        # Django menolak pool bersama CONN_MAX_AGE > 0
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+
+        config = database_from_env('/tmp/db.sqlite3', env=dict(env, DB_POOL='0'))
+        self.assertNotIn('pool', config['OPTIONS'])
+        self.assertGreater(config['CONN_MAX_AGE'], 0)
+
+    def test_migration_trigram_hanya_postgres(self):
+        """Test: Index trigram tidak dibuat di SQLite"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('Hanya untuk SQLite')
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE '%trgm'")
+            self.assertEqual(cursor.fetchall(), [])
+
+    def test_pragma_aktif_di_koneksi(self):
+        """Test: init_command dijalankan saat koneksi dibuka"""
+        if connection.vendor != 'sqlite' or 'init_command' not in connection.settings_dict['OPTIONS']:
+            self.skipTest('Profil SQLite tidak aktif')
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 5000)
+
+
+class AsyncViewTests(LoginMixin, TestCase):
+    """Test view baca async (export CSV, api/list/) sama dengan versi sync"""
+
+    def setUp(self):
+        super().setUp()
+        dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        mk = MataKuliah.objects.create(nama_mk='Basis Data', kode_mk='BD01', sks=3, semester=3, dosen_mk=dosen)
+        for i in range(5):
+            mk.mhs_mk.add(Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202300{i}', email=f'm{i}@example.com'))
+
+    def test_export_csv_async_sama_dengan_sync(self):
+        """Test: Export CSV async di-stream dengan isi yang sama"""
+        from mahasiswa import async_views
+        sync_body = b''.join(self.client.get(reverse('export_all_data_csv')).streaming_content)
+        response = async_get(async_views.export_all_data_csv, self.user)
+        self.assertTrue(response.is_async)
+        self.assertEqual(consume_async(response), sync_body)
+        self.assertIn('ETag', response)
+
+    def test_list_api_async_dan_304(self):
+        """Test: api/list/ async memberi payload yang sama dan menghormati If-None-Match"""
+        from matakuliah import async_views
+        sync_data = self.client.get(reverse('matakuliah_list_api')).json()
+        response = async_get(async_views.matakuliah_list_api, self.user, '/matakuliah/api/list/')
+        import json
+        self.assertEqual(json.loads(response.content), sync_data)
+        again = async_get(async_views.matakuliah_list_api, self.user, '/matakuliah/api/list/',
+                          headers={'If-None-Match': response['ETag']})
+        self.assertEqual(again.status_code, 304)
+
+    def test_middleware_async_tanpa_pindah_thread(self):
+        """Test: Middleware proyek async capable; query async ORM tetap terhitung"""
+        from asgiref.sync import async_to_sync, iscoroutinefunction
+        from django.http import HttpResponse
+        from project1.compression import CompressionMiddleware
+        from project1.middleware import RequestProfilingMiddleware
+
+        async def view(request):
+            count = await Mahasiswa.objects.acount()
+            return HttpResponse('<p>%d</p>' % count * 500, content_type='text/html')
+
+        handler = RequestProfilingMiddleware(CompressionMiddleware(view))
+        self.assertTrue(iscoroutinefunction(handler))
+        request = AsyncRequestFactory().get('/', headers={'Accept-Encoding': 'gzip'})
+        response = async_to_sync(handler)(request)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(request.profile['queries'], 1)
+        self.assertEqual(request.profile['encoding'], 'gzip')
+
+
+class SessionProfileTests(LoginMixin, TestCase):
+    """Test profil sesi/pesan (project1/sessions.py)"""
+
+    def test_pilih_profil_dari_environment(self):
+        """Test: Default cached_db + pesan di cookie, profil lain lewat SESSION_PROFILE"""
+        from project1.sessions import session_cache, session_storage
+        engine, storage = session_storage(env={})
+        self.assertEqual(engine, 'django.contrib.sessions.backends.cached_db')
+        self.assertTrue(storage.endswith('CookieStorage'))
+        self.assertEqual(session_storage(env={'SESSION_PROFILE': 'signed_cookies'})[0],
+                         'django.contrib.sessions.backends.signed_cookies')
+        with self.assertRaises(ValueError):
+            session_storage(env={'SESSION_PROFILE': 'redis'})
+        self.assertEqual(session_cache('/tmp/s', env={})['LOCATION'], '/tmp/s')
+        self.assertIn('LocMemCache', session_cache('/tmp/s', env={'SESSION_CACHE': 'locmem'})['BACKEND'])
+        self.assertIn('LocMemCache', session_cache('/tmp/s', env={}, default_backend='locmem')['BACKEND'])
+
+    def test_cache_sesi_di_luar_source_tree(self):
+        """Test: Test suite memakai locmem, lokasi file default tidak di dalam BASE_DIR"""
+        from django.conf import settings
+        self.assertIn('LocMemCache', settings.CACHES['sessions']['BACKEND'])
+        self.assertFalse(settings.STATE_DIR.resolve().is_relative_to(settings.BASE_DIR.resolve()))
+
+    def test_delete_dan_listing_tanpa_query_sesi(self):
+        """Test: Dengan cached_db, hapus data + pesan flash tidak menyentuh django_session"""
+        mhs = Mahasiswa.objects.create(nama='Budi', npm='2023001', email='budi@example.com')
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(reverse('mahasiswa_delete', args=[mhs.pk]))
+            response = self.client.get(reverse('input_mahasiswa'))
+        self.assertContains(response, 'berhasil dihapus')
+        self.assertFalse([q for q in ctx.captured_queries if 'django_session' in q['sql']])
+
+
+class AdminPerformanceTests(LoginMixin, TestCase):
+    """Test changelist admin: select_related, kolom jumlah mahasiswa, pencarian dan autocomplete"""
+
+    superuser = True
+
+    def setUp(self):
+        super().setUp()
+        self.dosen = Dosen.objects.create(nama='Dr. Andi', nidn='0011223344', email='andi@example.com')
+        self.mhs = [
+            Mahasiswa.objects.create(nama=f'Mhs {i}', npm=f'202300{i}', email=f'm{i}@example.com') for i in range(3)
+        ]
+
+    def add_matakuliah(self, count):
+        for i in range(count):
+            mk = MataKuliah.objects.create(nama_mk=f'MK {i}', kode_mk=f'ADM{i:03d}', sks=2, semester=1,
+                                           dosen_mk=self.dosen)
+            mk.mhs_mk.set(self.mhs[:i % 3 + 1])
+
+    def changelist_queries(self, count):
+        self.add_matakuliah(count)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('admin:matakuliah_matakuliah_changelist'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_changelist_query_tetap(self):
+        """Test: Jumlah query changelist mata kuliah tidak bertambah per baris"""
+        few, _ = self.changelist_queries(2)
+        MataKuliah.objects.all().delete()
+        many, response = self.changelist_queries(20)
+        self.assertEqual(few, many)
+        self.assertContains(response, 'Jumlah Mahasiswa')
+
+    def test_pencarian_kode_dan_email(self):
+        """Test: NPM dicari sebagai prefix, email persis, kode_mk persis lewat index"""
+        url = reverse('admin:mahasiswa_mahasiswa_changelist')
+        response = self.client.get(url, {'q': '2023001'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+        response = self.client.get(url, {'q': 'M1@Example.com'})
+        self.assertEqual(list(response.context['cl'].result_list), [self.mhs[1]])
+        self.add_matakuliah(12)
+        response = self.client.get(reverse('admin:matakuliah_matakuliah_changelist'), {'q': 'ADM001'})
+        self.assertEqual([mk.kode_mk for mk in response.context['cl'].result_list], ['ADM001'])
+
+    def test_pencarian_urut_relevansi(self):
+        """Test: Hasil pencarian changelist dan autocomplete diurutkan berdasarkan relevansi"""
+        self.add_matakuliah(2)
+        MataKuliah.objects.create(nama_mk='Pengantar ADM', kode_mk='PKN100', sks=2, semester=1, dosen_mk=self.dosen)
+        url = reverse('admin:matakuliah_matakuliah_changelist')
+        response = self.client.get(url, {'q': 'adm'})
+        self.assertEqual([mk.kode_mk for mk in response.context['cl'].result_list], ['ADM000', 'ADM001', 'PKN100'])
+        # Urutan pilihan user (klik header kolom) tetap dipakai
+        response = self.client.get(url, {'q': 'adm', 'o': '-1'})
+        self.assertEqual(response.context['cl'].result_list[0].kode_mk, 'PKN100')
+
+    def test_autocomplete_mahasiswa(self):
+        """Test: Widget mhs_mk memakai autocomplete (bukan filter_horizontal)"""
+        response = self.client.get(reverse('admin:autocomplete'), {
+            'term': '2023002', 'app_label': 'matakuliah', 'model_name': 'matakuliah', 'field_name': 'mhs_mk',
+        })
+        self.assertEqual([item['id'] for item in response.json()['results']], [str(self.mhs[2].pk)])
+        response = self.client.get(reverse('admin:matakuliah_matakuliah_add'))
+        self.assertContains(response, 'admin-autocomplete')
+
+    def test_hapus_lewat_action(self):
+        """Test: Action hapus tetap jalan dengan queryset yang di-annotate"""
+        self.add_matakuliah(3)
+        response = self.client.post(reverse('admin:matakuliah_matakuliah_changelist'), {
+            'action': 'delete_selected', 'post': 'yes',
+            '_selected_action': [mk.pk for mk in MataKuliah.objects.all()],
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(MataKuliah.objects.exists())
+
+
+class StaticFilesPipelineTests(LoginMixin, TestCase):
+    """Test collectstatic (hash + .gz) dan StaticFilesMiddleware"""
+
+    def setUp(self):
+        super().setUp()
+        import tempfile
+        from django.core.management import call_command
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(__import__('shutil').rmtree, self.root, True)
+        self.settings_override = override_settings(STATIC_ROOT=self.root)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        call_command('collectstatic', interactive=False, verbosity=0, ignore_patterns=['admin'])
+
+    def middleware(self):
+        from django.http import HttpResponse
+        from project1.staticfiles import StaticFilesMiddleware
+        return StaticFilesMiddleware(lambda request: HttpResponse('view'))
+
+    def get(self, path, **headers):
+        from django.test import RequestFactory
+        return self.middleware()(RequestFactory().get(path, headers=headers))
+
+    def test_collectstatic_hash_dan_gzip(self):
+        """Test: File ber-hash dan varian .gz ditulis, template memakai nama ber-hash"""
+        import gzip
+        import os
+        from django.templatetags.static import static
+        url = static('css/input.css')
+        self.assertRegex(url, r'^/static/css/input\.[0-9a-f]{12}\.css$')
+        path = os.path.join(self.root, url[len('/static/'):])
+        with open(path, 'rb') as original, open(path + '.gz', 'rb') as compressed:
+            self.assertEqual(gzip.decompress(compressed.read()), original.read())
+
+    def test_middleware_cache_dan_encoding(self):
+        """Test: File ber-hash immutable, varian gzip sesuai Accept-Encoding, 304 dari ETag"""
+        from django.templatetags.static import static
+        url = static('mahasiswa/js/input.js')
+        response = self.get(url, accept_encoding='gzip, deflate')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertTrue(response['Content-Type'].startswith('text/javascript'))
+        response.close()
+
+        plain = self.get('/static/mahasiswa/js/input.js')
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertEqual(plain['Cache-Control'], 'public, max-age=60')
+        self.assertIn(b'function', b''.join(plain.streaming_content))
+
+        again = self.get(url, if_none_match=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(self.get('/static/tidak-ada.css').content, b'view')
+
+    def test_middleware_async(self):
+        """Test: Di bawah ASGI file static disajikan tanpa melewati view"""
+        from asgiref.sync import async_to_sync, iscoroutinefunction
+        from django.http import HttpResponse
+        from project1.staticfiles import StaticFilesMiddleware
+
+        async def view(request):
+            return HttpResponse('view')
+
+        middleware = StaticFilesMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(AsyncRequestFactory().get('/static/mahasiswa/js/input.js'))
+        self.assertIn(b'function', b''.join(response.streaming_content))
+        response = async_to_sync(middleware)(AsyncRequestFactory().get('/static/tidak-ada.css'))
+        self.assertEqual(response.content, b'view')
+
+    def test_halaman_tanpa_css_js_inline(self):
+        """Test: CSS/JS halaman tidak lagi dikirim inline di setiap response"""
+        for name in ('home', 'tampilkan_semua_data', 'input_mahasiswa', 'input_dosen', 'input_matakuliah'):
+            content = self.client.get(reverse(name)).content.decode()
+            self.assertNotIn('<style>', content, name)
+            self.assertNotIn('<script>', content, name)
+            self.assertRegex(content, r'/static/[\w/]+\.[0-9a-f]{12}\.css', name)
+
+
+class CompressionMiddlewareTests(LoginMixin, TestCase):
+    """Test kompresi gzip, ambang ukuran, streaming dan minify HTML"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        for i in range(40):
+            Mahasiswa.objects.create(nama=f'Mahasiswa {i}', npm=f'2023{i:04d}', email=f'm{i}@example.com')
+
+    def test_html_besar_dikompresi_gzip(self):
+        """Test: Halaman HTML besar dikirim gzip dengan Vary: Accept-Encoding"""
+        import gzip
+        response = self.client.get(reverse('tampilkan_semua_data'), headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertIn('Mahasiswa 0', gzip.decompress(response.content).decode())
+        sizes = response.wsgi_request.compression
+        self.assertLess(sizes['sent_bytes'], sizes['original_bytes'])
+
+    def test_tanpa_accept_encoding_atau_q0(self):
+        """Test: Client tanpa gzip atau dengan gzip;q=0 menerima body asli"""
+        for header in ('', 'gzip;q=0', 'identity'):
+            response = self.client.get(reverse('tampilkan_semua_data'), headers={'Accept-Encoding': header})
+            self.assertNotIn('Content-Encoding', response)
+            self.assertIn('Mahasiswa 0', response.content.decode())
+
+    def test_response_kecil_tidak_dikompresi(self):
+        """Test: Response di bawah COMPRESSION_MIN_SIZE dikirim apa adanya"""
+        with override_settings(COMPRESSION_MIN_SIZE=10 ** 7):
+            response = self.client.get(reverse('tampilkan_semua_data'), headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_xlsx_tidak_dikompresi(self):
+        """Test: File XLSX (sudah berupa zip) tidak dikompresi ulang"""
+        response = self.client.get(reverse('export_mahasiswa_excel'), headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_csv_streaming_dikompresi(self):
+        """Test: Export CSV streaming dikompresi per potongan tanpa Content-Length"""
+        import gzip
+        response = self.client.get(reverse('export_mahasiswa_csv'), headers={'Accept-Encoding': 'gzip'})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', response)
+        body = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8-sig')
+        self.assertIn('Mahasiswa 39', body)
+
+    def test_minify_html(self):
+        """Test: Whitespace dirapatkan kecuali di pre/textarea/script"""
+        from project1.compression import minify_html
+        html = '<div>\n    <p>A   B</p>\n\n</div><pre>  x\n  y</pre><textarea>  a  </textarea>'
+        self.assertEqual(
+            minify_html(html),
+            '<div>\n<p>A B</p>\n</div><pre>  x\n  y</pre><textarea>  a  </textarea>',
+        )
+
+    @override_settings(HTML_MINIFY=True, REQUEST_PROFILE_HEADER=True)
+    def test_bytes_saved_di_server_timing(self):
+        """Test: Server-Timing melaporkan ukuran asli, terkirim dan penghematan"""
+        response = self.client.get(reverse('tampilkan_semua_data'), headers={'Accept-Encoding': 'gzip'})
+        sizes = response.wsgi_request.compression
+        self.assertEqual(sizes['encoding'], 'gzip')
+        self.assertIn(
+            f'bytes;desc="gzip {sizes["original_bytes"]} -> {sizes["sent_bytes"]} B, '
+            f'saved {sizes["original_bytes"] - sizes["sent_bytes"]} B"',
+            response['Server-Timing'],
+        )
+
+
+class StartupImportTests(TestCase):
+    """Test regresi modul yang di-import saat worker start (django.setup() + URLconf)"""
+
+    # Modul yang ditambahkan proyek di atas baseline Django (startup.baseline_code),
+    # dihitung seperti output startup_profile. Diukur 61 modul; openpyxl saja
+    # menambah hampir 190 modul
+    MAX_PROJECT_MODULES = 80
+    LAZY_PACKAGES = ('openpyxl', 'brotli')
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from project1.startup import baseline_code, import_times, startup_modules
+        cls.modules = startup_modules()
+        cls.project_modules = len(import_times()) - len(import_times(baseline_code()))
+
+    def test_dependensi_berat_tidak_diimport(self):
+        """Test: openpyxl/brotli baru di-import saat export/kompresi dipakai"""
+        packages = {module.split('.')[0] for module in self.modules}
+        self.assertFalse(packages & set(self.LAZY_PACKAGES))
+        self.assertIn('mahasiswa.views', self.modules)
+        self.assertIn('project1.compression', self.modules)
+        self.assertIn('project1.staticfiles', self.modules)
+
+    def test_jumlah_modul_proyek_dibatasi(self):
+        """Test: Modul tambahan proyek di atas baseline Django tidak melewati batas"""
+        self.assertGreater(self.project_modules, 0)
+        self.assertLessEqual(self.project_modules, self.MAX_PROJECT_MODULES)
+
+    def test_brotli_diimport_saat_kompresi(self):
+        """Test: Modul kompresi tidak meng-import brotli di level modul"""
+        import ast
+        import inspect
+        from project1 import compression, staticfiles
+        # Dicek dari source karena brotli belum tentu terpasang di environment test
+        for module in (compression, staticfiles):
+            names = set()
+            for node in ast.parse(inspect.getsource(module)).body:
+                for statement in node.body if isinstance(node, ast.Try) else [node]:
+                    if isinstance(statement, ast.Import):
+                        names.update(alias.name for alias in statement.names)
+            self.assertNotIn('brotli', names, module.__name__)
+
+    def test_command_startup_profile(self):
+        """Test: manage.py startup_profile menampilkan waktu per app"""
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('startup_profile', top=3, stdout=out)
+        output = out.getvalue()
+        self.assertRegex(output, r'\d+ modul, total [\d.]+ ms')
+        self.assertRegex(output, r'proyek menambah \d+ modul')
+        self.assertRegex(output, r'mahasiswa\s+app\s+\d+')
+        self.assertIn('Modul termahal', output)
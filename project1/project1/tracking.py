@@ -0,0 +1,26 @@
+"""
+Nilai field saat instance dimuat dari database, untuk mendeteksi perubahan
+di signal post_save/post_delete (lihat mahasiswa/signals.py).
+
+Dicatat di Model.from_db(), bukan lewat signal post_init: from_db hanya
+dipanggil untuk baris dari database dan tanpa dispatch signal, sedangkan
+post_init dijalankan untuk setiap instance yang dibuat (termasuk import
+massal yang membuat ribuan instance baru).
+"""
+
+
+class LoadedValuesMixin:
+    """
+    tracked_fields: nama field yang nilainya disimpan di instance.loaded_values.
+    Field yang di-defer tidak dicatat (tidak memicu query tambahan).
+    """
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_values = {
+            name: instance.__dict__[name] for name in cls.tracked_fields if name in instance.__dict__
+        }
+        return instance
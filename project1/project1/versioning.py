@@ -0,0 +1,70 @@
+"""
+Versi data per entitas (Mahasiswa, Dosen, MataKuliah).
+
+Versi disimpan sebagai counter di cache Django dan dinaikkan setiap kali
+data entitas berubah: oleh signal (lihat mahasiswa/signals.py) atau secara
+eksplisit dengan bump_version() pada jalur bulk yang melewati signal
+(bulk_create, update(), bulk_update). Selama versi sama, data dianggap tidak
+berubah, sehingga versi bisa dipakai sebagai bagian kunci cache, ETag atau
+artifact export.
+
+Counter harus dibaca semua worker dari tempat yang sama, karena itu cache
+'default' adalah FileBasedCache bersama (lihat project1/caches.py). Setiap
+kenaikan menulis nilai baru berbasis waktu (nanodetik) alih-alih incr():
+incr() FileBasedCache tidak atomik antar proses, dua perubahan bersamaan
+bisa menghasilkan versi yang sama dan ETag lama tetap dianggap valid.
+"""
+
+import time
+
+from django.core.cache import cache
+
+MAHASISWA = 'mahasiswa.mahasiswa'
+DOSEN = 'dosen.dosen'
+MATAKULIAH = 'matakuliah.matakuliah'
+VERSIONED_MODELS = (MAHASISWA, DOSEN, MATAKULIAH)
+# Tampilan mata kuliah memuat nama dosen dan jumlah mahasiswa
+MATAKULIAH_SUMMARY = (MATAKULIAH, DOSEN, MAHASISWA)
+
+KEY_PREFIX = 'data_version:'
+
+
+def _key(label):
+    return KEY_PREFIX + label
+
+
+def _new_version(current=0):
+    # Berbasis waktu supaya versi lama tidak terulang setelah cache hilang
+    # atau ditulis dua worker bersamaan; tetap naik walau jam mundur sedikit
+    return max(time.time_ns(), current + 1)
+
+
+def get_versions(labels=VERSIONED_MODELS):
+    """{label: versi} untuk setiap label, dibaca dengan satu get_many"""
+    keys = [_key(label) for label in labels]
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        initial = _new_version()
+        for key in missing:
+            cache.add(key, initial, None)
+        found.update(cache.get_many(missing))
+    return {label: found[_key(label)] for label in labels}
+
+
+def version_token(labels=VERSIONED_MODELS):
+    """Satu string versi gabungan, contoh: 'mahasiswa.mahasiswa=12;dosen.dosen=4'"""
+    versions = get_versions(labels)
+    return ';'.join(f'{label}={versions[label]}' for label in labels)
+
+
+def bump_version(*labels):
+    current = cache.get_many([_key(label) for label in labels])
+    cache.set_many({
+        _key(label): _new_version(current.get(_key(label), 0))
+        for label in labels
+    }, None)
+
+
+def bump_all():
+    bump_version(*VERSIONED_MODELS)
@@ -0,0 +1,154 @@
+// Chart colors
+const chartColors = {
+    blue: 'rgba(0, 123, 255, 0.8)',
+    green: 'rgba(40, 167, 69, 0.8)',
+    yellow: 'rgba(255, 193, 7, 0.8)',
+    purple: 'rgba(102, 126, 234, 0.8)',
+    pink: 'rgba(220, 53, 69, 0.8)',
+    cyan: 'rgba(23, 162, 184, 0.8)',
+};
+
+const borderColors = {
+    blue: 'rgb(0, 123, 255)',
+    green: 'rgb(40, 167, 69)',
+    yellow: 'rgb(255, 193, 7)',
+    purple: 'rgb(102, 126, 234)',
+    pink: 'rgb(220, 53, 69)',
+    cyan: 'rgb(23, 162, 184)',
+};
+
+const colorArray = [
+    { bg: chartColors.blue, border: borderColors.blue },
+    { bg: chartColors.green, border: borderColors.green },
+    { bg: chartColors.yellow, border: borderColors.yellow },
+    { bg: chartColors.purple, border: borderColors.purple },
+    { bg: chartColors.pink, border: borderColors.pink },
+    { bg: chartColors.cyan, border: borderColors.cyan },
+];
+
+// Fetch and render charts
+async function loadCharts() {
+    try {
+        const response = await fetch(document.body.dataset.statsUrl);
+        const data = await response.json();
+
+        // Mahasiswa Chart
+        renderMahasiswaChart(data.mahasiswa_by_jurusan);
+
+        // Dosen Chart
+        renderDosenChart(data.dosen_by_homebase);
+
+        // Mata Kuliah Chart
+        renderMatakuliahChart(data.matakuliah_by_semester);
+    } catch (error) {
+        console.error('Error loading charts:', error);
+    }
+}
+
+function renderMahasiswaChart(data) {
+    const ctx = document.getElementById('mahasiswaChart').getContext('2d');
+    new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: data.map(item => item.jurusan || 'Tidak Ada'),
+            datasets: [{
+                label: 'Jumlah Mahasiswa',
+                data: data.map(item => item.count),
+                backgroundColor: data.map((_, i) => colorArray[i % colorArray.length].bg),
+                borderColor: data.map((_, i) => colorArray[i % colorArray.length].border),
+                borderWidth: 2,
+                borderRadius: 5,
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    display: false,
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    ticks: {
+                        stepSize: 1,
+                    }
+                }
+            }
+        }
+    });
+}
+
+function renderDosenChart(data) {
+    const ctx = document.getElementById('dosenChart').getContext('2d');
+    new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: data.map(item => item.homebase || 'Tidak Ada'),
+            datasets: [{
+                label: 'Jumlah Dosen',
+                data: data.map(item => item.count),
+                backgroundColor: data.map((_, i) => colorArray[i % colorArray.length].bg),
+                borderColor: data.map((_, i) => colorArray[i % colorArray.length].border),
+                borderWidth: 2,
+                borderRadius: 5,
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    display: false,
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    ticks: {
+                        stepSize: 1,
+                    }
+                }
+            }
+        }
+    });
+}
+
+function renderMatakuliahChart(data) {
+    const ctx = document.getElementById('matakuliahChart').getContext('2d');
+    new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: data.map(item => 'Semester ' + item.semester),
+            datasets: [{
+                label: 'Jumlah Mata Kuliah',
+                data: data.map(item => item.count),
+                backgroundColor: data.map((_, i) => colorArray[i % colorArray.length].bg),
+                borderColor: data.map((_, i) => colorArray[i % colorArray.length].border),
+                borderWidth: 2,
+                borderRadius: 5,
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    display: false,
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    ticks: {
+                        stepSize: 1,
+                    }
+                }
+            }
+        }
+    });
+}
+
+// Load charts when page loads
+document.addEventListener('DOMContentLoaded', loadCharts);
@@ -0,0 +1,140 @@
+// Tabel dimuat bertahap: server hanya merender halaman pertama, baris
+// berikutnya diambil dari api/list/ saat tabel di-scroll ke bawah.
+// Klik judul kolom untuk mengurutkan (di server).
+function truncateWords(text, count) {
+    const words = (text || '').split(/\s+/).filter(Boolean);
+    return words.length > count ? words.slice(0, count).join(' ') + ' …' : words.join(' ');
+}
+
+function badge(text, background, color) {
+    const span = document.createElement('span');
+    span.className = 'badge badge-custom';
+    span.style.backgroundColor = background;
+    span.style.color = color;
+    span.textContent = text;
+    return span;
+}
+
+function strong(text) {
+    const el = document.createElement('strong');
+    el.textContent = text;
+    return el;
+}
+
+const ROW_CELLS = {
+    mahasiswa: r => [strong(r.nama), r.npm, r.email, r.no_hp || 'N/A',
+        badge(r.jurusan || 'N/A', '#007bff', 'white'), truncateWords(r.alamat, 10) || 'N/A'],
+    dosen: r => [strong(r.nama), r.nidn, r.email, r.no_hp || 'N/A',
+        badge(r.homebase || 'N/A', '#28a745', 'white'), truncateWords(r.alamat, 10) || 'N/A'],
+    matakuliah: r => [strong(r.nama_mk), r.kode_mk, badge(r.sks, '#ffc107', '#333'),
+        r.semester, r.dosen, r.jumlah_mahasiswa],
+};
+
+document.querySelectorAll('.lazy-table').forEach(container => {
+    const tbody = container.querySelector('tbody');
+    const sentinel = container.querySelector('.lazy-sentinel');
+    const cells = ROW_CELLS[container.dataset.entity];
+    const state = { sort: 'id', cursor: null, loading: false, done: false, request: 0 };
+
+    function appendRows(columns, rows) {
+        rows.forEach(values => {
+            const row = {};
+            columns.forEach((column, i) => { row[column] = values[i]; });
+            const tr = document.createElement('tr');
+            tr.dataset.id = row.id;
+            [tbody.rows.length + 1, ...cells(row)].forEach(value => {
+                const td = document.createElement('td');
+                if (value instanceof Node) td.appendChild(value);
+                else td.textContent = value;
+                tr.appendChild(td);
+            });
+            tbody.appendChild(tr);
+        });
+    }
+
+    function load() {
+        if (state.loading || state.done) return;
+        state.loading = true;
+        // Response dari urutan sebelumnya (sebelum judul kolom diklik) diabaikan
+        const request = ++state.request;
+        const params = new URLSearchParams({ sort: state.sort });
+        if (state.cursor) {
+            params.set('cursor', state.cursor);
+        } else if (tbody.rows.length) {
+            params.set('after', tbody.rows[tbody.rows.length - 1].dataset.id);
+        }
+        fetch(container.dataset.listUrl + '?' + params, { headers: { 'Accept': 'application/json' } })
+            .then(r => r.json())
+            .then(json => {
+                if (request !== state.request) return;
+                if (!json.success) throw new Error(json.error);
+                appendRows(json.columns, json.rows);
+                state.cursor = json.next_cursor;
+                state.done = !json.next_cursor;
+            })
+            .catch(() => { if (request === state.request) state.done = true; })
+            .finally(() => { if (request === state.request) state.loading = false; });
+    }
+
+    container.querySelectorAll('th[data-sort]').forEach(th => {
+        th.addEventListener('click', () => {
+            const field = th.dataset.sort;
+            state.sort = state.sort === field ? '-' + field : field;
+            state.cursor = null;
+            state.done = false;
+            state.loading = false;
+            state.request++;
+            tbody.innerHTML = '';
+            container.querySelectorAll('th[data-sort]').forEach(other => { other.dataset.order = ''; });
+            th.dataset.order = state.sort.startsWith('-') ? '▼' : '▲';
+            load();
+        });
+    });
+
+    new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) load();
+    }, { root: container, rootMargin: '200px' }).observe(sentinel);
+});
+
+// URL dan token dari atribut data-* di <body> (file ini tidak dirender template)
+const exportJobUrl = document.body.dataset.exportJobUrl;
+const csrftoken = document.body.dataset.csrfToken;
+const exportStatus = document.getElementById('export-job-status');
+
+function pollExportJob(job) {
+    if (job.status === 'done') {
+        exportStatus.textContent = '';
+        window.location.href = job.download_url;
+        return;
+    }
+    if (job.status === 'failed') {
+        exportStatus.textContent = 'Export gagal: ' + (job.error || '');
+        return;
+    }
+    exportStatus.textContent = 'Menyiapkan file export...';
+    setTimeout(() => {
+        fetch(job.status_url)
+            .then(r => r.json())
+            .then(json => pollExportJob(json.job));
+    }, 1000);
+}
+
+document.querySelectorAll('[data-export-kind]').forEach(btn => {
+    btn.addEventListener('click', function (e) {
+        e.preventDefault();
+        const body = new FormData();
+        body.append('kind', btn.dataset.exportKind);
+        body.append('format', btn.dataset.exportFormat);
+        fetch(exportJobUrl, { method: 'POST', headers: { 'X-CSRFToken': csrftoken }, body: body })
+            .then(r => r.json())
+            .then(json => {
+                if (!json.success) {
+                    alert(json.error);
+                    return;
+                }
+                pollExportJob(json.job);
+            })
+            // Fallback ke export langsung
+            .catch(() => { window.location.href = btn.href; });
+    });
+});